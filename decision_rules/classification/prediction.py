@@ -1,4 +1,5 @@
 import numpy as np
+from decision_rules.core.prediction import _fit_strings_dtype
 from decision_rules.core.prediction import PredictionStrategy
 
 
@@ -35,5 +36,7 @@ class VotingPredictionStrategy(PredictionStrategy):
         not_covered_examples_mask = np.all(
             np.isclose(prediction_array, 0.0), axis=1
         )
+        prediction = _fit_strings_dtype(
+            prediction, self.default_conclusion.value)
         prediction[not_covered_examples_mask] = self.default_conclusion.value
         return prediction
@@ -1,17 +1,14 @@
+from __future__ import annotations
+
 import math
 import warnings
 from typing import Any
 from typing import TypedDict
 
 import numpy as np
-from imblearn.metrics import geometric_mean_score
-from sklearn.metrics import accuracy_score
-from sklearn.metrics import balanced_accuracy_score
-from sklearn.metrics import cohen_kappa_score
-from sklearn.metrics import confusion_matrix
-from sklearn.metrics import f1_score
-from sklearn.metrics import recall_score
 
+from decision_rules.core.prediction_indicators import \
+    AbstractPredictionIndicatorsAccumulator
 from decision_rules.problem import ProblemTypes
 
 
@@ -65,6 +62,135 @@ def _drop_uncovered_examples(y_true: np.ndarray, y_pred: np.ndarray) -> tuple[np
     return y_true[covered_examples_mask], y_pred[covered_examples_mask]
 
 
+def _calculate_confusion_matrix(
+    y_true: np.ndarray,
+    y_pred: np.ndarray
+) -> tuple[list[Any], np.ndarray]:
+    """Calculates confusion matrix in a single pass using integer encoded
+    labels.
+
+    Args:
+        y_true (np.ndarray): Array containing the actual class labels.
+        y_pred (np.ndarray): Array containing the predicted class labels.
+
+    Returns:
+        tuple[list[Any], np.ndarray]: Sorted list of all labels present in
+        either of the arrays and the confusion matrix with rows corresponding
+        to the actual and columns to the predicted labels.
+    """
+    y_true = np.asarray(y_true)
+    classes, encoded_labels = np.unique(
+        np.concatenate((y_true, np.asarray(y_pred))), return_inverse=True
+    )
+    encoded_labels = encoded_labels.reshape(-1)
+    classes_count: int = len(classes)
+    y_true_encoded: np.ndarray = encoded_labels[:len(y_true)]
+    y_pred_encoded: np.ndarray = encoded_labels[len(y_true):]
+    c_matrix: np.ndarray = np.bincount(
+        y_true_encoded * classes_count + y_pred_encoded,
+        minlength=classes_count * classes_count
+    ).reshape(classes_count, classes_count)
+    return classes.tolist(), c_matrix
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    mask: np.ndarray = denominator == 0
+    return np.where(mask, 0.0, numerator / np.where(mask, 1.0, denominator))
+
+
+def _average(values: np.ndarray, weights: np.ndarray = None) -> float:
+    if weights is not None and np.sum(weights) == 0:
+        return np.average(values)
+    return np.average(values, weights=weights)
+
+
+def _calculate_balanced_accuracy(c_matrix: np.ndarray) -> float:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_class: np.ndarray = np.diag(c_matrix) / c_matrix.sum(axis=1)
+    if np.any(np.isnan(per_class)):
+        warnings.warn(
+            message=(
+                "From sklearn.metrics: 'y_pred contains classes not in y_true'. "
+                "This behavior could potentially result from the default "
+                "conclusion being turned off during prediction."
+            ),
+            category=UserWarning,
+        )
+        per_class = per_class[~np.isnan(per_class)]
+    return float(np.mean(per_class))
+
+
+def _calculate_cohen_kappa(c_matrix: np.ndarray) -> float:
+    c_matrix = c_matrix.astype(float)
+    sum0: np.ndarray = np.sum(c_matrix, axis=0)
+    sum1: np.ndarray = np.sum(c_matrix, axis=1)
+    expected: np.ndarray = np.outer(sum0, sum1) / np.sum(sum0)
+    weights: np.ndarray = np.ones_like(c_matrix)
+    weights.flat[::len(c_matrix) + 1] = 0
+    observed_disagreement: float = np.sum(weights * c_matrix)
+    expected_disagreement: float = np.sum(weights * expected)
+    if expected_disagreement == 0:
+        return np.nan
+    return float(1 - observed_disagreement / expected_disagreement)
+
+
+def _calculate_f1_scores(
+    tp_sum: np.ndarray,
+    pred_sum: np.ndarray,
+    true_sum: np.ndarray,
+) -> tuple[float, float, float]:
+    f1: np.ndarray = _safe_divide(2.0 * tp_sum, true_sum + pred_sum)
+    f1_micro: float = float(_safe_divide(
+        2.0 * tp_sum.sum(), true_sum.sum() + pred_sum.sum()
+    ))
+    return (
+        f1_micro,
+        float(_average(f1)),
+        float(_average(f1, weights=true_sum))
+    )
+
+
+def _calculate_recalls(
+    tp_sum: np.ndarray,
+    true_sum: np.ndarray,
+) -> tuple[float, float, float]:
+    recall: np.ndarray = _safe_divide(tp_sum, true_sum)
+    recall_micro: float = float(_safe_divide(tp_sum.sum(), true_sum.sum()))
+    return (
+        recall_micro,
+        float(_average(recall)),
+        float(_average(recall, weights=true_sum))
+    )
+
+
+def _calculate_geometric_means(
+    tp_sum: np.ndarray,
+    pred_sum: np.ndarray,
+    true_sum: np.ndarray,
+    tn_sum: np.ndarray,
+) -> tuple[float, float, float]:
+    sensitivity: np.ndarray = _safe_divide(tp_sum, true_sum)
+    specificity: np.ndarray = _safe_divide(tn_sum, tn_sum + pred_sum - tp_sum)
+    sensitivity_micro: float = _safe_divide(tp_sum.sum(), true_sum.sum())
+    specificity_micro: float = _safe_divide(
+        tn_sum.sum(), tn_sum.sum() + pred_sum.sum() - tp_sum.sum()
+    )
+    G_mean_micro: float = np.sqrt(sensitivity_micro * specificity_micro)
+    G_mean_macro: float = np.sqrt(
+        np.average(sensitivity) * np.average(specificity)
+    )
+    if true_sum.sum() == 0:
+        G_mean_weighted: float = np.float64(0.0)
+    else:
+        G_mean_weighted: float = np.sqrt(
+            np.average(sensitivity, weights=true_sum) *
+            np.average(specificity, weights=true_sum)
+        )
+    return G_mean_micro, G_mean_macro, G_mean_weighted
+
+
 def calculate_for_classification(
     y_true: list[Any],
     y_pred: list[Any],
@@ -87,47 +213,35 @@ def calculate_for_classification(
     all_examples = len(y_true)
     if calculate_only_for_covered_examples:
         y_true, y_pred = _drop_uncovered_examples(y_true, y_pred)
-    covered_by_prediction = len(y_true)
-    not_covered_by_prediction = all_examples - covered_by_prediction
+    classes, c_matrix = _calculate_confusion_matrix(y_true, y_pred)
+    return _calculate_from_confusion_matrix(
+        classes, c_matrix,
+        not_covered_by_prediction=all_examples - len(y_true)
+    )
 
-    with warnings.catch_warnings(record=True) as caught_warnings:
-        warnings.filterwarnings(
-            action="always",
-            category=UserWarning,
-            message=r"y_pred contains classes not in y_true",
-            module="sklearn.metrics"
-        )
-        balanced_accuracy: float = balanced_accuracy_score(
-            y_true=y_true, y_pred=y_pred)
-        accuracy: float = accuracy_score(
-            y_true=y_true, y_pred=y_pred)
-        kappa: float = cohen_kappa_score(y_true, y_pred)
-        F1_macro: float = f1_score(y_true, y_pred, average='macro')
-        F1_micro: float = f1_score(y_true, y_pred, average='micro')
-        F1_weighted: float = f1_score(y_true, y_pred, average='weighted')
-        G_mean_macro: float = geometric_mean_score(
-            y_true, y_pred, average='macro')
-        G_mean_micro: float = geometric_mean_score(
-            y_true, y_pred, average='micro')
-        G_mean_weighted: float = geometric_mean_score(
-            y_true, y_pred, average='weighted')
-        Recall_macro: float = recall_score(
-            y_true, y_pred, average='macro', zero_division=0.0)
-        Recall_micro: float = recall_score(
-            y_true, y_pred, average='micro', zero_division=0.0)
-        Recall_weighted: float = recall_score(
-            y_true, y_pred, average='weighted', zero_division=0.0)
-        c_matrix: np.ndarray = confusion_matrix(y_true, y_pred)
-
-    for warning in caught_warnings:
-        # modify msg to include the reason for the warning
-        warnings.warn(
-            message=(
-                f"From sklearn.metrics: '{warning.message}'. This behavior could potentially "
-                "result from the default conclusion being turned off during prediction."
-            ),
-            category=warning.category,
-        )
+
+def _calculate_from_confusion_matrix(
+    classes: list[Any],
+    c_matrix: np.ndarray,
+    not_covered_by_prediction: int
+) -> ClassificationPredictionIndicators:
+    covered_by_prediction = int(c_matrix.sum())
+
+    tp_sum: np.ndarray = np.diag(c_matrix)
+    pred_sum: np.ndarray = c_matrix.sum(axis=0)
+    true_sum: np.ndarray = c_matrix.sum(axis=1)
+    tn_sum: np.ndarray = covered_by_prediction - \
+        (pred_sum + true_sum - tp_sum)
+
+    balanced_accuracy: float = _calculate_balanced_accuracy(c_matrix)
+    accuracy: float = float(tp_sum.sum() / covered_by_prediction)
+    kappa: float = _calculate_cohen_kappa(c_matrix)
+    F1_micro, F1_macro, F1_weighted = _calculate_f1_scores(
+        tp_sum, pred_sum, true_sum)
+    G_mean_micro, G_mean_macro, G_mean_weighted = _calculate_geometric_means(
+        tp_sum, pred_sum, true_sum, tn_sum)
+    Recall_micro, Recall_macro, Recall_weighted = _calculate_recalls(
+        tp_sum, true_sum)
 
     TN: int = c_matrix[0, 0]
     if c_matrix.shape[1] == 1:
@@ -137,7 +251,6 @@ def calculate_for_classification(
 
     specificity: float = TN / (TN + FP) if (TN + FP) != 0 else 0
 
-    classes: list[Any] = np.unique(np.concatenate((y_true, y_pred))).tolist()
     general_confusion_matrix_dict: dict[str, Any] = {
         "classes": classes
     }
@@ -146,9 +259,13 @@ def calculate_for_classification(
         ClassificationPredictionIndicatorsForClass
     ] = {}
     for i, cls in enumerate(classes):
-        class_data = calculate_class_indicators_classification(
-            cls, y_true, y_pred)
-        class_indicators[cls] = class_data
+        class_indicators[cls] = _calculate_class_indicators_from_counts(
+            cls,
+            TP=int(tp_sum[i]),
+            FN=int(true_sum[i] - tp_sum[i]),
+            FP=int(pred_sum[i] - tp_sum[i]),
+            TN=int(tn_sum[i]),
+        )
         general_confusion_matrix_dict[cls] = c_matrix[i, :].tolist()
 
     return ClassificationPredictionIndicators(
@@ -171,14 +288,94 @@ def calculate_for_classification(
             Covered_by_prediction=covered_by_prediction,
             Not_covered_by_prediction=not_covered_by_prediction,
         ),
-        for_classes={
-            cls: {key: value if isinstance(
-                value, (float)) else value for key, value in class_data.items()}
-            for cls, class_data in class_indicators.items()
-        }
+        for_classes=class_indicators
     )
 
 
+class ClassificationPredictionIndicatorsAccumulator(AbstractPredictionIndicatorsAccumulator):
+    """Mergeable accumulator of classification predictions. It stores only the
+    confusion matrix of ingested predictions, so its memory usage does not
+    depend on the number of examples.
+
+    Args:
+        calculate_only_for_covered_examples (bool, optional): If true, it will
+            calculate indicators only for the examples where prediction was not
+            empty. Otherwise, it will calculate indicators for all the examples.
+            Defaults to False.
+    """
+
+    def __init__(self, calculate_only_for_covered_examples: bool = False) -> None:
+        super().__init__(calculate_only_for_covered_examples)
+        self.classes: np.ndarray = np.array([])
+        self.confusion_matrix: np.ndarray = np.zeros((0, 0), dtype=int)
+
+    def update(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray
+    ) -> ClassificationPredictionIndicatorsAccumulator:
+        """Ingests chunk of predictions.
+
+        Args:
+            y_true (np.ndarray): Array containing the actual class labels.
+            y_pred (np.ndarray): Array containing the predicted class labels.
+
+        Returns:
+            ClassificationPredictionIndicatorsAccumulator: self
+        """
+        y_true, y_pred = np.asarray(y_true), np.asarray(y_pred)
+        self.all_examples_count += len(y_true)
+        if self.calculate_only_for_covered_examples:
+            y_true, y_pred = _drop_uncovered_examples(y_true, y_pred)
+        self.covered_by_prediction += len(y_true)
+        if len(y_true) > 0:
+            classes, c_matrix = _calculate_confusion_matrix(y_true, y_pred)
+            self._add_confusion_matrix(np.array(classes), c_matrix)
+        return self
+
+    def _merge(self, other: ClassificationPredictionIndicatorsAccumulator):
+        self._add_confusion_matrix(other.classes, other.confusion_matrix)
+
+    def _add_confusion_matrix(self, classes: np.ndarray, c_matrix: np.ndarray):
+        if len(classes) == 0:
+            return
+        if len(self.classes) == 0:
+            self.classes = classes
+            self.confusion_matrix = c_matrix.copy()
+            return
+        all_classes: np.ndarray = np.unique(
+            np.concatenate((self.classes, classes)))
+        merged_matrix: np.ndarray = np.zeros(
+            (len(all_classes), len(all_classes)), dtype=int)
+        for matrix_classes, matrix in (
+            (self.classes, self.confusion_matrix),
+            (classes, c_matrix),
+        ):
+            indices: np.ndarray = np.searchsorted(all_classes, matrix_classes)
+            merged_matrix[np.ix_(indices, indices)] += matrix
+        self.classes = all_classes
+        self.confusion_matrix = merged_matrix
+
+    def finalize(self) -> ClassificationPredictionIndicators:
+        """Calculates prediction indicators from accumulated confusion matrix.
+
+        Raises:
+            ValueError: If no covered examples were ingested
+
+        Returns:
+            ClassificationPredictionIndicators: A dictionary containing various
+            prediction indicators, including indicators for individual classes.
+        """
+        if self.covered_by_prediction == 0:
+            raise ValueError(
+                'Cannot calculate prediction indicators without any examples')
+        return _calculate_from_confusion_matrix(
+            self.classes.tolist(),
+            self.confusion_matrix,
+            not_covered_by_prediction=self.not_covered_by_prediction
+        )
+
+
 def calculate_class_indicators_classification(
         cls: Any,
         y_true: list[Any],
@@ -195,14 +392,27 @@ def calculate_class_indicators_classification(
         ClassificationPredictionIndicatorsForClass: A dictionary representing
         the calculated prediction indicators for the class.
     """
-    TP: int = int(np.count_nonzero(
-        np.logical_and(y_true == cls, y_pred == cls)))
-    FN: int = int(np.count_nonzero(
-        np.logical_and(y_true == cls, y_pred != cls)))
-    FP: int = int(np.count_nonzero(
-        np.logical_and(y_true != cls, y_pred == cls)))
-    TN: int = int(np.count_nonzero(
-        np.logical_and(y_true != cls, y_pred != cls)))
+    actual_mask: np.ndarray = np.asarray(y_true) == cls
+    predicted_mask: np.ndarray = np.asarray(y_pred) == cls
+    TP: int = int(np.count_nonzero(actual_mask & predicted_mask))
+    actual_count: int = int(np.count_nonzero(actual_mask))
+    predicted_count: int = int(np.count_nonzero(predicted_mask))
+    return _calculate_class_indicators_from_counts(
+        cls,
+        TP=TP,
+        FN=actual_count - TP,
+        FP=predicted_count - TP,
+        TN=len(actual_mask) - actual_count - predicted_count + TP,
+    )
+
+
+def _calculate_class_indicators_from_counts(
+    cls: Any,
+    TP: int,
+    FN: int,
+    FP: int,
+    TN: int
+) -> ClassificationPredictionIndicatorsForClass:
     Precision: float = TP / (TP + FP) if (TP + FP) != 0 else 0
     Recall: float = TP / (TP + FN) if (TP + FN) != 0 else 0
     Specificity: float = TN / (TN + FP) if (TN + FP) != 0 else 0
@@ -4,6 +4,7 @@ Contains classification ruleset class.
 from __future__ import annotations
 
 from typing import Callable
+from typing import Optional
 from typing import Type
 
 import numpy as np
@@ -14,10 +15,12 @@ from decision_rules.classification.rule import ClassificationConclusion
 from decision_rules.classification.rule import ClassificationRule
 from decision_rules.core.coverage import ClassificationCoverageInfodict
 from decision_rules.core.coverage import Coverage
+from decision_rules.core.coverage import CoverageTable
 from decision_rules.core.metrics import AbstractRulesMetrics
 from decision_rules.core.prediction import BestRulePredictionStrategy
 from decision_rules.core.prediction import PredictionStrategy
 from decision_rules.core.ruleset import AbstractRuleSet
+from decision_rules.helpers.p_values import fisher_exact_p_values
 from decision_rules.importances._classification.attributes import \
     ClassificationRuleSetAttributeImportances
 from decision_rules.importances._classification.conditions import \
@@ -91,10 +94,11 @@ class ClassificationRuleSet(AbstractRuleSet):
             self,
             X: pd.DataFrame,  # pylint: disable=invalid-name
             y: pd.Series,  # pylint: disable=invalid-name
-            measure: Callable[[Coverage], float]
+            measure: Callable[[Coverage], float],
+            n_jobs: Optional[int] = 1,
     ) -> dict[str, dict[str, float]]:
         condtion_importances_generator = ClassificationRuleSetConditionImportances(
-            self)
+            self, n_jobs)
         self.condition_importances = condtion_importances_generator.calculate_importances(
             X.to_numpy(), y.to_numpy(), measure)
         return self.condition_importances
@@ -106,11 +110,8 @@ class ClassificationRuleSet(AbstractRuleSet):
         return self.attribute_importances
 
     def calculate_p_values(self, *args) -> list:
-        metrics: AbstractRulesMetrics = self.get_metrics_object_instance()
-        p_values = []
-        for rule in self.rules:
-            p_values.append(metrics.calculate_p_value(coverage=rule.coverage))
-        return p_values
+        table: CoverageTable = self._get_calculated_coverage_table()
+        return fisher_exact_p_values(table.p, table.n, table.P, table.N).tolist()
 
     @property
     def prediction_strategies_choice(self) -> dict[str, Type[PredictionStrategy]]:
@@ -4,6 +4,12 @@ Contains logical conditions classes.
 from __future__ import annotations
 
 from enum import Enum
+from operator import eq
+from operator import ge
+from operator import gt
+from operator import le
+from operator import lt
+from operator import ne
 from typing import Any
 from typing import Callable
 from typing import Union
@@ -218,17 +224,17 @@ class AttributesRelationCondition(AbstractCondition):
                 f"{', '.join([e.value for e in AttributesRelationCondition.Relation])}"
             ) from error
         if operator == AttributesRelationCondition.Relation.EQUAL:
-            self._operator_func = lambda A, B: A == B
+            self._operator_func = eq
         elif operator == AttributesRelationCondition.Relation.NOT_EQUAL:
-            self._operator_func = lambda A, B: A != B
+            self._operator_func = ne
         elif operator == AttributesRelationCondition.Relation.GREATER:
-            self._operator_func = lambda A, B: A > B
+            self._operator_func = gt
         elif operator == AttributesRelationCondition.Relation.GREATER_EQUAL:
-            self._operator_func = lambda A, B: A >= B
+            self._operator_func = ge
         elif operator == AttributesRelationCondition.Relation.LOWER:
-            self._operator_func = lambda A, B: A < B
+            self._operator_func = lt
         elif operator == AttributesRelationCondition.Relation.LOWER_EQUAL:
-            self._operator_func = lambda A, B: A <= B
+            self._operator_func = le
 
     @property
     def attributes(self) -> frozenset[int]:
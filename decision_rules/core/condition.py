@@ -3,10 +3,10 @@ Contains base abstract condition class
 """
 from __future__ import annotations
 
+import copy
 from abc import ABC
 from abc import abstractmethod
 from contextlib import contextmanager
-from copy import deepcopy
 
 import numpy as np
 import pandas as pd
@@ -66,6 +66,25 @@ class AbstractCondition(ABC):
         for subcondition in self.subconditions:
             subcondition.invalidate_cache()
 
+    def clone(self) -> AbstractCondition:
+        """Creates an independent copy of the condition. Unlike `copy.deepcopy`
+        only the condition tree structure is copied (subconditions are cloned
+        recursively), attributes values are shared with the original condition
+        as they are never modified in place. Cached masks are not copied and
+        the clone has its cache disabled.
+
+        Returns:
+            AbstractCondition: condition copy
+        """
+        condition: AbstractCondition = copy.copy(self)
+        condition.subconditions = [
+            subcondition.clone() for subcondition in self.subconditions
+        ]
+        condition.cached = False
+        condition.__cached_covered_mask = None
+        condition.__cached_uncovered_mask = None
+        return condition
+
     @property
     @abstractmethod
     def attributes(self) -> frozenset[int]:
@@ -164,7 +183,7 @@ class AbstractCondition(ABC):
         from decision_rules.conditions import CompoundCondition
 
         if not isinstance(self, CompoundCondition):
-            return None if self == condition_to_remove else deepcopy(self)
+            return None if self == condition_to_remove else self.clone()
 
         new_subconditions = []
         for sub in self.subconditions:
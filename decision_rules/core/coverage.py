@@ -2,7 +2,11 @@
 Contains rule coverage class
 """
 
+from typing import Optional
 from typing import TypedDict
+from typing import Union
+
+import numpy as np
 
 
 class InvalidCoverageError(ValueError):
@@ -53,6 +57,160 @@ class Coverage:
         return f"(p={self.p}, n={self.n}, P={self.P}, N={self.N})"
 
 
+class CoverageView(Coverage):
+    """Coverage of a single rule stored in a `CoverageTable`. It behaves like
+    a regular `Coverage` object, but reads and writes its values directly from
+    and to the table arrays. Copying or pickling a view gives regular detached
+    `Coverage` object.
+    """
+
+    def __init__(self, table: "CoverageTable", index: int):  # pylint: disable=super-init-not-called
+        self._table: CoverageTable = table
+        self._index: int = index
+
+    def _get(self, name: str) -> Optional[int]:
+        value = int(getattr(self._table, name)[self._index])
+        return None if value == CoverageTable.MISSING_VALUE else value
+
+    def _set(self, name: str, value: Optional[int]):
+        getattr(self._table, name)[self._index] = (
+            CoverageTable.MISSING_VALUE if value is None else int(value)
+        )
+
+    p = property(lambda self: self._get('p'),
+                 lambda self, value: self._set('p', value))
+    n = property(lambda self: self._get('n'),
+                 lambda self, value: self._set('n', value))
+    P = property(lambda self: self._get('P'),
+                 lambda self, value: self._set('P', value))
+    N = property(lambda self: self._get('N'),
+                 lambda self, value: self._set('N', value))
+
+    def detach(self) -> Coverage:
+        """
+        Returns:
+            Coverage: regular coverage object with the same values
+        """
+        return Coverage(*self.as_tuple())
+
+    def __copy__(self) -> Coverage:
+        return self.detach()
+
+    def __deepcopy__(self, memo: dict) -> Coverage:
+        return self.detach()
+
+    def __reduce__(self):
+        return (Coverage, self.as_tuple())
+
+
+class CoverageTable:
+    """Coverages of all rules in a ruleset stored as contiguous numpy arrays
+    (struct-of-arrays) instead of separate `Coverage` objects. Rules' coverages can
+    be views into the table (see `CoverageView`), which allows ruleset-wide
+    computations (e.g. voting weights using vectorized quality measures) to
+    work directly on the arrays.
+
+    Missing values (None) are stored as `CoverageTable.MISSING_VALUE`.
+
+    Attributes:
+        p (np.ndarray): Positive covered examples.
+        n (np.ndarray): Negative covered examples.
+        P (np.ndarray): All positive examples.
+        N (np.ndarray): All negative examples.
+        extras (dict[str, np.ndarray]): Additional per-rule values specific
+            for the ruleset type, e.g. covered examples statistics for regression
+            or log-rank statistic for survival rulesets.
+    """
+
+    MISSING_VALUE: int = -1
+
+    p: np.ndarray
+    n: np.ndarray
+    P: np.ndarray
+    N: np.ndarray
+
+    def __init__(
+        self,
+        p: Union[np.ndarray, list[int]],
+        n: Union[np.ndarray, list[int]],
+        P: Union[np.ndarray, list[int]],
+        N: Union[np.ndarray, list[int]],
+        extras: Optional[dict[str, np.ndarray]] = None
+    ):
+        self.p = np.array(p, dtype=np.int64)
+        self.n = np.array(n, dtype=np.int64)
+        self.P = np.array(P, dtype=np.int64)
+        self.N = np.array(N, dtype=np.int64)
+        if not self.p.shape == self.n.shape == self.P.shape == self.N.shape:
+            raise ValueError(
+                'Arrays "p", "n", "P" and "N" should have the same shape')
+        self.extras: dict[str,
+                          np.ndarray] = extras if extras is not None else {}
+        self._validate()
+
+    @staticmethod
+    def from_coverages(
+        coverages: list[Coverage],
+        extras: Optional[dict[str, np.ndarray]] = None
+    ) -> "CoverageTable":
+        """Creates coverage table from the list of coverages
+
+        Args:
+            coverages (list[Coverage]): coverages
+            extras (Optional[dict[str, np.ndarray]], optional): Additional
+                per-rule values. Defaults to None.
+
+        Returns:
+            CoverageTable: coverage table
+        """
+        values: np.ndarray = np.array(
+            [
+                [
+                    CoverageTable.MISSING_VALUE if value is None else value
+                    for value in coverage.as_tuple()
+                ]
+                for coverage in coverages
+            ],
+            dtype=np.int64
+        ).reshape(len(coverages), 4)
+        return CoverageTable(*values.T, extras=extras)
+
+    def _validate(self):
+        with_values_mask: np.ndarray = (
+            (self.p != self.MISSING_VALUE) & (self.n != self.MISSING_VALUE) &
+            (self.P != self.MISSING_VALUE) & (self.N != self.MISSING_VALUE)
+        )
+        if np.any((self.p > self.P) & with_values_mask):
+            raise InvalidCoverageError("Invalid coverage: p is greater than P")
+        if np.any((self.n > self.N) & with_values_mask):
+            raise InvalidCoverageError("Invalid coverage: n is greater than N")
+
+    def as_array(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: array of shape (rules_count, 4) with p, n, P, N columns
+        """
+        return np.stack([self.p, self.n, self.P, self.N], axis=1)
+
+    def __len__(self) -> int:
+        return self.p.shape[0]
+
+    def __getitem__(self, index: int) -> CoverageView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Coverage table index out of range')
+        return CoverageView(self, index)
+
+    def __iter__(self):
+        return (CoverageView(self, i) for i in range(len(self)))
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, CoverageTable):
+            return False
+        return np.array_equal(self.as_array(), value.as_array())
+
+
 class ClassificationCoverageInfodict(TypedDict):
     p: int
     n: int
@@ -15,6 +15,146 @@ from decision_rules.core.coverage import Coverage
 from decision_rules.core.rule import AbstractRule
 
 
+class RulesMetricsContext:
+    """Data shared by all metrics calculators during a single
+    `AbstractRulesMetrics.calculate` call. It holds rules coverage matrix,
+    per-rule positive and negative covered masks, per-example coverage counts and
+    labels of examples covered by each rule. Everything is calculated at most
+    once for the whole ruleset instead of once per rule and metric.
+
+    Args:
+        rules (list[AbstractRule]): rules
+        X (pd.DataFrame): data
+        y (pd.Series): labels
+        coverage_matrix (Optional[np.ndarray], optional): rules coverage matrix,
+            same as returned by `AbstractRuleSet.calculate_rules_coverages`. If not
+            passed it will be calculated from rules premises. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        rules: list[AbstractRule],
+        X: pd.DataFrame,  # pylint: disable=invalid-name
+        y: pd.Series,  # pylint: disable=invalid-name
+        coverage_matrix: Optional[np.ndarray] = None
+    ) -> None:
+        self.rules: list[AbstractRule] = rules
+        self.y: pd.Series = y
+        if coverage_matrix is None:
+            coverage_matrix = np.empty(
+                shape=(y.shape[0], len(rules)), dtype=bool)
+            for i, rule in enumerate(rules):
+                coverage_matrix[:, i] = rule.premise.covered_mask(X)
+        elif coverage_matrix.shape != (y.shape[0], len(rules)):
+            raise ValueError(
+                f'Coverage matrix should have shape {(y.shape[0], len(rules))}, '
+                f'got {coverage_matrix.shape}'
+            )
+        self.coverage_matrix: np.ndarray = coverage_matrix
+
+        self._rules_indices: dict[int, int] = {
+            id(rule): i for i, rule in enumerate(rules)
+        }
+        self._positive_covered_matrix: Optional[np.ndarray] = None
+        self._negative_covered_matrix: Optional[np.ndarray] = None
+        self._covered_counts: dict[str, np.ndarray] = {}
+        self._covered_y: dict[int, Any] = {}
+
+    def __contains__(self, rule: AbstractRule) -> bool:
+        return id(rule) in self._rules_indices
+
+    @property
+    def positive_covered_matrix(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: matrix of the same shape as coverage matrix specifying
+                whether given example is positive and covered by a rule
+        """
+        if self._positive_covered_matrix is None:
+            self._positive_covered_matrix = self._calculate_covered_matrix(
+                lambda rule: rule.conclusion.positives_mask(self.y)
+            )
+        return self._positive_covered_matrix
+
+    @property
+    def negative_covered_matrix(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: matrix of the same shape as coverage matrix specifying
+                whether given example is negative and covered by a rule
+        """
+        if self._negative_covered_matrix is None:
+            self._negative_covered_matrix = self._calculate_covered_matrix(
+                lambda rule: rule.conclusion.negatives_mask(self.y)
+            )
+        return self._negative_covered_matrix
+
+    def _calculate_covered_matrix(
+        self,
+        get_conclusion_mask: Callable[[AbstractRule], np.ndarray]
+    ) -> np.ndarray:
+        covered_matrix: np.ndarray = np.empty(
+            shape=self.coverage_matrix.shape, dtype=bool)
+        for i, rule in enumerate(self.rules):
+            covered_matrix[:, i] = (
+                np.asarray(get_conclusion_mask(rule), dtype=bool) &
+                self.coverage_matrix[:, i]
+            )
+        return covered_matrix
+
+    def _get_matrix(self, covered_type: str) -> np.ndarray:
+        if covered_type == 'positive':
+            return self.positive_covered_matrix
+        if covered_type == 'negative':
+            return self.negative_covered_matrix
+        if covered_type == 'all':
+            return self.coverage_matrix
+        raise ValueError(
+            '"covered_type" parameter should be either "positive", "negative" or "all"')
+
+    def covered_mask(self, rule: AbstractRule, covered_type: str = 'all') -> np.ndarray:
+        """
+        Args:
+            rule (AbstractRule): rule
+            covered_type (str, optional): Either 'all', 'positive' or 'negative'.
+                Defaults to 'all'.
+
+        Returns:
+            np.ndarray: covered examples mask of the given rule
+        """
+        return self._get_matrix(covered_type)[:, self._rules_indices[id(rule)]]
+
+    def covered_counts(self, covered_type: str = 'all') -> np.ndarray:
+        """
+        Args:
+            covered_type (str, optional): Either 'all', 'positive' or 'negative'.
+                Defaults to 'all'.
+
+        Returns:
+            np.ndarray: number of rules covering each example
+        """
+        if covered_type not in self._covered_counts:
+            self._covered_counts[covered_type] = np.count_nonzero(
+                self._get_matrix(covered_type), axis=1
+            )
+        return self._covered_counts[covered_type]
+
+    def covered_y(self, rule: AbstractRule) -> Any:
+        """
+        Args:
+            rule (AbstractRule): rule
+
+        Returns:
+            Any: labels of the examples covered by the rule
+        """
+        rule_index: int = self._rules_indices[id(rule)]
+        if rule_index not in self._covered_y:
+            self._covered_y[rule_index] = self.y[
+                self.coverage_matrix[:, rule_index]
+            ]
+        return self._covered_y[rule_index]
+
+
 class AbstractRulesMetrics(ABC):
     """Abstract class for rules metrics calculations. All classes calculating
     metrics for different types of rulesets should inherit this class.
@@ -26,6 +166,7 @@ class AbstractRulesMetrics(ABC):
     def __init__(self, rules: list[AbstractRule]) -> None:
         super().__init__()
         self.rules: list[AbstractRule] = rules
+        self._context: Optional[RulesMetricsContext] = None
 
     @abstractmethod
     def get_metrics_calculator(
@@ -77,6 +218,90 @@ class AbstractRulesMetrics(ABC):
             list[str]: list of names of all supported metrics
         """
 
+    def _get_covered_mask(
+        self,
+        rule: AbstractRule,
+        X: pd.DataFrame,  # pylint: disable=invalid-name
+        y: pd.Series,  # pylint: disable=invalid-name
+        covered_type: str = 'all'
+    ) -> np.ndarray:
+        """Returns covered examples mask of the given rule. During `calculate` call
+        it is read from the shared metrics context.
+
+        Args:
+            rule (AbstractRule): rule
+            X (pd.DataFrame):
+            y (pd.Series):
+            covered_type (str, optional): Either 'all', 'positive' or 'negative'.
+                Defaults to 'all'.
+
+        Raises:
+            ValueError: when covered_type is not 'all', 'positive' or 'negative'
+
+        Returns:
+            np.ndarray: covered examples mask
+        """
+        if self._context is not None and rule in self._context:
+            return self._context.covered_mask(rule, covered_type)
+        if covered_type == 'positive':
+            return rule.positive_covered_mask(X, y)
+        if covered_type == 'negative':
+            return rule.negative_covered_mask(X, y)
+        if covered_type == 'all':
+            return rule.premise.covered_mask(X)
+        raise ValueError(
+            '"covered_type" parameter should be either "positive", "negative" or "all"')
+
+    def _get_covered_y(
+        self,
+        rule: AbstractRule,
+        X: pd.DataFrame,  # pylint: disable=invalid-name
+        y: pd.Series,  # pylint: disable=invalid-name
+    ) -> Any:
+        """Returns labels of the examples covered by the given rule.
+
+        Args:
+            rule (AbstractRule): rule
+            X (pd.DataFrame):
+            y (pd.Series):
+
+        Returns:
+            Any: labels of the covered examples
+        """
+        if self._context is not None and rule in self._context:
+            return self._context.covered_y(rule)
+        return y[rule.premise.covered_mask(X)]
+
+    def _calculate_covered_counts(
+        self,
+        X: pd.DataFrame,  # pylint: disable=invalid-name
+        y: pd.Series,  # pylint: disable=invalid-name
+        covered_type: str
+    ) -> np.ndarray:
+        """Calculates for each example the number of rules covering it. Depending on
+        covered_type param it counts all covering rules ('all'), only rules for which
+        the example is positive ('positive') or negative ('negative'). During
+        `calculate` call counts are read from the shared metrics context.
+
+        Args:
+            X (pd.DataFrame):
+            y (pd.Series):
+            covered_type (str): Either 'all', 'positive' or 'negative'
+
+        Raises:
+            ValueError: when covered_type is not 'all', 'positive' or 'negative'
+
+        Returns:
+            np.ndarray: number of rules covering each example
+        """
+        if self._context is not None:
+            return self._context.covered_counts(covered_type)
+
+        covered_counts: np.ndarray = np.zeros(shape=(y.shape[0],), dtype=int)
+        for rule in self.rules:
+            covered_counts += self._get_covered_mask(rule, X, y, covered_type)
+        return covered_counts
+
     def _calculate_uniquely_covered_examples_in_pos_and_neg(
         self,
         rule: AbstractRule,
@@ -101,35 +326,15 @@ class AbstractRulesMetrics(ABC):
         Returns:
             int: Number of uniquely covered examples
         """
-        other_rules: list[AbstractRule] = [
-            other_rule for other_rule in self.rules if other_rule.uuid != rule.uuid
-        ]
-        if covered_type == 'positive':
-            rules_covered_masks: dict[str, np.ndarray] = {
-                other_rule.uuid: other_rule.positive_covered_mask(X, y)
-                for other_rule in other_rules
-            }
-        elif covered_type == 'negative':
-            rules_covered_masks: dict[str, np.ndarray] = {
-                other_rule.uuid: other_rule.negative_covered_mask(X, y)
-                for other_rule in other_rules
-            }
-        else:
+        if covered_type not in ('positive', 'negative'):
             raise ValueError(
                 '"covered_type" parameter should be either "positive" or "negative"')
+        current_rule_mask = self._get_covered_mask(rule, X, y, covered_type)
 
-        if rules_covered_masks:
-            others_rules_covered_mask = np.logical_or.reduce(
-                list(rules_covered_masks.values()))
-        else:
-            others_rules_covered_mask = np.zeros(shape=y.shape, dtype=bool)
-
-        if covered_type == 'positive':
-            current_rule_mask = rule.positive_covered_mask(X, y)
-        else:
-            current_rule_mask = rule.negative_covered_mask(X, y)
-
-        unique_mask = current_rule_mask & ~others_rules_covered_mask
+        # examples covered by the current rule are counted in the vector, so they are
+        # unique when no other rule covers them in the same way
+        covered_counts = self._calculate_covered_counts(X, y, covered_type)
+        unique_mask = current_rule_mask & (covered_counts == 1)
 
         return int(np.count_nonzero(unique_mask))
 
@@ -153,35 +358,12 @@ class AbstractRulesMetrics(ABC):
         Returns:
             int: Number of uniquely covered examples of the specified type.
         """
-        other_rules: list[AbstractRule] = [
-            other_rule for other_rule in self.rules if other_rule.uuid != rule.uuid
-        ]
-
-        # Other rules' total coverage masks
-        rules_covered_masks = [
-            other_rule.premise.covered_mask(X)
-            for other_rule in other_rules
-        ]
-
-        if rules_covered_masks:
-            others_rules_covered_mask = np.logical_or.reduce(
-                rules_covered_masks)
-        else:
-            others_rules_covered_mask = np.zeros(shape=y.shape, dtype=bool)
-
         # Current rule's positive or negative or all covered mask
-        if covered_type == 'positive':
-            current_rule_mask = rule.positive_covered_mask(X, y)
-        elif covered_type == 'negative':
-            current_rule_mask = rule.negative_covered_mask(X, y)
-        elif covered_type == 'all':
-            current_rule_mask = rule.premise.covered_mask(X)
-        else:
-            raise ValueError(
-                '"covered_type" parameter should be either "positive" or "negative"')
+        current_rule_mask = self._get_covered_mask(rule, X, y, covered_type)
 
-        # Uniquely covered examples
-        unique_mask = current_rule_mask & ~others_rules_covered_mask
+        # Uniquely covered examples - current rule is the only one covering them
+        covered_counts = self._calculate_covered_counts(X, y, 'all')
+        unique_mask = current_rule_mask & (covered_counts == 1)
 
         return int(np.count_nonzero(unique_mask))
 
@@ -200,7 +382,8 @@ class AbstractRulesMetrics(ABC):
         self,
         X: pd.DataFrame,  # pylint: disable=invalid-name
         y: pd.Series,  # pylint: disable=invalid-name
-        metrics_to_calculate: Optional[list[str]] = None
+        metrics_to_calculate: Optional[list[str]] = None,
+        coverage_matrix: Optional[np.ndarray] = None
     ) -> dict[str, dict[str, float]]:
         """Calculates rules metrics for all rules
 
@@ -210,6 +393,9 @@ class AbstractRulesMetrics(ABC):
             metrics_to_calculate (Optional[list[str]], optional): Optional parameter
                 for specifying which metrics to calculate. By default it will calculate
                 all supported metrics.
+            coverage_matrix (Optional[np.ndarray], optional): Already calculated rules
+                coverage matrix on the given dataset. Passing it avoids evaluating
+                rules premises again. Defaults to None.
 
         Raises:
             ValueError: when trying to calculate unsupported metric.
@@ -224,6 +410,7 @@ class AbstractRulesMetrics(ABC):
         metrics: dict[str, dict[str, Any]] = {
             rule.uuid: {} for rule in self.rules
         }
+        self._context = RulesMetricsContext(self.rules, X, y, coverage_matrix)
         try:
             for rule in self.rules:
                 calculator: dict[Callable[[], Any]] = self.get_metrics_calculator(
@@ -239,4 +426,6 @@ class AbstractRulesMetrics(ABC):
                 'Supported metrics for this type of ruleset are: ' +
                 f'{", ".join(self.supported_metrics)}'
             ) from error
+        finally:
+            self._context = None
         return metrics
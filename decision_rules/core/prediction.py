@@ -11,6 +11,25 @@ from decision_rules.core.rule import AbstractRule
 from typeguard import typechecked
 
 
+def _fit_strings_dtype(predictions: np.ndarray, value: Any) -> np.ndarray:
+    """Makes sure that the given value (e.g. default conclusion value) can be
+    assigned to the array of string predictions without being truncated when it
+    is longer than all predicted values.
+
+    Args:
+        predictions (np.ndarray): predictions
+        value (Any): value to be assigned to some of the predictions
+
+    Returns:
+        np.ndarray: predictions with the dtype able to hold the value
+    """
+    if predictions.dtype.kind not in ('U', 'S'):
+        return predictions
+    return predictions.astype(
+        np.result_type(predictions, np.array([value])), copy=False
+    )
+
+
 @typechecked
 class PredictionStrategy(ABC):
     """Prediction strategy interface. By subclassing it you can implement
@@ -53,10 +72,24 @@ class PredictionStrategy(ABC):
         Returns:
             np.ndarray: predictions
         """
-        self.coverage_matrix = coverage_matrix
-        voting_matrix: np.ndarray = self._calculate_voting_matrix()
+        voting_matrix: np.ndarray = self.calculate_voting_matrix(
+            coverage_matrix)
         return self._perform_prediction(voting_matrix)
 
+    def calculate_voting_matrix(self, coverage_matrix: np.ndarray) -> np.ndarray:
+        """Calculates voting matrix used by this strategy for given coverage matrix.
+        See "_perform_prediction" for more details.
+
+        Args:
+            coverage_matrix (np.ndarray): coverage matrix.
+                See "AbstractRuleSet.calculate_coverage_matrix" for more details.
+
+        Returns:
+            np.ndarray: voting matrix
+        """
+        self.coverage_matrix = coverage_matrix
+        return self._calculate_voting_matrix()
+
     def _calculate_voting_matrix(self) -> np.ndarray:
         """Prepare special array used for prediction. It contains as many rows as there are
         examples in the dataset and as many columns as there are rules in the ruleset. It
@@ -189,16 +222,37 @@ class BestRulePredictionStrategy(PredictionStrategy):
     """Best rule prediction strategy for prediction.
     """
 
-    def _perform_prediction(self, voting_matrix: np.ndarray) -> np.ndarray:
-        not_covered_examples_mask = np.sum(voting_matrix, axis=1) == 0
+    def find_best_rules(self, coverage_matrix: np.ndarray) -> np.ndarray:
+        """Finds the rule used to predict for each example.
+
+        Args:
+            coverage_matrix (np.ndarray): coverage matrix.
+                See "AbstractRuleSet.calculate_coverage_matrix" for more details.
+
+        Returns:
+            np.ndarray: indices of the best rules covering examples or -1 for
+                examples not covered by any rule
+        """
+        return self._find_best_rules(
+            self.calculate_voting_matrix(coverage_matrix))
+
+    def _find_best_rules(self, voting_matrix: np.ndarray) -> np.ndarray:
         best_rules_indices = np.argmax(voting_matrix, axis=1)
+        best_rules_indices[np.sum(voting_matrix, axis=1) == 0] = -1
+        return best_rules_indices
+
+    def _perform_prediction(self, voting_matrix: np.ndarray) -> np.ndarray:
+        best_rules_indices = self._find_best_rules(voting_matrix)
+        not_covered_examples_mask = best_rules_indices == -1
         prediction = np.array([
             self._get_prediction_from_conclusion(self.rules[index].conclusion)
             for index in best_rules_indices
         ])
-        prediction[not_covered_examples_mask] = self._get_prediction_from_conclusion(
+        default_prediction: Any = self._get_prediction_from_conclusion(
             self.default_conclusion
         )
+        prediction = _fit_strings_dtype(prediction, default_prediction)
+        prediction[not_covered_examples_mask] = default_prediction
         return prediction
 
     def _get_prediction_from_conclusion(self, conclusion: AbstractConclusion) -> Any:
@@ -220,6 +274,8 @@ class FirstRuleCoveringStrategy(PredictionStrategy):
             ]
         )
         # we need to handle examples uncovered by any rule using default rule/conclusion
+        predictions = _fit_strings_dtype(
+            predictions, self.default_conclusion.value)
         predictions[coverage_matrix.sum(
             axis=1) == 0] = self.default_conclusion.value
         return predictions
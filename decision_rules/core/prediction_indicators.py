@@ -0,0 +1,96 @@
+"""
+Contains base class for mergeable prediction indicators accumulators.
+"""
+from __future__ import annotations
+
+import copy
+from abc import ABC
+from abc import abstractmethod
+
+
+class AbstractPredictionIndicatorsAccumulator(ABC):
+    """Base class for objects accumulating sufficient statistics of predictions
+    required to calculate prediction indicators. Accumulators ingest chunks of
+    actual and predicted values using `update` method, can be merged with other
+    accumulators of the same type (e.g. ones created by other workers or
+    for other data partitions) and finally calculate prediction indicators
+    using `finalize` method. This way indicators can be calculated without
+    collecting whole predictions in memory.
+
+    Args:
+        calculate_only_for_covered_examples (bool, optional): If true, it will
+            calculate indicators only for the examples where prediction was not
+            empty. Otherwise, it will calculate indicators for all the examples.
+            Defaults to False.
+    """
+
+    def __init__(self, calculate_only_for_covered_examples: bool = False) -> None:
+        self.calculate_only_for_covered_examples: bool = calculate_only_for_covered_examples
+        self.all_examples_count: int = 0
+        self.covered_by_prediction: int = 0
+
+    @property
+    def not_covered_by_prediction(self) -> int:
+        """
+        Returns:
+            int: Number of ingested examples excluded from indicators calculation
+        """
+        return self.all_examples_count - self.covered_by_prediction
+
+    def merge(
+        self,
+        other: AbstractPredictionIndicatorsAccumulator
+    ) -> AbstractPredictionIndicatorsAccumulator:
+        """Merges statistics accumulated by other accumulator into this one.
+
+        Args:
+            other (AbstractPredictionIndicatorsAccumulator): accumulator of the
+                same type and configuration
+
+        Raises:
+            ValueError: If accumulators are of different type or configuration
+
+        Returns:
+            AbstractPredictionIndicatorsAccumulator: self
+        """
+        if type(other) is not type(self):
+            raise ValueError(
+                f'Cannot merge {type(self).__name__} with {type(other).__name__}'
+            )
+        if other.calculate_only_for_covered_examples != self.calculate_only_for_covered_examples:
+            raise ValueError(
+                'Cannot merge accumulators with different values of '
+                '"calculate_only_for_covered_examples" parameter'
+            )
+        self._merge(other)
+        self.all_examples_count += other.all_examples_count
+        self.covered_by_prediction += other.covered_by_prediction
+        return self
+
+    def __add__(
+        self,
+        other: AbstractPredictionIndicatorsAccumulator
+    ) -> AbstractPredictionIndicatorsAccumulator:
+        return self.copy().merge(other)
+
+    def copy(self) -> AbstractPredictionIndicatorsAccumulator:
+        """
+        Returns:
+            AbstractPredictionIndicatorsAccumulator: Independent copy of the
+                accumulator
+        """
+        return copy.deepcopy(self)
+
+    @abstractmethod
+    def _merge(self, other: AbstractPredictionIndicatorsAccumulator):
+        """Merges problem specific statistics of the other accumulator into this one.
+        """
+
+    @abstractmethod
+    def finalize(self) -> dict:
+        """Calculates prediction indicators from accumulated statistics.
+
+        Returns:
+            dict: prediction indicators, in the same format as returned by
+                problem specific `calculate_for_*` functions.
+        """
@@ -3,6 +3,7 @@ Contains abstract rule and conclusion classes.
 """
 from __future__ import annotations
 
+import copy
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
@@ -68,6 +69,17 @@ class AbstractConclusion(ABC):
     def is_empty(self) -> bool:
         """Returns whether conclusion is empty or not."""
 
+    def clone(self) -> AbstractConclusion:
+        """Creates an independent copy of the conclusion. Conclusion attributes
+        are shared with the original conclusion, so subclasses holding payloads
+        which could be modified in place (e.g. estimators) should replace them
+        instead of modifying.
+
+        Returns:
+            AbstractConclusion: conclusion copy
+        """
+        return copy.copy(self)
+
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, AbstractConclusion)
@@ -119,6 +131,21 @@ class AbstractRule(ABC):
         """
         return self._uuid
 
+    def clone(self) -> AbstractRule:
+        """Creates an independent copy of the rule, keeping its uuid. Premise and
+        conclusion are cloned, coverage is copied as a regular `Coverage` object
+        detached from the ruleset coverage table. Columns names list is shared
+        with the original rule.
+
+        Returns:
+            AbstractRule: rule copy
+        """
+        rule: AbstractRule = copy.copy(self)
+        rule.premise = self.premise.clone()
+        rule.conclusion = self.conclusion.clone()
+        rule.coverage = copy.copy(self.coverage)
+        return rule
+
     def calculate_coverage(
         self, X: np.ndarray, y: np.ndarray = None, P: int = None, N: int = None
     ) -> Coverage:
@@ -3,6 +3,7 @@ Contains abstract ruleset class.
 """
 from __future__ import annotations
 
+import copy
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
@@ -19,12 +20,16 @@ from decision_rules.conditions import NominalAttributesEqualityCondition
 from decision_rules.core.condition import AbstractCondition
 from decision_rules.core.coverage import ClassificationCoverageInfodict
 from decision_rules.core.coverage import Coverage
+from decision_rules.core.coverage import CoverageTable
+from decision_rules.core.coverage import CoverageView
 from decision_rules.core.exceptions import InvalidStateError
 from decision_rules.core.metrics import AbstractRulesMetrics
 from decision_rules.core.prediction import _PredictionModel
 from decision_rules.core.prediction import PredictionStrategy
 from decision_rules.core.rule import AbstractConclusion
 from decision_rules.core.rule import AbstractRule
+from decision_rules.helpers.measures import calculate_measure
+from decision_rules.helpers.measures import get_vectorized_measure
 from decision_rules.measures import coverage
 from decision_rules.measures import precision
 
@@ -119,6 +124,32 @@ class AbstractRuleSet(_PredictionModel, ABC):
         """
         return self._use_default_conclusion
 
+    def clone(self) -> AbstractRuleSet:
+        """Creates an independent copy of the ruleset which can be modified (e.g.
+        filtered, simplified or updated on other data) without affecting this
+        ruleset. It is a cheaper alternative of `copy.deepcopy`: rules and
+        conclusions are cloned, but immutable payloads such as columns names lists,
+        train labels arrays or survival estimators are shared with the original
+        ruleset. Rules coverages of the copy are detached from the coverage table
+        of this ruleset.
+
+        Returns:
+            AbstractRuleSet: ruleset copy
+        """
+        ruleset: AbstractRuleSet = copy.copy(self)
+        ruleset.rules = [rule.clone() for rule in self.rules]
+        if self.train_P is not None:
+            ruleset.train_P = dict(self.train_P)
+        if self.train_N is not None:
+            ruleset.train_N = dict(self.train_N)
+        if self._stored_default_conclusion is not None:
+            ruleset._stored_default_conclusion = self._stored_default_conclusion.clone()
+        if self._default_conclusion is self._stored_default_conclusion:
+            ruleset._default_conclusion = ruleset._stored_default_conclusion
+        elif self._default_conclusion is not None:
+            ruleset._default_conclusion = self._default_conclusion.clone()
+        return ruleset
+
     def _validate_coverage_matrix_param(
         self, X_binary: np.ndarray
     ):  # pylint: disable=invalid-name
@@ -225,8 +256,88 @@ class AbstractRuleSet(_PredictionModel, ABC):
                     X_train, y_train, P=P, N=N, **kwargs
                 )
                 coverage_matrix[:, i] = rule.premise.covered_mask(X_train)
+        self._bind_coverage_table(CoverageTable.from_coverages(
+            [rule.coverage for rule in self.rules]
+        ))
         return coverage_matrix
 
+    @property
+    def coverage_table(self) -> Optional[CoverageTable]:
+        """Coverages of all rules stored as contiguous numpy arrays. The table is
+        created when rules coverages are calculated (e.g. in `update`) and rules'
+        coverages are views into it, so modifying table arrays modifies rules'
+        coverages and vice versa. Table extras hold per-rule values captured at that
+        time. If some rule's coverage was assigned directly afterwards, a new table
+        detached from the rules is created from current rules' coverages.
+
+        Returns:
+            Optional[CoverageTable]: coverage table or None if some rule has
+                uncalculated coverage
+        """
+        if any(rule.coverage is None for rule in self.rules):
+            return None
+        table: Optional[CoverageTable] = self._get_bound_coverage_table()
+        if table is None:
+            table = CoverageTable.from_coverages(
+                [rule.coverage for rule in self.rules]
+            )
+            table.extras = self._get_coverage_table_extras()
+        return table
+
+    def _get_calculated_coverage_table(self) -> CoverageTable:
+        table: Optional[CoverageTable] = self.coverage_table
+        if table is None:
+            raise InvalidStateError(
+                "Some rules have uncalculated coverages. You should call `update` or "
+                + "`calculate_rules_coverages` method first."
+            )
+        return table
+
+    def _get_bound_coverage_table(self) -> Optional[CoverageTable]:
+        if len(self.rules) == 0 or not isinstance(self.rules[0].coverage, CoverageView):
+            return None
+        table: CoverageTable = self.rules[0].coverage._table  # pylint: disable=protected-access
+        if len(table) != len(self.rules):
+            return None
+        for i, rule in enumerate(self.rules):
+            if (
+                not isinstance(rule.coverage, CoverageView) or
+                rule.coverage._table is not table or  # pylint: disable=protected-access
+                rule.coverage._index != i  # pylint: disable=protected-access
+            ):
+                return None
+        return table
+
+    def _bind_coverage_table(self, table: CoverageTable):
+        for i, rule in enumerate(self.rules):
+            rule.coverage = table[i]
+        table.extras = self._get_coverage_table_extras()
+
+    def _get_coverage_table_extras(self) -> dict[str, np.ndarray]:
+        """
+        Returns:
+            dict[str, np.ndarray]: additional per-rule values stored in coverage table
+                which are specific for given ruleset type.
+        """
+        return {}
+
+    def _calculate_rules_measure(self, measure: Callable[[Coverage], float]) -> np.ndarray:
+        """Calculates quality measure value for all rules. Measures from
+        `decision_rules.measures` are calculated at once on the coverage table using
+        their vectorized versions (see `calculate_measure`). Custom measures are
+        calculated rule by rule.
+
+        Args:
+            measure (Callable[[Coverage], float]): quality measure function
+
+        Returns:
+            np.ndarray: measure values
+        """
+        table: Optional[CoverageTable] = self.coverage_table
+        if get_vectorized_measure(measure) is not None and table is not None:
+            return calculate_measure(measure, table.p, table.n, table.P, table.N)
+        return np.array([measure(rule.coverage) for rule in self.rules], dtype=float)
+
     def calculate_rules_weights(self, measure: Callable[[Coverage], float]):
         """
         Args:
@@ -243,7 +354,9 @@ class AbstractRuleSet(_PredictionModel, ABC):
                     + "calculate coverages of all rules - or call `Rule.calculate_coverage` "
                     + "- to calculate coverage of this specific rule"
                 )
-            rule.voting_weight = measure(rule.coverage)
+        voting_weights: np.ndarray = self._calculate_rules_measure(measure)
+        for rule, voting_weight in zip(self.rules, voting_weights):
+            rule.voting_weight = float(voting_weight)
         self._voting_weights_calculated = True
 
     def _base_update(
@@ -281,25 +394,27 @@ class AbstractRuleSet(_PredictionModel, ABC):
         )
         y_uniques: list[Any] = []
         y_values_count: list[Any] = []
+        coverages: list[Coverage] = []
         for rule in self.rules:
             try:
                 coverage_info: ClassificationCoverageInfodict = coverages_info[
                     rule.uuid
                 ]
-                rule.coverage = Coverage(
+                coverages.append(Coverage(
                     p=coverage_info["p"],
                     n=coverage_info["n"],
                     P=coverage_info["P"],
                     N=coverage_info["N"],
-                )
+                ))
                 if rule.conclusion.value not in y_uniques:
                     y_uniques.append(rule.conclusion.value)
-                    y_values_count.append(rule.coverage.P)
+                    y_values_count.append(coverages[-1].P)
             except KeyError:
                 raise ValueError(  # pylint: disable=raise-missing-from
                     f'Coverage info missing for rule: "{rule.uuid}" '
                     + "and possibly some other rules too."
                 )
+        self._bind_coverage_table(CoverageTable.from_coverages(coverages))
         self._base_update(np.array(y_uniques),
                           np.array(y_values_count), measure)
 
@@ -376,10 +491,12 @@ class AbstractRuleSet(_PredictionModel, ABC):
         old_conclusions = [rule.conclusion for rule in self.rules]
         for rule in self.rules:
             rule.premise.cached = True
-        self.calculate_rules_coverages(X, y)
+        coverage_matrix: np.ndarray = self.calculate_rules_coverages(X, y)
 
         metrics: AbstractRulesMetrics = self.get_metrics_object_instance()
-        metrics_values: dict = metrics.calculate(X, y, metrics_to_calculate)
+        metrics_values: dict = metrics.calculate(
+            X, y, metrics_to_calculate, coverage_matrix=coverage_matrix
+        )
 
         for i, rule in enumerate(self.rules):
             rule.premise.invalidate_cache()
@@ -394,6 +511,7 @@ class AbstractRuleSet(_PredictionModel, ABC):
         X: pd.DataFrame,  # pylint: disable=invalid-name
         y: pd.Series,  # pylint: disable=invalid-name
         measure: Callable[[Coverage], float],
+        n_jobs: Optional[int] = 1,
     ) -> Union[dict[str, float], dict[str, dict[str, float]]]:
         """Calculate importances of conditions in RuleSet
 
@@ -401,6 +519,9 @@ class AbstractRuleSet(_PredictionModel, ABC):
             X (pd.DataFrame):
             y (pd.Series):
             measure (Callable[[Coverage], float]): measure used to count importance
+            n_jobs (Optional[int], optional): number of processes used to process rules
+                in parallel, -1 means using all processors. Results do not depend
+                on this parameter. Defaults to 1.
 
         Returns:
             dict[str, float]: condition importances, in the case of classification additionally returns information about class dict[str, dict[str, float]]:
@@ -449,10 +570,10 @@ class AbstractRuleSet(_PredictionModel, ABC):
             stats["total_conditions_count"] / len(self.rules), 2
         )
         stats["avg_precision"] = round(
-            np.mean([precision(rule.coverage) for rule in self.rules]), 2
+            np.mean(self._calculate_rules_measure(precision)), 2
         )
         stats["avg_coverage"] = round(
-            np.mean([coverage(rule.coverage) for rule in self.rules]), 2
+            np.mean(self._calculate_rules_measure(coverage)), 2
         )
 
         return stats
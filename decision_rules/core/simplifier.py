@@ -1,5 +1,3 @@
-import copy
-
 from decision_rules.conditions import CompoundCondition
 from decision_rules.conditions import ElementaryCondition
 from decision_rules.conditions import LogicOperators
@@ -10,7 +8,7 @@ from decision_rules.core.ruleset import AbstractRuleSet
 
 class RulesetSimplifier:
     def __init__(self, ruleset: AbstractRuleSet):
-        self.ruleset = copy.deepcopy(ruleset)
+        self.ruleset = ruleset.clone()
 
     def simplify(self) -> AbstractRuleSet:
         rules: list[AbstractRule] = self.ruleset.rules
@@ -1,2 +1,3 @@
+from decision_rules.filtering._budget import FilteringProgress
 from decision_rules.filtering._main import filter_ruleset
 from decision_rules.filtering._main import FilterAlgorithm
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Callable
 from typing import Optional
 
@@ -6,8 +5,10 @@ import numpy as np
 import pandas as pd
 from decision_rules.core.coverage import Coverage
 from decision_rules.core.ruleset import AbstractRuleSet
-from decision_rules.filtering._helpers import calculate_ruleset_prediction_score
+from decision_rules.filtering._budget import FilteringBudget
 from decision_rules.filtering._helpers import split_and_sort_ruleset
+from decision_rules.filtering._scorers import calculate_ruleset_score
+from decision_rules.filtering._scorers import create_ruleset_scorer
 
 
 def filter_ruleset_with_backward(
@@ -16,8 +17,11 @@ def filter_ruleset_with_backward(
         y: pd.Series,
         loss: float,
         measure: Optional[Callable[[Coverage], float]],
+        budget: Optional[FilteringBudget] = None,
 ) -> AbstractRuleSet:
-    """Filter ruleset using backward algorithm.
+    """Filter ruleset using backward algorithm. All the rules kept at any step
+    meet the accepted loss, so when the budget is exhausted the rules kept so far
+    are returned.
 
     Args:
         ruleset (AbstractRuleSet): ruleset to filter
@@ -25,13 +29,17 @@ def filter_ruleset_with_backward(
         y (pd.Series): dataset target
         loss (float): accepted loss of prediction quality (fraction)
         measure (Optional[Callable[[Coverage], float]]): rule quality measure (voting measure)
+        budget (Optional[FilteringBudget], optional): run time budget and progress
+            callback. Defaults to None (unlimited).
 
     Returns:
         AbstractRuleSet: filtered ruleset
     """
+    if budget is None:
+        budget = FilteringBudget()
     # get original ruleset score and calculate target score
     original_coverage_matrix = ruleset.update(X, y, measure)
-    original_ruleset_score = calculate_ruleset_prediction_score(
+    original_ruleset_score = calculate_ruleset_score(
         ruleset, X, y, original_coverage_matrix)
     if original_ruleset_score >= 0:
         target_score = original_ruleset_score * (1 - loss)
@@ -39,30 +47,38 @@ def filter_ruleset_with_backward(
         target_score = original_ruleset_score * (1 + loss)
 
     # copy the original ruleset to create the new target filtered ruleset
-    filtered_ruleset = deepcopy(ruleset)
+    filtered_ruleset = ruleset.clone()
     new_rules = split_and_sort_ruleset(
         filtered_ruleset, X, y, measure, ascending=False)
     filtered_ruleset.rules = new_rules
     coverage_matrix = filtered_ruleset.update(X, y, measure)
+    # scorer keeps the state of the filtered ruleset (initially all rules are kept),
+    # it allows to evaluate ruleset without a given rule updating only the examples
+    # covered by this rule
+    scorer = create_ruleset_scorer(
+        filtered_ruleset, X, y, coverage_matrix,
+        active=np.ones(len(new_rules), dtype=bool)
+    )
 
     # implement backward algorithm
-    # iterate over an index at which we remove the next rule
-    i = 0
-    while i < len(filtered_ruleset.rules) and len(filtered_ruleset.rules) > 1:
-        # we remove the rule from the ruleset and its corresponding column from the coverage matrix
-        deleted_rule = filtered_ruleset.rules.pop(i)
-        new_coverage_matrix = np.delete(coverage_matrix, i, axis=1)
-        new_ruleset_score = calculate_ruleset_prediction_score(
-            filtered_ruleset, X, y, new_coverage_matrix)
-        # if score is not worse than the target score,
-        # we update it, keep the rule removed, and continue
+    # iterate over rules in order and try to remove each of them
+    filtered_ruleset_score = scorer.score()
+    for i in range(len(new_rules)):
+        if scorer.active_count <= 1 or budget.is_exhausted():
+            break
+        new_ruleset_score = scorer.score_without(i)
+        budget.count_evaluations()
+        # if score is not worse than the target score, we keep the rule removed
         if new_ruleset_score >= target_score:
-            coverage_matrix = new_coverage_matrix
-        # if not, we restore the last removed rule and move to the next index
-        else:
-            filtered_ruleset.rules.insert(i, deleted_rule)
-            i += 1
+            filtered_ruleset_score = new_ruleset_score
+            scorer.remove(i)
+        budget.report(
+            rules_kept=scorer.active_count,
+            rules_removed=len(new_rules) - scorer.active_count,
+            score=filtered_ruleset_score,
+        )
 
+    filtered_ruleset.rules = scorer.active_rules
     filtered_ruleset.update(X, y, measure)
 
     return filtered_ruleset
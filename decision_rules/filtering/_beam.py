@@ -0,0 +1,279 @@
+import copy
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from decision_rules.core.coverage import Coverage
+from decision_rules.core.ruleset import AbstractRuleSet
+from decision_rules.filtering._budget import FilteringBudget
+from decision_rules.filtering._helpers import split_and_sort_ruleset
+from decision_rules.filtering._scorers import calculate_ruleset_score
+from decision_rules.filtering._scorers import create_ruleset_scorer
+from decision_rules.filtering._scorers import RulesetScorer
+from decision_rules.helpers.parallel import get_array
+from decision_rules.helpers.parallel import get_workers_count
+from decision_rules.helpers.parallel import share_array
+from decision_rules.helpers.parallel import SharedArray
+from decision_rules.helpers.parallel import SharedData
+
+# state of worker processes evaluating extensions, set once per process by
+# _initialize_worker
+_worker_state: dict = {}
+
+
+def filter_ruleset_with_beam(
+        ruleset: AbstractRuleSet,
+        X: pd.DataFrame,
+        y: pd.Series,
+        loss: float,
+        measure: Optional[Callable[[Coverage], float]],
+        beam_width: int = 5,
+        n_jobs: Optional[int] = 1,
+        budget: Optional[FilteringBudget] = None,
+) -> AbstractRuleSet:
+    """Filter ruleset using beam search algorithm. It extends the greedy forward
+    algorithm by keeping `beam_width` best partial rulesets in each step instead
+    of a single one. All extensions (partial rulesets with one more rule) of all
+    partial rulesets in the beam are evaluated and the best ones improving the
+    score of their partial rulesets form the next beam. The search stops when
+    the best partial ruleset reaches the accepted loss or no extension improves
+    the score. When the budget is exhausted, the best partial ruleset found so far
+    is returned (or the whole ruleset if nothing was evaluated).
+
+    Args:
+        ruleset (AbstractRuleSet): ruleset to filter
+        X (pd.DataFrame): dataset features
+        y (pd.Series): dataset target
+        loss (float): accepted loss of prediction quality (fraction)
+        measure (Optional[Callable[[Coverage], float]]): rule quality measure (voting measure)
+        beam_width (int, optional): number of partial rulesets kept in each step,
+            for 1 the algorithm is the same as the greedy forward. Defaults to 5.
+        n_jobs (Optional[int], optional): number of processes used to evaluate
+            extensions in parallel, -1 means using all processors. Numeric data of
+            the dataset, the coverage matrix and, in each step, states of partial
+            rulesets in the beam are shared with the processes without copying.
+            Starting processes takes time, so it pays off for large datasets and
+            rulesets. Results do not depend on this parameter. Defaults to 1.
+        budget (Optional[FilteringBudget], optional): run time budget and progress
+            callback. Defaults to None (unlimited).
+
+    Raises:
+        ValueError: if beam width is not positive
+
+    Returns:
+        AbstractRuleSet: filtered ruleset
+    """
+    if beam_width < 1:
+        raise ValueError(
+            f'beam_width should be a positive integer, got: {beam_width}')
+    if budget is None:
+        budget = FilteringBudget()
+    # get original ruleset score and calculate target score
+    original_coverage_matrix = ruleset.update(X, y, measure)
+    original_ruleset_score = calculate_ruleset_score(
+        ruleset, X, y, original_coverage_matrix)
+    if original_ruleset_score >= 0:
+        target_score = original_ruleset_score * (1 - loss)
+    else:
+        target_score = original_ruleset_score * (1 + loss)
+
+    filtered_ruleset = ruleset.clone()
+    new_rules = split_and_sort_ruleset(
+        filtered_ruleset, X, y, measure, ascending=True)
+    filtered_ruleset.rules = new_rules
+    coverage_matrix = filtered_ruleset.update(X, y, measure)
+    # each partial ruleset in the beam is represented by its own scorer
+    beam: list[RulesetScorer] = [
+        create_ruleset_scorer(filtered_ruleset, X, y, coverage_matrix)
+    ]
+    beam_scores: list[float] = [float("-inf")]
+    initial_scorer: RulesetScorer = beam[0]
+    best_scorer: RulesetScorer = beam[0]
+    best_score: float = float("-inf")
+
+    workers_count: int = get_workers_count(n_jobs)
+    executor: Optional[ProcessPoolExecutor] = None
+    shared_data: dict[str, SharedData] = {}
+    if workers_count > 1:
+        # scorer sent to the processes does not carry its data (e.g. dataset and
+        # coverage matrix), which is placed in shared memory instead
+        worker_scorer: RulesetScorer = copy.copy(initial_scorer)
+        worker_scorer._covered_rows = {}  # pylint: disable=protected-access
+        for name, value in vars(initial_scorer).items():
+            if isinstance(value, (np.ndarray, pd.Series, pd.DataFrame)):
+                shared_data[name] = SharedData(value)
+                setattr(worker_scorer, name, None)
+        executor = ProcessPoolExecutor(
+            max_workers=workers_count,
+            initializer=_initialize_worker,
+            initargs=(worker_scorer, shared_data)
+        )
+    try:
+        # implement beam search algorithm
+        while best_score < target_score and beam and not budget.is_exhausted():
+            extensions: list[tuple[int, int]] = [
+                (i, rule_index)
+                for i, scorer in enumerate(beam)
+                for rule_index in np.flatnonzero(~scorer.active)
+            ]
+            # evaluate only as many extensions as the budget allows
+            extensions = extensions[:budget.remaining_evaluations]
+            if not extensions:
+                break
+            extensions_scores: list[Optional[float]] = _evaluate_extensions(
+                beam, extensions, executor, workers_count, initial_scorer, budget)
+            # extensions not evaluated before the budget was exhausted are skipped
+            evaluated: list[int] = [
+                j for j, score in enumerate(extensions_scores) if score is not None
+            ]
+            extensions = [extensions[j] for j in evaluated]
+            extensions_scores = [extensions_scores[j] for j in evaluated]
+            budget.count_evaluations(len(extensions))
+
+            # in case of ties the extensions of better partial rulesets and the best
+            # rules according to the quality measure are chosen (sorting is stable)
+            new_beam: list[RulesetScorer] = []
+            new_beam_scores: list[float] = []
+            visited_rulesets: set[bytes] = set()
+            for j in sorted(range(len(extensions)), key=lambda j: -extensions_scores[j]):
+                if len(new_beam) == beam_width:
+                    break
+                i, rule_index = extensions[j]
+                # keep only extensions improving the score
+                if extensions_scores[j] <= beam_scores[i]:
+                    continue
+                # the same ruleset may be obtained by extending different partial rulesets
+                active: np.ndarray = beam[i].active.copy()
+                active[rule_index] = True
+                if active.tobytes() in visited_rulesets:
+                    continue
+                visited_rulesets.add(active.tobytes())
+                scorer: RulesetScorer = beam[i].copy()
+                scorer.add(rule_index)
+                new_beam.append(scorer)
+                new_beam_scores.append(extensions_scores[j])
+            beam, beam_scores = new_beam, new_beam_scores
+            if beam and beam_scores[0] > best_score:
+                best_scorer, best_score = beam[0], beam_scores[0]
+            budget.report(
+                rules_kept=best_scorer.active_count,
+                rules_removed=len(new_rules) - best_scorer.active_count,
+                score=best_score,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        for data in shared_data.values():
+            data.close()
+
+    # no ruleset is found only when the budget is exhausted before the first
+    # evaluation, in such case the ruleset is returned unfiltered
+    if best_scorer.active_count > 0:
+        filtered_ruleset.rules = best_scorer.active_rules
+    filtered_ruleset.update(X, y, measure)
+
+    return filtered_ruleset
+
+
+def _evaluate_extensions(
+        beam: list[RulesetScorer],
+        extensions: list[tuple[int, int]],
+        executor: Optional[ProcessPoolExecutor],
+        workers_count: int,
+        initial_scorer: RulesetScorer,
+        budget: FilteringBudget,
+) -> list[Optional[float]]:
+    # scores of extensions not evaluated before the budget was exhausted are None
+    if executor is None or len(extensions) < 2:
+        scores: list[Optional[float]] = []
+        for i, rule_index in extensions:
+            if budget.is_exhausted():
+                break
+            scores.append(beam[i].score_with(rule_index))
+        return scores + [None] * (len(extensions) - len(scores))
+    # extensions of each partial ruleset are split into chunks evaluated by
+    # different processes, results are collected in the order of extensions
+    remaining_time: Optional[float] = budget.remaining_time
+    # processes do not share the budget, so they check the deadline instead
+    deadline: Optional[float] = (
+        None if remaining_time is None else time.time() + remaining_time)
+    # states of partial rulesets are placed in shared memory, so that each of
+    # them is copied once regardless of the number of chunks
+    shared_states: list[dict[str, Any]] = []
+    states: list[dict[str, Any]] = []
+    chunks: list[np.ndarray] = []
+    try:
+        for i, beam_extensions in groupby(extensions, key=lambda extension: extension[0]):
+            rules_indices: np.ndarray = np.array(
+                [rule_index for _, rule_index in beam_extensions], dtype=int)
+            state: dict[str, Any] = _get_scorer_state(beam[i], initial_scorer)
+            shared_states.append(state)
+            for name, value in state.items():
+                if isinstance(value, np.ndarray):
+                    state[name] = share_array(value)
+            for chunk in np.array_split(rules_indices, min(workers_count, len(rules_indices))):
+                states.append(state)
+                chunks.append(chunk)
+        return [
+            score
+            for chunk_scores in executor.map(
+                _score_extensions, states, chunks, [deadline] * len(chunks))
+            for score in chunk_scores
+        ]
+    finally:
+        for state in shared_states:
+            _close_state(state)
+
+
+def _get_scorer_state(
+        scorer: RulesetScorer,
+        initial_scorer: RulesetScorer
+) -> dict[str, Any]:
+    # scorers in the beam are copies of the initial scorer sharing its data
+    # (e.g. dataset and coverage matrix), so only attributes replaced since
+    # then form the state of the partial ruleset
+    initial_attributes: dict[str, Any] = vars(initial_scorer)
+    return {
+        name: value for name, value in vars(scorer).items()
+        if initial_attributes.get(name) is not value
+    }
+
+
+def _close_state(state: dict[str, Any]):
+    for value in state.values():
+        if isinstance(value, SharedArray):
+            value.close()
+
+
+def _initialize_worker(scorer: RulesetScorer, shared_data: dict[str, SharedData]):
+    # shared data is kept in the state, so its memory stays attached
+    _worker_state['shared_data'] = shared_data
+    for name, data in shared_data.items():
+        setattr(scorer, name, data.get())
+    _worker_state['scorer'] = scorer
+
+
+def _score_extensions(
+        state: dict[str, Any],
+        rules_indices: np.ndarray,
+        deadline: Optional[float]
+) -> list[Optional[float]]:
+    # shallow copy of the initial scorer shares data and cached covered rows
+    scorer: RulesetScorer = copy.copy(_worker_state['scorer'])
+    vars(scorer).update({
+        name: get_array(value) for name, value in state.items()
+    })
+    scores: list[Optional[float]] = []
+    for rule_index in rules_indices:
+        if deadline is not None and time.time() >= deadline:
+            break
+        scores.append(scorer.score_with(int(rule_index)))
+    # the scorer has to be released before detaching the shared memory
+    del scorer
+    _close_state(state)
+    return scores + [None] * (len(rules_indices) - len(scores))
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+from typing import Optional
+from typing import TypedDict
+
+
+class FilteringProgress(TypedDict):
+    """Object describing the progress of a filtering algorithm, passed to the
+    progress callback.
+    """
+    evaluations_count: int
+    rules_kept: int
+    rules_removed: int
+    score: Optional[float]
+    elapsed_time: float
+
+
+class FilteringBudget:
+    """Limits the run time of a filtering algorithm and reports its progress.
+    Filtering algorithms check the budget between evaluations of candidate rules
+    (also within a step evaluating many of them) and when it is exhausted they
+    stop, returning the best ruleset found so far. The budget is not checked
+    during the setup of the algorithm and the final update of the ruleset, so the
+    actual run time may exceed the time budget by their duration. The setup
+    consists of updating the ruleset, sorting its rules, calculating its original
+    score and creating the scorer (for survival rulesets it takes time linear in
+    the number of examples times the number of distinct event times) and, when
+    evaluating candidates in parallel, starting worker processes.
+
+    Args:
+        time_budget (Optional[float], optional): maximum run time in seconds.
+            Defaults to None (unlimited).
+        max_evaluations (Optional[int], optional): maximum number of evaluations
+            of candidate rules. Defaults to None (unlimited).
+        progress_callback (Optional[Callable[[FilteringProgress], None]], optional):
+            function called after each step of the algorithm. Defaults to None.
+
+    Raises:
+        ValueError: if time budget or maximum number of evaluations is not positive
+    """
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        max_evaluations: Optional[int] = None,
+        progress_callback: Optional[Callable[[
+            FilteringProgress], None]] = None,
+    ) -> None:
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(
+                f'time_budget should be a positive number, got: {time_budget}')
+        if max_evaluations is not None and max_evaluations < 1:
+            raise ValueError(
+                f'max_evaluations should be a positive integer, got: {max_evaluations}')
+        self.time_budget: Optional[float] = time_budget
+        self.max_evaluations: Optional[int] = max_evaluations
+        self.progress_callback: Optional[Callable[[FilteringProgress], None]] = (
+            progress_callback)
+        self.evaluations_count: int = 0
+        self._start_time: float = time.perf_counter()
+
+    @property
+    def elapsed_time(self) -> float:
+        """
+        Returns:
+            float: time in seconds elapsed since the budget was created
+        """
+        return time.perf_counter() - self._start_time
+
+    @property
+    def remaining_evaluations(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: number of evaluations left or None if unlimited
+        """
+        if self.max_evaluations is None:
+            return None
+        return max(self.max_evaluations - self.evaluations_count, 0)
+
+    @property
+    def remaining_time(self) -> Optional[float]:
+        """
+        Returns:
+            Optional[float]: time in seconds left or None if unlimited
+        """
+        if self.time_budget is None:
+            return None
+        return max(self.time_budget - self.elapsed_time, 0.0)
+
+    def is_exhausted(self) -> bool:
+        """
+        Returns:
+            bool: whether the algorithm should stop
+        """
+        if self.remaining_evaluations == 0:
+            return True
+        return self.time_budget is not None and self.elapsed_time >= self.time_budget
+
+    def count_evaluations(self, count: int = 1):
+        """Registers evaluations of candidate rules.
+
+        Args:
+            count (int, optional): number of evaluations. Defaults to 1.
+        """
+        self.evaluations_count += count
+
+    def report(self, rules_kept: int, rules_removed: int, score: Optional[float]):
+        """Calls progress callback (if any) with the current progress.
+
+        Args:
+            rules_kept (int): number of rules currently kept in the ruleset
+            rules_removed (int): number of rules removed (or rejected) so far
+            score (Optional[float]): current prediction score of the ruleset or
+                None if the algorithm does not calculate it
+        """
+        if self.progress_callback is None:
+            return
+        self.progress_callback(FilteringProgress(
+            evaluations_count=self.evaluations_count,
+            rules_kept=int(rules_kept),
+            rules_removed=int(rules_removed),
+            score=None if score is None else float(score),
+            elapsed_time=self.elapsed_time,
+        ))
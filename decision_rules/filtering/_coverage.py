@@ -1,11 +1,306 @@
-from copy import deepcopy
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
 from typing import Callable
 from typing import Optional
 
 import numpy as np
 import pandas as pd
+from decision_rules.classification.ruleset import ClassificationRuleSet
 from decision_rules.core.coverage import Coverage
 from decision_rules.core.ruleset import AbstractRuleSet
+from decision_rules.filtering._budget import FilteringBudget
+from decision_rules.helpers.measures import calculate_measure
+from decision_rules.regression.ruleset import RegressionRuleSet
+from decision_rules.survival.kaplan_meier import encode_survival_status
+from decision_rules.survival.ruleset import SurvivalRuleSet
+from scipy.stats import chi2
+
+
+class _RulesQualityCounter(ABC):
+    """Keeps statistics of candidate rules on the examples not covered by the
+    already selected rules and calculates rules voting weights from them. Statistics
+    are calculated once from the coverage matrix and then only decremented by the
+    examples removed from the dataset, so rules premises are never re-evaluated.
+
+    Args:
+        ruleset (AbstractRuleSet): updated ruleset, its rules are the candidate rules
+        X (pd.DataFrame): dataset features
+        y (pd.Series): dataset target
+        coverage_matrix (np.ndarray): coverage matrix of the ruleset
+        measure (Optional[Callable[[Coverage], float]]): rule quality measure
+    """
+
+    def __init__(
+        self,
+        ruleset: AbstractRuleSet,
+        X: pd.DataFrame,
+        y: pd.Series,
+        coverage_matrix: np.ndarray,
+        measure: Optional[Callable[[Coverage], float]],
+    ):
+        self.ruleset: AbstractRuleSet = ruleset
+        self.coverage_matrix: np.ndarray = coverage_matrix
+        self.measure: Optional[Callable[[Coverage], float]] = measure
+        self.remaining: np.ndarray = np.ones(
+            coverage_matrix.shape[0], dtype=bool)
+        self.covered_counts: np.ndarray = np.count_nonzero(
+            coverage_matrix, axis=0)
+        self._initialize(X, y)
+
+    def remove_examples(self, examples_indices: np.ndarray):
+        """Removes examples from the dataset and updates rules statistics.
+
+        Args:
+            examples_indices (np.ndarray): indices of the removed examples
+        """
+        self.remaining[examples_indices] = False
+        removed_coverage_matrix: np.ndarray = self.coverage_matrix[examples_indices]
+        self.covered_counts -= np.count_nonzero(
+            removed_coverage_matrix, axis=0)
+        self._remove_examples(examples_indices, removed_coverage_matrix)
+
+    @abstractmethod
+    def _initialize(self, X: pd.DataFrame, y: pd.Series):
+        pass
+
+    @abstractmethod
+    def _remove_examples(
+        self,
+        examples_indices: np.ndarray,
+        removed_coverage_matrix: np.ndarray,
+    ):
+        pass
+
+    @abstractmethod
+    def calculate_weights(self, rules_indices: np.ndarray) -> np.ndarray:
+        """Calculates voting weights of rules on the remaining examples, the same as
+        the ones calculated by `ruleset.update` called on the remaining examples.
+
+        Args:
+            rules_indices (np.ndarray): indices of rules
+
+        Returns:
+            np.ndarray: voting weights
+        """
+
+    def _calculate_measure(
+        self,
+        p: np.ndarray,
+        n: np.ndarray,
+        P: np.ndarray,  # pylint: disable=invalid-name
+        N: np.ndarray,  # pylint: disable=invalid-name
+    ) -> np.ndarray:
+        return calculate_measure(self.measure, p, n, P, N)
+
+
+class _ClassificationQualityCounter(_RulesQualityCounter):
+
+    def _initialize(self, X: pd.DataFrame, y: pd.Series):
+        rules_classes: np.ndarray = np.array(
+            [rule.conclusion.value for rule in self.ruleset.rules])
+        classes, codes = np.unique(
+            np.concatenate((np.asarray(y), rules_classes)), return_inverse=True
+        )
+        self._y_codes: np.ndarray = codes[:self.coverage_matrix.shape[0]]
+        self._rules_codes: np.ndarray = codes[self.coverage_matrix.shape[0]:]
+        self._classes_counts: np.ndarray = np.bincount(
+            self._y_codes, minlength=classes.shape[0])
+        positives_mask: np.ndarray = (
+            self._y_codes[:, np.newaxis] == self._rules_codes[np.newaxis, :]
+        )
+        self._p: np.ndarray = np.count_nonzero(
+            self.coverage_matrix & positives_mask, axis=0)
+        self._n: np.ndarray = self.covered_counts - self._p
+
+    def _remove_examples(
+        self,
+        examples_indices: np.ndarray,
+        removed_coverage_matrix: np.ndarray,
+    ):
+        removed_y_codes: np.ndarray = self._y_codes[examples_indices]
+        removed_p: np.ndarray = np.count_nonzero(
+            removed_coverage_matrix &
+            (removed_y_codes[:, np.newaxis] ==
+             self._rules_codes[np.newaxis, :]),
+            axis=0
+        )
+        self._p -= removed_p
+        self._n = self.covered_counts - self._p
+        self._classes_counts -= np.bincount(
+            removed_y_codes, minlength=self._classes_counts.shape[0])
+
+    def calculate_weights(self, rules_indices: np.ndarray) -> np.ndarray:
+        # pylint: disable=invalid-name
+        P: np.ndarray = self._classes_counts[self._rules_codes[rules_indices]]
+        N: np.ndarray = np.count_nonzero(
+            self.remaining) - P  # pylint: disable=invalid-name
+        return self._calculate_measure(
+            self._p[rules_indices], self._n[rules_indices], P, N
+        )
+
+
+class _RegressionQualityCounter(_RulesQualityCounter):
+
+    def _initialize(self, X: pd.DataFrame, y: pd.Series):
+        self._y: np.ndarray = np.asarray(y, dtype=float)
+        rules = self.ruleset.rules
+        self._fixed: np.ndarray = np.array(
+            [rule.conclusion.fixed for rule in rules], dtype=bool)
+        self._low: np.ndarray = np.array(
+            [rule.conclusion.low for rule in rules], dtype=float)
+        self._high: np.ndarray = np.array(
+            [rule.conclusion.high for rule in rules], dtype=float)
+        self._p: np.ndarray = np.array(
+            [rule.coverage.p for rule in rules], dtype=int)
+
+    def _remove_examples(
+        self,
+        examples_indices: np.ndarray,
+        removed_coverage_matrix: np.ndarray,
+    ):
+        # conclusions of rules which lost some covered examples are refitted
+        # on their remaining covered examples
+        for i in np.flatnonzero(removed_coverage_matrix.any(axis=0)):
+            covered_y: np.ndarray = self._y[self.coverage_matrix[:, i]
+                                            & self.remaining]
+            if covered_y.shape[0] == 0:
+                self._p[i] = 0
+                continue
+            if not self._fixed[i]:
+                # the same formulas as in `RegressionRule.update_conclusion_using_covered_y`
+                y_mean: float = np.mean(covered_y)
+                y_std: float = np.sqrt(
+                    (np.sum(np.square(covered_y)) /
+                     covered_y.shape[0]) - (y_mean * y_mean)
+                )
+                self._low[i] = y_mean - y_std
+                self._high[i] = y_mean + y_std
+            self._p[i] = np.count_nonzero(
+                (covered_y >= self._low[i]) & (covered_y <= self._high[i])
+            )
+
+    def calculate_weights(self, rules_indices: np.ndarray) -> np.ndarray:
+        remaining_y: np.ndarray = np.sort(self._y[self.remaining])
+        P: np.ndarray = (  # pylint: disable=invalid-name
+            np.searchsorted(remaining_y, self._high[rules_indices], side='right') -
+            np.searchsorted(remaining_y, self._low[rules_indices], side='left')
+        )
+        N: np.ndarray = remaining_y.shape[0] - \
+            P  # pylint: disable=invalid-name
+        p: np.ndarray = self._p[rules_indices]
+        n: np.ndarray = self.covered_counts[rules_indices] - p
+        return self._calculate_measure(p, n, P, N)
+
+
+class _SurvivalQualityCounter(_RulesQualityCounter):
+    """Voting weights of survival rules are log-rank tests comparing Kaplan-Meier
+    estimators of covered and uncovered examples. Instead of fitting estimators,
+    the counter keeps numbers of events and of all examples of each rule at every
+    distinct survival time.
+    """
+
+    def _initialize(self, X: pd.DataFrame, y: pd.Series):
+        survival_time: np.ndarray = np.asarray(
+            X[self.ruleset.survival_time_attr_name], dtype=float)
+        self._events_mask: np.ndarray = encode_survival_status(np.asarray(y))
+        _, self._times_indices = np.unique(survival_time, return_inverse=True)
+        times_count: int = int(self._times_indices.max()) + 1
+        self._all_counts: np.ndarray = np.bincount(
+            self._times_indices, minlength=times_count)
+        self._all_events_counts: np.ndarray = np.bincount(
+            self._times_indices[self._events_mask], minlength=times_count)
+        rules_count: int = self.coverage_matrix.shape[1]
+        self._counts: np.ndarray = np.zeros(
+            (rules_count, times_count), dtype=int)
+        self._events_counts: np.ndarray = np.zeros(
+            (rules_count, times_count), dtype=int)
+        self._update_counts(
+            np.arange(self.coverage_matrix.shape[0]), self.coverage_matrix, 1
+        )
+
+    def _update_counts(
+        self,
+        examples_indices: np.ndarray,
+        coverage_matrix: np.ndarray,
+        sign: int,
+    ):
+        examples, rules = np.nonzero(coverage_matrix)
+        times_indices: np.ndarray = self._times_indices[examples_indices][examples]
+        np.add.at(self._counts, (rules, times_indices), sign)
+        events_mask: np.ndarray = self._events_mask[examples_indices][examples]
+        np.add.at(
+            self._events_counts,
+            (rules[events_mask], times_indices[events_mask]),
+            sign
+        )
+
+    def _remove_examples(
+        self,
+        examples_indices: np.ndarray,
+        removed_coverage_matrix: np.ndarray,
+    ):
+        self._update_counts(examples_indices, removed_coverage_matrix, -1)
+        removed_times_indices: np.ndarray = self._times_indices[examples_indices]
+        np.subtract.at(self._all_counts, removed_times_indices, 1)
+        np.subtract.at(
+            self._all_events_counts,
+            removed_times_indices[self._events_mask[examples_indices]],
+            1
+        )
+
+    def calculate_weights(self, rules_indices: np.ndarray) -> np.ndarray:
+        covered_counts: np.ndarray = self._counts[rules_indices]
+        uncovered_counts: np.ndarray = self._all_counts - covered_counts
+        # only times with events contribute to the log-rank statistic
+        events_times: np.ndarray = self._all_events_counts > 0
+        m1: np.ndarray = self._events_counts[rules_indices][:, events_times]
+        m: np.ndarray = self._all_events_counts[events_times]
+        m2: np.ndarray = m - m1
+        n1: np.ndarray = self._calculate_at_risk_counts(covered_counts)[
+            :, events_times]
+        n2: np.ndarray = self._calculate_at_risk_counts(uncovered_counts)[
+            :, events_times]
+        n: np.ndarray = n1 + n2
+        n_2: np.ndarray = n * n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x: np.ndarray = np.sum(m2 - (n2 / n) * m, axis=1)
+            denominator: np.ndarray = n_2 * (n - 1)
+            y: np.ndarray = np.sum(np.where(
+                denominator == 0,
+                0.0,
+                (n1 * n2 * m * (n - m1 - m2)) /
+                np.where(denominator == 0, 1, denominator)
+            ), axis=1)
+            stats: np.ndarray = (x * x) / y
+        p_value: np.ndarray = 1 - chi2.cdf(stats, 1)
+        # log-rank of rules covering all or none of the examples is 1
+        # (see `KaplanMeierEstimator.compare_estimators`)
+        p_value[
+            (covered_counts.sum(axis=1) == 0) | (
+                uncovered_counts.sum(axis=1) == 0)
+        ] = 0.0
+        return 1 - p_value
+
+    @staticmethod
+    def _calculate_at_risk_counts(counts: np.ndarray) -> np.ndarray:
+        at_risk_counts: np.ndarray = np.cumsum(
+            counts[:, ::-1], axis=1)[:, ::-1]
+        # `KaplanMeierEstimator.get_at_risk_count_at` returns the number of examples
+        # at risk at the last time of the estimator for all the later times
+        last_times_indices: np.ndarray = counts.shape[1] - 1 - np.argmax(
+            counts[:, ::-1] > 0, axis=1)
+        last_counts: np.ndarray = counts[
+            np.arange(counts.shape[0]), last_times_indices]
+        return np.where(at_risk_counts == 0, last_counts[:, np.newaxis], at_risk_counts)
+
+
+QUALITY_COUNTERS = {
+    ClassificationRuleSet: _ClassificationQualityCounter,
+    RegressionRuleSet: _RegressionQualityCounter,
+    SurvivalRuleSet: _SurvivalQualityCounter,
+}
 
 
 def filter_ruleset_with_coverage(
@@ -14,55 +309,71 @@ def filter_ruleset_with_coverage(
         y: pd.Series,
         _loss: float,
         measure: Optional[Callable[[Coverage], float]],
+        budget: Optional[FilteringBudget] = None,
 ) -> AbstractRuleSet:
     """Filter ruleset using coverage algorithm.
 
+    The coverage matrix is calculated only once. In each iteration voting weights of
+    the remaining rules are calculated on the examples not covered by the already
+    selected rules, using rules statistics decremented by the examples covered by
+    the last selected rule. When the budget is exhausted, the rules selected so far
+    are returned (or the whole ruleset if no rule was selected).
+
     Args:
         ruleset (AbstractRuleSet): ruleset to filter
         X (pd.DataFrame): dataset features
         y (pd.Series): dataset target
         _loss (float): accepted loss of prediction quality (fraction) [only for compatibility]
         measure (Optional[Callable[[Coverage], float]]): rule quality measure (voting measure)
+        budget (Optional[FilteringBudget], optional): run time budget and progress
+            callback. Defaults to None (unlimited).
 
     Returns:
         AbstractRuleSet: filtered ruleset
     """
-    X_orig = X.copy()
-    y_orig = y.copy()
-
+    if budget is None:
+        budget = FilteringBudget()
     # create target filtered ruleset by copying the original
-    filtered_ruleset = deepcopy(ruleset)
-    new_rules = []
-    filtered_ruleset.rules = np.array(filtered_ruleset.rules)
-    # we iterate until there are no rules left
-    while len(filtered_ruleset.rules):
-        # calculate coverage matrix for the current version of ruleset and dataset
-        coverage_matrix = filtered_ruleset.update(X, y, measure).T
-        # remove rules which do not cover anything anymore
-        filtered_ruleset.rules = filtered_ruleset.rules[coverage_matrix.any(1)]
-        coverage_matrix = coverage_matrix[coverage_matrix.any(1)]
-        if not len(filtered_ruleset.rules):
-            # it may happen that we also run out of rules here
+    filtered_ruleset = ruleset.clone()
+    coverage_matrix: np.ndarray = filtered_ruleset.update(X, y, measure)
+    counter: _RulesQualityCounter = QUALITY_COUNTERS[type(filtered_ruleset)](
+        filtered_ruleset, X, y, coverage_matrix, measure
+    )
+    active: np.ndarray = np.ones(len(filtered_ruleset.rules), dtype=bool)
+    selected_rules_indices: list[int] = []
+    while True:
+        # skip rules which do not cover anything anymore
+        active &= counter.covered_counts > 0
+        if not active.any() or budget.is_exhausted():
             break
-        # calculate quality of each rule
-        rule_quality_scores = [
-            rule.voting_weight for rule in filtered_ruleset.rules]
-        # move the best-ranking rule from the original ruleset to the new rule list
-        best_rule_idx = np.argmax(rule_quality_scores)
-        best_rule = filtered_ruleset.rules[best_rule_idx]
-        new_rules.append(best_rule)
-        filtered_ruleset.rules = np.delete(
-            filtered_ruleset.rules, best_rule_idx)
+        # move the best-ranking rule to the selected rules
+        rules_indices: np.ndarray = np.flatnonzero(active)
+        # evaluate only as many rules as the budget allows
+        rules_indices = rules_indices[:budget.remaining_evaluations]
+        best_rule_index: int = int(
+            rules_indices[np.argmax(counter.calculate_weights(rules_indices))])
+        budget.count_evaluations(len(rules_indices))
+        selected_rules_indices.append(best_rule_index)
+        active[best_rule_index] = False
         # remove covered examples from the dataset
-        best_rule_mask = coverage_matrix[best_rule_idx]
-        X = X[~best_rule_mask]
-        y = y[~best_rule_mask]
+        counter.remove_examples(
+            np.flatnonzero(coverage_matrix[:, best_rule_index] & counter.remaining))
+        budget.report(
+            rules_kept=len(selected_rules_indices),
+            rules_removed=np.count_nonzero(
+                (counter.covered_counts == 0) & active),
+            score=None,
+        )
         # finish when all examples are covered
-        if not len(X):
+        if not counter.remaining.any():
             break
 
-    # prepare the new ruleset
-    filtered_ruleset.rules = new_rules
-    filtered_ruleset.update(X_orig, y_orig, measure)
+    # prepare the new ruleset, no rule is selected only when the budget is
+    # exhausted before the first evaluation, in such case the ruleset is returned
+    # unfiltered
+    if selected_rules_indices:
+        filtered_ruleset.rules = [
+            filtered_ruleset.rules[i] for i in selected_rules_indices]
+    filtered_ruleset.update(X, y, measure)
 
     return filtered_ruleset
@@ -1,12 +1,16 @@
-from copy import deepcopy
 from typing import Callable
 from typing import Optional
 
 import pandas as pd
 from decision_rules.core.coverage import Coverage
+from decision_rules.core.rule import AbstractRule
 from decision_rules.core.ruleset import AbstractRuleSet
-from decision_rules.filtering._helpers import calculate_ruleset_prediction_score
+from decision_rules.filtering._beam import filter_ruleset_with_beam
+from decision_rules.filtering._budget import FilteringBudget
 from decision_rules.filtering._helpers import split_and_sort_ruleset
+from decision_rules.filtering._scorers import calculate_ruleset_score
+from decision_rules.filtering._scorers import create_ruleset_scorer
+from decision_rules.filtering._scorers import RulesetScorer
 
 
 def filter_ruleset_with_forward(
@@ -15,8 +19,10 @@ def filter_ruleset_with_forward(
         y: pd.Series,
         loss: float,
         measure: Optional[Callable[[Coverage], float]],
+        budget: Optional[FilteringBudget] = None,
 ) -> AbstractRuleSet:
-    """Filter ruleset using forward algorithm.
+    """Filter ruleset using forward algorithm. When the budget is exhausted, the
+    rules added so far are returned (or the whole ruleset if no rule was added).
 
     Args:
         ruleset (AbstractRuleSet): ruleset to filter
@@ -24,13 +30,17 @@ def filter_ruleset_with_forward(
         y (pd.Series): dataset target
         loss (float): accepted loss of prediction quality (fraction)
         measure (Optional[Callable[[Coverage], float]]): rule quality measure (voting measure)
+        budget (Optional[FilteringBudget], optional): run time budget and progress
+            callback. Defaults to None (unlimited).
 
     Returns:
         AbstractRuleSet: filtered ruleset
     """
+    if budget is None:
+        budget = FilteringBudget()
     # get original ruleset score and calculate target score
     original_coverage_matrix = ruleset.update(X, y, measure)
-    original_ruleset_score = calculate_ruleset_prediction_score(
+    original_ruleset_score = calculate_ruleset_score(
         ruleset, X, y, original_coverage_matrix)
     if original_ruleset_score >= 0:
         target_score = original_ruleset_score * (1 - loss)
@@ -38,35 +48,79 @@ def filter_ruleset_with_forward(
         target_score = original_ruleset_score * (1 + loss)
 
     # copy the original ruleset to create the new target filtered ruleset
-    filtered_ruleset = deepcopy(ruleset)
+    filtered_ruleset = ruleset.clone()
     new_rules = split_and_sort_ruleset(
         filtered_ruleset, X, y, measure, ascending=True)
     filtered_ruleset.rules = new_rules
     coverage_matrix = filtered_ruleset.update(X, y, measure)
-    filtered_ruleset.rules = []
+    # scorer keeps the state of the filtered ruleset (initially without rules),
+    # it allows to evaluate ruleset with a given rule added updating only the
+    # examples covered by this rule
+    scorer = create_ruleset_scorer(filtered_ruleset, X, y, coverage_matrix)
     filtered_ruleset_score = float("-inf")
 
     # implement forward algorithm
-    added_rules = []
-    for i, rule in enumerate(new_rules):
-        # add a new rule and its index to lists
-        filtered_ruleset.rules.append(rule)
-        added_rules.append(i)
-        # select a subset of the coverage matrix corresponding to rules added so far
-        new_coverage_matrix = coverage_matrix[:, added_rules]
-        new_ruleset_score = calculate_ruleset_prediction_score(
-            filtered_ruleset, X, y, new_coverage_matrix)
+    for i in range(len(new_rules)):
+        if budget.is_exhausted():
+            break
+        new_ruleset_score = scorer.score_with(i)
+        budget.count_evaluations()
         # if the score is better, we keep the rule and update the score
         if new_ruleset_score > filtered_ruleset_score:
             filtered_ruleset_score = new_ruleset_score
-        # if not, we remove the rule again
-        else:
-            filtered_ruleset.rules.pop()
-            added_rules.pop()
+            scorer.add(i)
+        budget.report(
+            rules_kept=scorer.active_count,
+            rules_removed=i + 1 - scorer.active_count,
+            score=filtered_ruleset_score,
+        )
         # if the score is not worse than the original ruleset score, we stop
         if new_ruleset_score >= target_score:
             break
 
+    filtered_ruleset.rules = _get_result_rules(scorer, new_rules)
     filtered_ruleset.update(X, y, measure)
 
     return filtered_ruleset
+
+
+def filter_ruleset_with_greedy_forward(
+        ruleset: AbstractRuleSet,
+        X: pd.DataFrame,
+        y: pd.Series,
+        loss: float,
+        measure: Optional[Callable[[Coverage], float]],
+        n_jobs: Optional[int] = 1,
+        budget: Optional[FilteringBudget] = None,
+) -> AbstractRuleSet:
+    """Filter ruleset using greedy forward algorithm. Unlike the forward algorithm,
+    which considers rules in the order of their quality, in each step all remaining
+    rules are evaluated and the one improving prediction score the most is added.
+    When the budget is exhausted, the rules added so far are returned (or the whole
+    ruleset if no rule was added). It is the beam search algorithm with a single
+    partial ruleset kept in each step.
+
+    Args:
+        ruleset (AbstractRuleSet): ruleset to filter
+        X (pd.DataFrame): dataset features
+        y (pd.Series): dataset target
+        loss (float): accepted loss of prediction quality (fraction)
+        measure (Optional[Callable[[Coverage], float]]): rule quality measure (voting measure)
+        n_jobs (Optional[int], optional): number of processes used to evaluate
+            candidate rules in parallel, -1 means using all processors (see
+            `filter_ruleset_with_beam`). Results do not depend on this parameter.
+            Defaults to 1.
+        budget (Optional[FilteringBudget], optional): run time budget and progress
+            callback. Defaults to None (unlimited).
+
+    Returns:
+        AbstractRuleSet: filtered ruleset
+    """
+    return filter_ruleset_with_beam(
+        ruleset, X, y, loss, measure, beam_width=1, n_jobs=n_jobs, budget=budget)
+
+
+def _get_result_rules(scorer: RulesetScorer, rules: list[AbstractRule]) -> list[AbstractRule]:
+    # no rule is added only when the budget is exhausted before the first
+    # evaluation, in such case the ruleset is returned unfiltered
+    return scorer.active_rules if scorer.active_count > 0 else rules
@@ -5,8 +5,12 @@ from typing import Optional
 import pandas as pd
 from decision_rules.core.ruleset import AbstractRuleSet
 from decision_rules.filtering._backward import filter_ruleset_with_backward
+from decision_rules.filtering._beam import filter_ruleset_with_beam
+from decision_rules.filtering._budget import FilteringBudget
+from decision_rules.filtering._budget import FilteringProgress
 from decision_rules.filtering._coverage import filter_ruleset_with_coverage
 from decision_rules.filtering._forward import filter_ruleset_with_forward
+from decision_rules.filtering._forward import filter_ruleset_with_greedy_forward
 from decision_rules.helpers import get_measure_function_by_name
 from decision_rules.survival.ruleset import SurvivalRuleSet
 
@@ -15,12 +19,22 @@ class FilterAlgorithm(str, Enum):
     Coverage = "coverage"
     Forward = "forward"
     Backward = "backward"
+    GreedyForward = "greedy_forward"
+    Beam = "beam"
 
 
 FILTER_ALGORITHM_MAPPING = {
     FilterAlgorithm.Coverage: filter_ruleset_with_coverage,
     FilterAlgorithm.Forward: filter_ruleset_with_forward,
     FilterAlgorithm.Backward: filter_ruleset_with_backward,
+    FilterAlgorithm.GreedyForward: filter_ruleset_with_greedy_forward,
+    FilterAlgorithm.Beam: filter_ruleset_with_beam,
+}
+
+# algorithms evaluating many candidate rules at once, which can be done in parallel
+PARALLEL_FILTER_ALGORITHMS = {
+    FilterAlgorithm.GreedyForward,
+    FilterAlgorithm.Beam,
 }
 
 
@@ -31,6 +45,12 @@ def filter_ruleset(
         algorithm: FilterAlgorithm,
         loss: Optional[float],
         measure: Optional[Callable or str] = None,
+        n_jobs: Optional[int] = 1,
+        time_budget: Optional[float] = None,
+        max_evaluations: Optional[int] = None,
+        progress_callback: Optional[Callable[[
+            FilteringProgress], None]] = None,
+        beam_width: int = 5,
 ) -> AbstractRuleSet:
     """Filter ruleset using specified algorithm.
 
@@ -41,10 +61,29 @@ def filter_ruleset(
         algorithm (FilterAlgorithm): filtering algorithm to use
         loss (float): accepted loss of prediction quality (fraction)
         measure (Optional[Callable or str]): rule quality measure (voting measure) - a callable or a string (name)
+        n_jobs (Optional[int], optional): number of workers used by algorithms evaluating
+            many candidate rules at once (processes for greedy forward and beam), -1
+            means using all processors. Results do not depend on this parameter.
+            Defaults to 1.
+        time_budget (Optional[float], optional): maximum run time in seconds. When it
+            is exceeded, the best ruleset found so far is returned. The budget is
+            checked between evaluations of candidate rules, but not during the
+            setup of the algorithm (see `FilteringBudget`), so the actual run time
+            may exceed it. Defaults to None (unlimited).
+        max_evaluations (Optional[int], optional): maximum number of evaluations of
+            candidate rules. When it is reached, the best ruleset found so far is
+            returned. Defaults to None (unlimited).
+        progress_callback (Optional[Callable[[FilteringProgress], None]], optional):
+            function called after each step of the algorithm with the number of
+            evaluations, rules kept and removed so far, current prediction score (None
+            for coverage algorithm) and elapsed time. Defaults to None.
+        beam_width (int, optional): number of partial rulesets kept in each step of
+            the beam algorithm. Defaults to 5.
 
     Returns:
         AbstractRuleSet: filtered ruleset
     """
+    budget = FilteringBudget(time_budget, max_evaluations, progress_callback)
     if loss is None:
         loss = 1.0
     if measure is None and not isinstance(ruleset, SurvivalRuleSet):
@@ -52,4 +91,9 @@ def filter_ruleset(
             "Voting measure must be specified for classification and regression rulesets.")
     if measure is not None and isinstance(measure, str):
         measure = get_measure_function_by_name(measure)
-    return FILTER_ALGORITHM_MAPPING[algorithm](ruleset, X, y, loss, measure)
+    options: dict = {"budget": budget}
+    if algorithm in PARALLEL_FILTER_ALGORITHMS:
+        options["n_jobs"] = n_jobs
+    if algorithm == FilterAlgorithm.Beam:
+        options["beam_width"] = beam_width
+    return FILTER_ALGORITHM_MAPPING[algorithm](ruleset, X, y, loss, measure, **options)
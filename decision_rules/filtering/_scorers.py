@@ -0,0 +1,741 @@
+"""
+SCORERS OF RULESETS BEING FILTERED
+
+Filtering algorithms repeatedly evaluate prediction score of the ruleset with one
+rule added or removed. Scorers keep the state of such a ruleset (which of the
+candidate rules are currently active) and allow to evaluate candidate
+modifications without committing them.
+
+For rulesets using the voting prediction strategy with enabled default conclusion,
+incremental scorers are used. They keep per-example vote accumulators and current
+predictions, so adding or removing a rule only updates examples covered by it.
+For other rulesets the whole prediction is recalculated for every evaluated
+modification (the same as `calculate_ruleset_prediction_score`).
+
+Scores calculated by incremental scorers are the same as the ones calculated by
+`calculate_ruleset_prediction_score` up to floating point rounding of the vote sums.
+"""
+from __future__ import annotations
+
+import copy
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from decision_rules.classification.prediction import \
+    VotingPredictionStrategy as ClassificationVotingPredictionStrategy
+from decision_rules.classification.ruleset import ClassificationRuleSet
+from decision_rules.core.rule import AbstractRule
+from decision_rules.core.ruleset import AbstractRuleSet
+from decision_rules.filtering._helpers import calculate_ruleset_prediction_score
+from decision_rules.regression.prediction import \
+    VotingPredictionStrategy as RegressionVotingPredictionStrategy
+from decision_rules.regression.ruleset import RegressionRuleSet
+from decision_rules.survival.kaplan_meier import encode_survival_status
+from decision_rules.survival.kaplan_meier import KaplanMeierEstimator
+from decision_rules.survival.prediction import \
+    VotingPredictionStrategy as SurvivalVotingPredictionStrategy
+from decision_rules.survival.ruleset import SurvivalRuleSet
+
+# maximum number of elements of (examples x time grid) arrays created at once
+# when calculating contributions of examples to the integrated Brier score
+_CONTRIBUTIONS_ELEMENTS_COUNT: int = 2 ** 20
+
+
+class RulesetScorer(ABC):
+    """Evaluates prediction scores of a ruleset consisting of a subset of
+    candidate rules.
+
+    Args:
+        ruleset (AbstractRuleSet): updated ruleset, its rules are the candidate rules
+        x (pd.DataFrame): dataframe with the independent variables
+        y (pd.Series): series with the dependent variable
+        coverage_matrix (np.ndarray): coverage matrix of the ruleset
+        active (Optional[np.ndarray], optional): mask of initially active
+            rules. Defaults to None (no rules are active).
+    """
+
+    def __init__(
+        self,
+        ruleset: AbstractRuleSet,
+        x: pd.DataFrame,
+        y: pd.Series,
+        coverage_matrix: np.ndarray,
+        active: Optional[np.ndarray] = None,
+    ) -> None:
+        self.ruleset: AbstractRuleSet = ruleset
+        self.rules: list[AbstractRule] = list(ruleset.rules)
+        self.x: pd.DataFrame = x
+        self.y: pd.Series = y
+        self.coverage_matrix: np.ndarray = coverage_matrix
+        self.active: np.ndarray = np.zeros(len(self.rules), dtype=bool)
+        self._version: int = 0
+        self._last_change: Optional[tuple[int, int, int, Any]] = None
+        self._initialize()
+        if active is not None:
+            for i in np.flatnonzero(active):
+                self.add(i)
+
+    @property
+    def active_count(self) -> int:
+        """
+        Returns:
+            int: number of active rules
+        """
+        return int(np.count_nonzero(self.active))
+
+    @property
+    def active_rules(self) -> list[AbstractRule]:
+        """
+        Returns:
+            list[AbstractRule]: active rules in the order of candidate rules
+        """
+        return [self.rules[i] for i in np.flatnonzero(self.active)]
+
+    def score(self) -> float:
+        """
+        Returns:
+            float: prediction score of the ruleset consisting of active rules
+        """
+        if not self.active.any():
+            return float("-inf")
+        return self._calculate_current_score()
+
+    def score_with(self, rule_index: int) -> float:
+        """Evaluates the ruleset with given rule added without modifying the scorer.
+
+        Args:
+            rule_index (int): index of inactive candidate rule
+
+        Returns:
+            float: prediction score
+        """
+        return self._evaluate(rule_index, 1)
+
+    def score_without(self, rule_index: int) -> float:
+        """Evaluates the ruleset with given rule removed without modifying the scorer.
+
+        Args:
+            rule_index (int): index of active candidate rule
+
+        Returns:
+            float: prediction score
+        """
+        return self._evaluate(rule_index, -1)
+
+    def copy(self) -> RulesetScorer:
+        """Creates a copy of the scorer which can be modified independently. Data
+        shared by all states of the scorer (e.g. coverage matrix) is not copied.
+
+        Returns:
+            RulesetScorer: copy of the scorer
+        """
+        scorer: RulesetScorer = copy.copy(self)
+        scorer.active = self.active.copy()
+        scorer._last_change = None
+        self._copy_state(scorer)
+        return scorer
+
+    def add(self, rule_index: int):
+        """Activates given rule.
+
+        Args:
+            rule_index (int): index of inactive candidate rule
+        """
+        self._apply(rule_index, 1)
+
+    def remove(self, rule_index: int):
+        """Deactivates given rule.
+
+        Args:
+            rule_index (int): index of active candidate rule
+        """
+        self._apply(rule_index, -1)
+
+    def _evaluate(self, rule_index: int, sign: int) -> float:
+        if self.active[rule_index] == (sign > 0):
+            raise ValueError(
+                f'Rule {rule_index} is already {"active" if sign > 0 else "inactive"}'
+            )
+        if self.active_count + sign == 0:
+            return float("-inf")
+        version: int = self._version
+        score, change = self._calculate_change(rule_index, sign)
+        self._last_change = (version, rule_index, sign, change)
+        return score
+
+    def _apply(self, rule_index: int, sign: int):
+        if self.active[rule_index] == (sign > 0):
+            raise ValueError(
+                f'Rule {rule_index} is already {"active" if sign > 0 else "inactive"}'
+            )
+        last_change = self._last_change
+        if last_change is not None and last_change[:3] == (self._version, rule_index, sign):
+            change = last_change[3]
+        else:
+            _, change = self._calculate_change(rule_index, sign)
+        self._apply_change(rule_index, sign, change)
+        self.active[rule_index] = sign > 0
+        self._version += 1
+        self._last_change = None
+
+    def _initialize(self):
+        """Initializes the state of the scorer with no active rules."""
+
+    def _copy_state(self, scorer: RulesetScorer):
+        """Copies mutable state of the scorer to its shallow copy."""
+
+    @abstractmethod
+    def _calculate_current_score(self) -> float:
+        """Calculates score of the ruleset consisting of active rules."""
+
+    @abstractmethod
+    def _calculate_change(self, rule_index: int, sign: int) -> tuple[float, Any]:
+        """Calculates score and the change of the scorer state caused by adding
+        (sign = 1) or removing (sign = -1) given rule. It must not modify the scorer.
+        """
+
+    @abstractmethod
+    def _apply_change(self, rule_index: int, sign: int, change: Any):
+        """Applies change calculated by `_calculate_change` method."""
+
+
+class PredictionRulesetScorer(RulesetScorer):
+    """Scorer performing the whole prediction for every evaluated ruleset.
+    """
+
+    def _calculate_current_score(self) -> float:
+        return self._calculate_score(self.active)
+
+    def _calculate_change(self, rule_index: int, sign: int) -> tuple[float, Any]:
+        active: np.ndarray = self.active.copy()
+        active[rule_index] = sign > 0
+        return self._calculate_score(active), None
+
+    def _apply_change(self, rule_index: int, sign: int, change: Any):
+        pass
+
+    def _calculate_score(self, active: np.ndarray) -> float:
+        indices: np.ndarray = np.flatnonzero(active)
+        # shallow copy allows to evaluate many rulesets simultaneously
+        ruleset: AbstractRuleSet = copy.copy(self.ruleset)
+        ruleset.rules = [self.rules[i] for i in indices]
+        return calculate_ruleset_prediction_score(
+            ruleset, self.x, self.y, self.coverage_matrix[:, indices]
+        )
+
+
+class _IncrementalRulesetScorer(RulesetScorer):
+    """Base class for scorers updating only examples covered by added or removed
+    rules.
+    """
+
+    def _initialize(self):
+        self._covered_rows: dict[int, np.ndarray] = {}
+
+    def _get_covered_rows(self, rule_index: int) -> np.ndarray:
+        if rule_index not in self._covered_rows:
+            self._covered_rows[rule_index] = np.flatnonzero(
+                self.coverage_matrix[:, rule_index]
+            )
+        return self._covered_rows[rule_index]
+
+
+class ClassificationVotingRulesetScorer(_IncrementalRulesetScorer):
+    """Incremental scorer of classification rulesets using voting prediction
+    strategy. It keeps sums of votes for each decision class, current predictions
+    and numbers of correctly predicted examples of each class, which allows
+    to update balanced accuracy using only examples covered by the changed rule.
+    """
+
+    def _initialize(self):
+        super()._initialize()
+        y_values: np.ndarray = np.asarray(self.y)
+        self._y_classes, self._y_encoded = np.unique(
+            y_values, return_inverse=True)
+        y_classes_indices: dict[Any, int] = {
+            value: i for i, value in enumerate(self._y_classes)
+        }
+        self._true_counts: np.ndarray = np.bincount(
+            self._y_encoded, minlength=len(self._y_classes))
+
+        # decision classes are ordered the same as in the voting prediction strategy
+        rules_classes, self._rules_classes = np.unique(
+            np.array([rule.conclusion.value for rule in self.rules]),
+            return_inverse=True
+        )
+        self._classes_to_y: np.ndarray = np.array([
+            y_classes_indices.get(value, -1) for value in rules_classes
+        ], dtype=int)
+        self._default_prediction: int = y_classes_indices.get(
+            self.ruleset.default_conclusion.value, -1)
+        self._weights: np.ndarray = np.array(
+            [rule.voting_weight for rule in self.rules], dtype=float)
+
+        examples_count: int = y_values.shape[0]
+        classes_count: int = len(rules_classes)
+        self._votes: np.ndarray = np.zeros(
+            (examples_count, classes_count), dtype=float)
+        self._votes_counts: np.ndarray = np.zeros(
+            (examples_count, classes_count), dtype=int)
+        self._classes_rules_counts: np.ndarray = np.zeros(
+            classes_count, dtype=int)
+        self._prediction: np.ndarray = np.full(
+            examples_count, self._default_prediction, dtype=int)
+        self._correct_counts: np.ndarray = self._count_correct(
+            self._y_encoded, self._prediction)
+
+    def _count_correct(self, y_encoded: np.ndarray, prediction: np.ndarray) -> np.ndarray:
+        return np.bincount(
+            y_encoded[y_encoded == prediction], minlength=len(self._y_classes)
+        )
+
+    def _copy_state(self, scorer: RulesetScorer):
+        scorer._votes = self._votes.copy()
+        scorer._votes_counts = self._votes_counts.copy()
+        scorer._classes_rules_counts = self._classes_rules_counts.copy()
+        scorer._prediction = self._prediction.copy()
+        scorer._correct_counts = self._correct_counts.copy()
+
+    def _calculate_current_score(self) -> float:
+        return self._calculate_balanced_accuracy(self._correct_counts)
+
+    def _calculate_balanced_accuracy(self, correct_counts: np.ndarray) -> float:
+        return float(np.mean(correct_counts / self._true_counts))
+
+    def _calculate_change(self, rule_index: int, sign: int) -> tuple[float, Any]:
+        class_index: int = self._rules_classes[rule_index]
+        classes_rules_counts: np.ndarray = self._classes_rules_counts.copy()
+        classes_rules_counts[class_index] += sign
+        present_classes: np.ndarray = classes_rules_counts > 0
+        if present_classes[class_index] == (self._classes_rules_counts[class_index] > 0):
+            rows: np.ndarray = self._get_covered_rows(rule_index)
+            votes: np.ndarray = self._votes[rows]
+            votes_counts: np.ndarray = self._votes_counts[rows, class_index]
+            votes[:, class_index] += sign * self._weights[rule_index]
+            votes_counts = votes_counts + sign
+        else:
+            # set of decision classes taking part in voting changes, which may
+            # change predictions of all examples
+            rows = slice(None)
+            votes = self._votes.copy()
+            votes_counts = self._votes_counts[:, class_index].copy()
+            covered_rows: np.ndarray = self._get_covered_rows(rule_index)
+            votes[covered_rows, class_index] += sign * \
+                self._weights[rule_index]
+            votes_counts[covered_rows] += sign
+        # reset votes of examples not covered by any rule of the class to avoid
+        # accumulation of rounding errors
+        votes[votes_counts == 0, class_index] = 0.0
+
+        prediction: np.ndarray = self._predict(votes, present_classes)
+        y_encoded: np.ndarray = self._y_encoded[rows]
+        correct_counts: np.ndarray = (
+            self._correct_counts
+            - self._count_correct(y_encoded, self._prediction[rows])
+            + self._count_correct(y_encoded, prediction)
+        )
+        change = (rows, votes, votes_counts, prediction, correct_counts)
+        return self._calculate_balanced_accuracy(correct_counts), change
+
+    def _predict(self, votes: np.ndarray, present_classes: np.ndarray) -> np.ndarray:
+        best_classes: np.ndarray = np.argmax(
+            np.where(present_classes, votes, -np.inf), axis=1)
+        prediction: np.ndarray = self._classes_to_y[best_classes]
+        not_covered_examples_mask: np.ndarray = np.all(
+            np.isclose(votes[:, present_classes], 0.0), axis=1)
+        prediction[not_covered_examples_mask] = self._default_prediction
+        return prediction
+
+    def _apply_change(self, rule_index: int, sign: int, change: Any):
+        rows, votes, votes_counts, prediction, correct_counts = change
+        class_index: int = self._rules_classes[rule_index]
+        self._votes[rows] = votes
+        self._votes_counts[rows, class_index] = votes_counts
+        self._prediction[rows] = prediction
+        self._correct_counts = correct_counts
+        self._classes_rules_counts[class_index] += sign
+
+
+class RegressionVotingRulesetScorer(_IncrementalRulesetScorer):
+    """Incremental scorer of regression rulesets using voting prediction
+    strategy. It keeps weighted sums of rules conclusions, sums of weights and
+    squared errors of current predictions, which allows to update mean squared
+    error using only examples covered by the changed rule.
+    """
+
+    def _initialize(self):
+        super()._initialize()
+        self._y_values: np.ndarray = np.asarray(self.y, dtype=float)
+        self._weights: np.ndarray = np.array(
+            [rule.voting_weight for rule in self.rules], dtype=float)
+        self._results: np.ndarray = np.array(
+            [rule.conclusion.value * rule.voting_weight for rule in self.rules],
+            dtype=float
+        )
+        self._default_prediction: float = self.ruleset.default_conclusion.value
+
+        examples_count: int = self._y_values.shape[0]
+        self._results_sums: np.ndarray = np.zeros(examples_count, dtype=float)
+        self._weights_sums: np.ndarray = np.zeros(examples_count, dtype=float)
+        self._votes_counts: np.ndarray = np.zeros(examples_count, dtype=int)
+        self._squared_errors: np.ndarray = (
+            self._y_values - self._default_prediction) ** 2
+        self._squared_errors_sum: float = np.sum(self._squared_errors)
+
+    def _copy_state(self, scorer: RulesetScorer):
+        scorer._results_sums = self._results_sums.copy()
+        scorer._weights_sums = self._weights_sums.copy()
+        scorer._votes_counts = self._votes_counts.copy()
+        scorer._squared_errors = self._squared_errors.copy()
+
+    def _calculate_current_score(self) -> float:
+        return -(self._squared_errors_sum / self._squared_errors.shape[0])
+
+    def _calculate_change(self, rule_index: int, sign: int) -> tuple[float, Any]:
+        rows: np.ndarray = self._get_covered_rows(rule_index)
+        results_sums: np.ndarray = (
+            self._results_sums[rows] + sign * self._results[rule_index])
+        weights_sums: np.ndarray = (
+            self._weights_sums[rows] + sign * self._weights[rule_index])
+        votes_counts: np.ndarray = self._votes_counts[rows] + sign
+        # reset sums of examples not covered by any rule to avoid accumulation
+        # of rounding errors
+        not_covered_mask: np.ndarray = votes_counts == 0
+        results_sums[not_covered_mask] = 0.0
+        weights_sums[not_covered_mask] = 0.0
+
+        prediction: np.ndarray = np.full(
+            rows.shape[0], self._default_prediction, dtype=float)
+        predict_mask: np.ndarray = weights_sums > 0
+        prediction[predict_mask] = (
+            results_sums[predict_mask] / weights_sums[predict_mask])
+        squared_errors: np.ndarray = (self._y_values[rows] - prediction) ** 2
+        squared_errors_sum: float = self._squared_errors_sum + (
+            np.sum(squared_errors) - np.sum(self._squared_errors[rows])
+        )
+        change = (rows, results_sums, weights_sums,
+                  votes_counts, squared_errors, squared_errors_sum)
+        return -(squared_errors_sum / self._squared_errors.shape[0]), change
+
+    def _apply_change(self, rule_index: int, sign: int, change: Any):
+        (
+            rows, results_sums, weights_sums,
+            votes_counts, squared_errors, squared_errors_sum
+        ) = change
+        self._results_sums[rows] = results_sums
+        self._weights_sums[rows] = weights_sums
+        self._votes_counts[rows] = votes_counts
+        self._squared_errors[rows] = squared_errors
+        self._squared_errors_sum = squared_errors_sum
+
+
+class SurvivalVotingRulesetScorer(_IncrementalRulesetScorer):
+    """Incremental scorer of survival rulesets using voting prediction strategy.
+    It keeps sums of survival curves of rules covering each example and numbers of
+    those rules, which allows to update integrated Brier score (IBS) using only
+    examples covered by the changed rule.
+
+    Survival curves of rules and of the default conclusion are step functions,
+    so they are evaluated only on a shared time grid consisting of the times at
+    which any of them changes (their event times). IBS (as calculated by
+    `SurvivalRuleSet.integrated_bier_score`) is a sum of contributions of examples.
+    Contribution of the example with survival time T and survival curve S is:
+
+        sum over times t >= T: d(t) * S(t)^2 / G(T) (only for examples with event)
+        + sum over times t < T: d(t) * (1 - S(t))^2 / G(t)
+
+    where sums are over distinct survival times of examples, d(t) is the distance
+    from the previous time and G is the Kaplan-Meier estimator of censoring
+    distribution. Since S is constant between grid points, both sums are
+    calculated as sums over the grid with precomputed sums of d(t) / G(t) within
+    grid intervals.
+
+    Sums of survival curves are stored only for examples covered by any of the
+    candidate rules, but they still take (covered examples x grid size) floats,
+    e.g. 8000 examples with 2000 distinct event times take about 128 MB. Copies
+    of the scorer share them until one of the copies is modified.
+    """
+
+    def _initialize(self):
+        super()._initialize()
+        survival_time: np.ndarray = np.asarray(
+            self.x[self.ruleset.survival_time_attr_name], dtype=float)
+        events_mask: np.ndarray = encode_survival_status(np.asarray(self.y))
+        times, times_indices = np.unique(survival_time, return_inverse=True)
+        self._max_time: float = times[-1]
+
+        default_estimator: KaplanMeierEstimator = (
+            self.ruleset.default_conclusion.estimator)
+        # survival curves are constant between the times at which they change,
+        # which allows to evaluate them only on a grid of those times (starting
+        # with the first survival time)
+        grid: np.ndarray = np.unique(np.concatenate(
+            [times[:1], self._get_change_times(default_estimator)] +
+            [self._get_change_times(rule.conclusion.estimator)
+             for rule in self.rules]
+        ))
+        grid = grid[(grid >= times[0]) & (grid <= times[-1])]
+        self._rules_probabilities: np.ndarray = np.array([
+            rule.conclusion.estimator.get_probabilities_at(grid)
+            for rule in self.rules
+        ], dtype=float).reshape(len(self.rules), grid.shape[0])
+        self._default_probabilities: np.ndarray = (
+            default_estimator.get_probabilities_at(grid))
+
+        censoring_estimator: KaplanMeierEstimator = (
+            # pylint: disable=protected-access
+            self.ruleset._stored_default_conclusion.estimator.reverse()
+        )
+        times_weights: np.ndarray = np.diff(times, prepend=0.0)
+        censoring_probabilities: np.ndarray = censoring_estimator.get_probabilities_at(
+            times)
+        positive_mask: np.ndarray = censoring_probabilities > 0
+        times_censoring_weights: np.ndarray = np.zeros(
+            times.shape[0], dtype=float)
+        times_censoring_weights[positive_mask] = (
+            times_weights[positive_mask] / censoring_probabilities[positive_mask])
+
+        # grid interval of each time and sums of weights within intervals
+        times_intervals: np.ndarray = np.searchsorted(
+            grid, times, side='right') - 1
+        self._intervals_weights: np.ndarray = np.bincount(
+            times_intervals, weights=times_weights, minlength=grid.shape[0])
+        self._intervals_censoring_weights: np.ndarray = np.bincount(
+            times_intervals, weights=times_censoring_weights, minlength=grid.shape[0])
+        # weights of the examples time interval, split at the examples time
+        weights_cumsum: np.ndarray = np.concatenate(
+            ([0.0], np.cumsum(times_weights)))
+        censoring_weights_cumsum: np.ndarray = np.concatenate(
+            ([0.0], np.cumsum(times_censoring_weights)))
+        intervals_starts: np.ndarray = np.searchsorted(
+            times_intervals, np.arange(grid.shape[0]), side='left')
+        intervals_ends: np.ndarray = np.searchsorted(
+            times_intervals, np.arange(grid.shape[0]), side='right')
+        self._examples_intervals: np.ndarray = times_intervals[times_indices]
+        self._examples_weights_after: np.ndarray = (
+            weights_cumsum[intervals_ends[self._examples_intervals]] -
+            weights_cumsum[times_indices]
+        )
+        self._examples_censoring_weights_before: np.ndarray = (
+            censoring_weights_cumsum[times_indices] -
+            censoring_weights_cumsum[intervals_starts[self._examples_intervals]]
+        )
+        self._examples_events_weights: np.ndarray = np.where(
+            events_mask & positive_mask[times_indices],
+            1.0 / np.where(positive_mask, censoring_probabilities,
+                           1.0)[times_indices],
+            0.0
+        )
+
+        examples_count: int = survival_time.shape[0]
+        # examples not covered by any rule always have the default survival
+        # curve, so sums are stored only for the covered ones
+        covered_examples: np.ndarray = np.flatnonzero(
+            np.any(self.coverage_matrix, axis=1))
+        self._sums_positions: np.ndarray = np.full(
+            examples_count, -1, dtype=int)
+        self._sums_positions[covered_examples] = np.arange(
+            covered_examples.shape[0])
+        self._probabilities_sums: np.ndarray = np.zeros(
+            (covered_examples.shape[0], grid.shape[0]), dtype=float)
+        # probabilities sums are shared with copies of the scorer until one of
+        # them is modified
+        self._probabilities_sums_shared: bool = False
+        self._votes_counts: np.ndarray = np.zeros(examples_count, dtype=int)
+        self._contributions: np.ndarray = self._calculate_contributions(
+            slice(None),
+            np.broadcast_to(self._default_probabilities,
+                            (examples_count, grid.shape[0]))
+        )
+        self._contributions_sum: float = np.sum(self._contributions)
+
+    @staticmethod
+    def _get_change_times(estimator: KaplanMeierEstimator) -> np.ndarray:
+        times: np.ndarray = np.asarray(estimator.times, dtype=float)
+        probabilities: np.ndarray = np.asarray(
+            estimator.probabilities, dtype=float)
+        return times[np.diff(probabilities, prepend=1.0) != 0.0]
+
+    def _calculate_contributions(self, rows: Any, probabilities: np.ndarray) -> np.ndarray:
+        # examples are processed in chunks to limit the size of temporary arrays
+        rows_indices: np.ndarray = np.arange(
+            self._examples_intervals.shape[0])[rows]
+        contributions: np.ndarray = np.empty(
+            rows_indices.shape[0], dtype=float)
+        chunk_size: int = max(
+            1, _CONTRIBUTIONS_ELEMENTS_COUNT // max(1, probabilities.shape[1]))
+        for start in range(0, rows_indices.shape[0], chunk_size):
+            end: int = start + chunk_size
+            contributions[start:end] = self._calculate_chunk_contributions(
+                rows_indices[start:end], probabilities[start:end])
+        return contributions
+
+    def _calculate_chunk_contributions(
+        self,
+        rows: np.ndarray,
+        probabilities: np.ndarray
+    ) -> np.ndarray:
+        grid_indices: np.ndarray = np.arange(
+            probabilities.shape[1])[np.newaxis, :]
+        intervals: np.ndarray = self._examples_intervals[rows][:, np.newaxis]
+        survived_weights: np.ndarray = np.where(
+            grid_indices > intervals,
+            self._intervals_weights,
+            np.where(
+                grid_indices == intervals,
+                self._examples_weights_after[rows][:, np.newaxis],
+                0.0
+            )
+        )
+        at_risk_weights: np.ndarray = np.where(
+            grid_indices < intervals,
+            self._intervals_censoring_weights,
+            np.where(
+                grid_indices == intervals,
+                self._examples_censoring_weights_before[rows][:, np.newaxis],
+                0.0
+            )
+        )
+        return (
+            self._examples_events_weights[rows] *
+            np.sum(survived_weights * np.square(probabilities), axis=1) +
+            np.sum(at_risk_weights * np.square(1.0 - probabilities), axis=1)
+        )
+
+    def _calculate_ibs(self, contributions_sum: float) -> float:
+        return contributions_sum / (self._contributions.shape[0] * self._max_time)
+
+    def _copy_state(self, scorer: RulesetScorer):
+        self._probabilities_sums_shared = True
+        scorer._probabilities_sums = self._probabilities_sums
+        scorer._probabilities_sums_shared = True
+        scorer._votes_counts = self._votes_counts.copy()
+        scorer._contributions = self._contributions.copy()
+
+    def _calculate_current_score(self) -> float:
+        return -self._calculate_ibs(self._contributions_sum)
+
+    def _calculate_change(self, rule_index: int, sign: int) -> tuple[float, Any]:
+        rows: np.ndarray = self._get_covered_rows(rule_index)
+        probabilities_sums: np.ndarray = (
+            self._probabilities_sums[self._sums_positions[rows]] +
+            sign * self._rules_probabilities[rule_index]
+        )
+        votes_counts: np.ndarray = self._votes_counts[rows] + sign
+        # reset sums of examples not covered by any rule to avoid accumulation
+        # of rounding errors
+        not_covered_mask: np.ndarray = votes_counts == 0
+        probabilities_sums[not_covered_mask] = 0.0
+
+        probabilities: np.ndarray = np.empty(
+            probabilities_sums.shape, dtype=float)
+        probabilities[not_covered_mask] = self._default_probabilities
+        probabilities[~not_covered_mask] = (
+            probabilities_sums[~not_covered_mask] /
+            votes_counts[~not_covered_mask, np.newaxis]
+        )
+        contributions: np.ndarray = self._calculate_contributions(
+            rows, probabilities)
+        contributions_sum: float = self._contributions_sum + (
+            np.sum(contributions) - np.sum(self._contributions[rows])
+        )
+        change = (rows, probabilities_sums, votes_counts,
+                  contributions, contributions_sum)
+        return -self._calculate_ibs(contributions_sum), change
+
+    def _apply_change(self, rule_index: int, sign: int, change: Any):
+        (
+            rows, probabilities_sums, votes_counts,
+            contributions, contributions_sum
+        ) = change
+        if self._probabilities_sums_shared:
+            self._probabilities_sums = self._probabilities_sums.copy()
+            self._probabilities_sums_shared = False
+        sums_positions: np.ndarray = self._sums_positions[rows]
+        self._probabilities_sums[sums_positions] = probabilities_sums
+        self._votes_counts[rows] = votes_counts
+        self._contributions[rows] = contributions
+        self._contributions_sum = contributions_sum
+
+
+INCREMENTAL_SCORERS = {
+    ClassificationRuleSet: (
+        ClassificationVotingPredictionStrategy, ClassificationVotingRulesetScorer
+    ),
+    RegressionRuleSet: (
+        RegressionVotingPredictionStrategy, RegressionVotingRulesetScorer
+    ),
+    SurvivalRuleSet: (
+        SurvivalVotingPredictionStrategy, SurvivalVotingRulesetScorer
+    ),
+}
+
+
+def create_ruleset_scorer(
+        ruleset: AbstractRuleSet,
+        x: pd.DataFrame,
+        y: pd.Series,
+        coverage_matrix: np.ndarray,
+        active: Optional[np.ndarray] = None,
+) -> RulesetScorer:
+    """Creates scorer of the ruleset being filtered. Incremental scorer is used
+    if it is available for the ruleset type and its prediction strategy.
+
+    Args:
+        ruleset (AbstractRuleSet): updated ruleset, its rules are the candidate rules
+        x (pd.DataFrame): dataframe with the independent variables
+        y (pd.Series): series with the dependent variable
+        coverage_matrix (np.ndarray): coverage matrix of the ruleset
+        active (Optional[np.ndarray], optional): mask of initially active
+            rules. Defaults to None (no rules are active).
+
+    Returns:
+        RulesetScorer: scorer
+    """
+    scorer_class = PredictionRulesetScorer
+    if type(ruleset) in INCREMENTAL_SCORERS:
+        strategy_class, incremental_scorer_class = (
+            INCREMENTAL_SCORERS[type(ruleset)]
+        )
+        used_strategy_class = (
+            ruleset._prediction_strategy_class  # pylint: disable=protected-access
+            or ruleset.get_default_prediction_strategy_class()
+        )
+        default_conclusion = ruleset.default_conclusion
+        if (
+            used_strategy_class is strategy_class and
+            default_conclusion is not None and
+            not default_conclusion.is_empty()
+        ):
+            scorer_class = incremental_scorer_class
+    return scorer_class(ruleset, x, y, coverage_matrix, active)
+
+
+def calculate_ruleset_score(
+        ruleset: AbstractRuleSet,
+        x: pd.DataFrame,
+        y: pd.Series,
+        coverage_matrix: np.ndarray,
+) -> float:
+    """Calculates prediction score of the whole ruleset using its scorer. It is
+    the same as `calculate_ruleset_prediction_score`, but incremental scorers
+    avoid recalculating the whole prediction (e.g. integrated Brier score of
+    survival rulesets, which takes time quadratic in the number of examples).
+
+    Args:
+        ruleset (AbstractRuleSet): updated ruleset
+        x (pd.DataFrame): dataframe with the independent variables
+        y (pd.Series): series with the dependent variable
+        coverage_matrix (np.ndarray): coverage matrix of the ruleset
+
+    Returns:
+        float: prediction score
+    """
+    return create_ruleset_scorer(
+        ruleset, x, y, coverage_matrix,
+        active=np.ones(len(ruleset.rules), dtype=bool)
+    ).score()
@@ -1,4 +1,6 @@
 from .dataset_transformer import ConditionalDatasetTransformer
+from .measures import calculate_measure
 from .measures import get_measure_function_by_name
+from .measures import get_vectorized_measure
 from .p_values import correct_p_values_fdr
 from .p_values import get_significant_fraction
@@ -2,17 +2,28 @@ from __future__ import annotations
 
 import re
 from typing import Callable
+from typing import Optional
+
+import numpy as np
 
 from decision_rules import measures
+from decision_rules import vectorized_measures
 from decision_rules.core.coverage import Coverage
 
 
-def get_measure_function_by_name(measure_name: str) -> Callable[[Coverage], float]:
+def get_measure_function_by_name(
+    measure_name: str,
+    vectorized: bool = False
+) -> Callable[[Coverage], float]:
     """Returns function that calculates quality measure for given measure name
 
     Args:
         measure_name (str): Name of the quality measure in snake case or
             camel case
+        vectorized (bool, optional): If True, returns vectorized version of the
+            measure from `decision_rules.vectorized_measures` module which takes
+            arrays of p, n, P, N values instead of a single coverage.
+            Defaults to False.
 
     Raises:
         ValueError: If measure is not supported by the package
@@ -26,13 +37,74 @@ def get_measure_function_by_name(measure_name: str) -> Callable[[Coverage], floa
     # special case
     if len(sanitized_measure_name) == 2:
         sanitized_measure_name = sanitized_measure_name.replace('_', '')
+    measures_module = vectorized_measures if vectorized else measures
     is_supported: bool = (
-        hasattr(measures, sanitized_measure_name) and
-        callable(getattr(measures, sanitized_measure_name))
+        not sanitized_measure_name.startswith('_') and
+        hasattr(measures_module, sanitized_measure_name) and
+        callable(getattr(measures_module, sanitized_measure_name))
     )
     if not is_supported:
         raise ValueError(
             f'Measure "{measure_name}" is not supported by decision rules package'
         )
     else:
-        return getattr(measures, sanitized_measure_name)
+        return getattr(measures_module, sanitized_measure_name)
+
+
+def get_vectorized_measure(
+    measure: Callable[[Coverage], float]
+) -> Optional[Callable[..., np.ndarray]]:
+    """Returns vectorized version of the given quality measure function from
+    `decision_rules.vectorized_measures` module.
+
+    Args:
+        measure (Callable[[Coverage], float]): quality measure function
+
+    Returns:
+        Optional[Callable[..., np.ndarray]]: vectorized measure taking arrays of
+            p, n, P, N values or None if given function is not one of the measures
+            from `decision_rules.measures` module (e.g. custom user function).
+    """
+    name: Optional[str] = getattr(measure, '__name__', None)
+    if name is None or name.startswith('_') or getattr(measures, name, None) is not measure:
+        return None
+    return getattr(vectorized_measures, name, None)
+
+
+def calculate_measure(
+    measure: Callable[[Coverage], float],
+    p: np.ndarray,
+    n: np.ndarray,
+    P: np.ndarray,  # pylint: disable=invalid-name
+    N: np.ndarray,  # pylint: disable=invalid-name
+) -> np.ndarray:
+    """Calculates quality measure for many coverages at once. Measures from
+    `decision_rules.measures` are calculated using their vectorized versions and
+    only the values which vectorized version failed to compute (inf or nan) are
+    calculated again by the measure itself. Custom measures are calculated
+    coverage by coverage.
+
+    Args:
+        measure (Callable[[Coverage], float]): quality measure function
+        p (np.ndarray): p values of coverages
+        n (np.ndarray): n values of coverages
+        P (np.ndarray): P values of coverages
+        N (np.ndarray): N values of coverages
+
+    Returns:
+        np.ndarray: measure values
+    """
+    p, n, P, N = np.broadcast_arrays(p, n, P, N)
+    vectorized_measure: Optional[Callable[..., np.ndarray]] = get_vectorized_measure(
+        measure
+    )
+    if vectorized_measure is None:
+        values: np.ndarray = np.empty(shape=p.shape, dtype=float)
+        indices: np.ndarray = np.arange(p.shape[0])
+    else:
+        values = np.array(vectorized_measure(p, n, P, N), dtype=float)
+        indices = np.flatnonzero(~np.isfinite(values))
+    for i in indices:
+        values[i] = measure(
+            Coverage(int(p[i]), int(n[i]), int(P[i]), int(N[i])))
+    return values
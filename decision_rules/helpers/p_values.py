@@ -1,34 +1,202 @@
-def correct_p_values_fdr(p_values: list) -> list:
+"""
+Contains functions for calculating and adjusting p-values of many rules at once.
+"""
+from typing import Callable
+from typing import Union
+
+import numpy as np
+from scipy.stats import chi2
+from scipy.stats import hypergeom
+
+
+def correct_p_values_fdr(p_values: Union[list, np.ndarray]) -> list:
     """ Adjust p-values using the False Discovery Rate (FDR) method.
 
     Args:
-        p_values (list): List of p-values to be adjusted.
+        p_values (Union[list, np.ndarray]): List of p-values to be adjusted.
 
     Returns:
         list: List of adjusted p-values, maintaining the original order.
     """
-    N = len(p_values)
-    p_values_with_index = [(pvalue, i) for i, pvalue in enumerate(p_values)]
-    p_values_sorted = sorted(p_values_with_index)
-    adjusted_p_values = [None] * N
+    p_values = np.asarray(p_values, dtype=float)
+    N = p_values.shape[0]
+    # stable sort keeps original order of equal p-values
+    order: np.ndarray = np.argsort(p_values, kind='stable')
+    adjusted_p_values: np.ndarray = np.empty(shape=N, dtype=float)
+    adjusted_p_values[order] = p_values[order] * N / np.arange(1, N + 1)
+    return adjusted_p_values.tolist()
+
+
+def _binary_search(
+    function: Callable[[np.ndarray], np.ndarray],
+    value: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray
+) -> np.ndarray:
+    """Vectorized version of the binary search used by `scipy.stats.fisher_exact`.
+    For each element it finds index i between lo and hi such that
+    function(i) <= value < function(i + 1), assuming function values are
+    ascending in this range.
+    """
+    lo = lo.copy()
+    hi = hi.copy()
+    result: np.ndarray = np.full(shape=lo.shape, fill_value=-1, dtype=np.int64)
+    found: np.ndarray = np.zeros(shape=lo.shape, dtype=bool)
+    active: np.ndarray = lo < hi
+    while np.any(active):
+        mid: np.ndarray = lo + (hi - lo) // 2
+        mid_values: np.ndarray = function(mid)
+        lower_mask: np.ndarray = active & (mid_values < value)
+        higher_mask: np.ndarray = active & (mid_values > value)
+        equal_mask: np.ndarray = active & ~lower_mask & ~higher_mask
+        lo[lower_mask] = mid[lower_mask] + 1
+        hi[higher_mask] = mid[higher_mask] - 1
+        result[equal_mask] = mid[equal_mask]
+        found |= equal_mask
+        active = ~found & (lo < hi)
+    return np.where(found, result, np.where(function(lo) <= value, lo, lo - 1))
+
+
+def fisher_exact_p_values(
+    p: np.ndarray,
+    n: np.ndarray,
+    P: np.ndarray,  # pylint: disable=invalid-name
+    N: np.ndarray,  # pylint: disable=invalid-name
+) -> np.ndarray:
+    """Calculates two-sided Fisher's exact test p-values for many rules at once.
+    For each rule the test is performed on its confusion matrix
+    [[p, n], [P - p, N - n]]. Results are the same as given by
+    `scipy.stats.fisher_exact`, but computed using vectorized hypergeometric
+    distribution functions instead of calling the test separately for each rule.
+
+    Args:
+        p (np.ndarray): positive covered examples
+        n (np.ndarray): negative covered examples
+        P (np.ndarray): all positive examples
+        N (np.ndarray): all negative examples
+
+    Returns:
+        np.ndarray: p-values
+    """
+    # pylint: disable=invalid-name
+    p, n, P, N = np.broadcast_arrays(
+        *[np.asarray(value, dtype=np.int64) for value in (p, n, P, N)]
+    )
+    c00, c01, c10, c11 = p, n, P - p, N - n
+    p_values: np.ndarray = np.ones(shape=p.shape, dtype=float)
+    # if both values in a row or column are zero, the p-value is 1
+    mask: np.ndarray = ~(
+        (c00 + c10 == 0) | (c01 + c11 == 0) |
+        (c00 + c01 == 0) | (c10 + c11 == 0)
+    )
+    c00 = c00[mask]
+    n1: np.ndarray = (c00 + c01[mask])
+    n2: np.ndarray = (c10[mask] + c11[mask])
+    n: np.ndarray = c00 + c10[mask]
+    M: np.ndarray = n1 + n2
+
+    def pmf(x: np.ndarray) -> np.ndarray:
+        return hypergeom.pmf(x, M, n1, n)
 
-    k = 1
-    for p_value, index in p_values_sorted:
-        adj_p = p_value * N / k
-        adjusted_p_values[index] = adj_p
-        k += 1
-    return adjusted_p_values
+    mode: np.ndarray = ((n + 1) * (n1 + 1) / (n1 + n2 + 2)).astype(np.int64)
+    p_exact: np.ndarray = pmf(c00)
+    p_mode: np.ndarray = pmf(mode)
+    epsilon: float = 1e-14
+    gamma: float = 1 + epsilon
+    with np.errstate(divide='ignore', invalid='ignore'):
+        equal_mask: np.ndarray = (
+            np.abs(p_exact - p_mode) / np.maximum(p_exact, p_mode) <= epsilon
+        )
+    lower_mask: np.ndarray = ~equal_mask & (c00 < mode)
+    upper_mask: np.ndarray = ~equal_mask & ~lower_mask
+
+    result: np.ndarray = np.ones(shape=c00.shape, dtype=float)
+    if np.any(lower_mask):
+        result[lower_mask] = _fisher_exact_tail_p_values(
+            c00[lower_mask], M[lower_mask], n1[lower_mask], n[lower_mask],
+            mode[lower_mask], p_exact[lower_mask] * gamma, lower=True
+        )
+    if np.any(upper_mask):
+        result[upper_mask] = _fisher_exact_tail_p_values(
+            c00[upper_mask], M[upper_mask], n1[upper_mask], n[upper_mask],
+            mode[upper_mask], p_exact[upper_mask] * gamma, lower=False
+        )
+    p_values[mask] = np.minimum(result, 1.0)
+    return p_values
+
+
+def _fisher_exact_tail_p_values(
+    c00: np.ndarray,
+    M: np.ndarray,  # pylint: disable=invalid-name
+    n1: np.ndarray,
+    n: np.ndarray,
+    mode: np.ndarray,
+    threshold: np.ndarray,
+    lower: bool
+) -> np.ndarray:
+    def pmf(x: np.ndarray) -> np.ndarray:
+        return hypergeom.pmf(x, M, n1, n)
+
+    if lower:
+        p_values: np.ndarray = hypergeom.cdf(c00, M, n1, n)
+        search_mask: np.ndarray = ~(pmf(n) > threshold)
+    else:
+        p_values: np.ndarray = hypergeom.sf(c00 - 1, M, n1, n)
+        search_mask: np.ndarray = ~(pmf(np.zeros_like(n)) > threshold)
+    if not np.any(search_mask):
+        return p_values
+
+    M, n1, n = M[search_mask], n1[search_mask], n[search_mask]
+    mode, threshold = mode[search_mask], threshold[search_mask]
+
+    def searched_pmf(x: np.ndarray) -> np.ndarray:
+        return hypergeom.pmf(x, M, n1, n)
+
+    if lower:
+        guess: np.ndarray = _binary_search(
+            lambda x: -searched_pmf(x), -threshold, mode, n)
+        p_values[search_mask] += hypergeom.sf(guess, M, n1, n)
+    else:
+        guess: np.ndarray = _binary_search(
+            searched_pmf, threshold, np.zeros_like(mode), mode)
+        p_values[search_mask] += hypergeom.cdf(guess, M, n1, n)
+    return p_values
+
+
+def chi2_variance_p_values(
+    covered_count: np.ndarray,
+    covered_y_std: np.ndarray,
+    y_std: float
+) -> np.ndarray:
+    """Calculates regression rules p-values based on X2 test comparing label
+    variance of covered examples with the label variance on the whole dataset.
+
+    Args:
+        covered_count (np.ndarray): number of examples covered by each rule
+        covered_y_std (np.ndarray): standard deviation of label of examples
+            covered by each rule
+        y_std (float): standard deviation of label on the whole dataset
+
+    Returns:
+        np.ndarray: p-values
+    """
+    covered_count = np.asarray(covered_count, dtype=float)
+    factor: np.ndarray = np.asarray(covered_y_std, dtype=float) / y_std
+    t: np.ndarray = (covered_count - 1) * (factor *
+                                           factor)  # pylint: disable=invalid-name
+    return chi2.cdf(t, df=covered_count - 1)
 
 
-def get_significant_fraction(p_values: list[float], significance_level: float) -> float:
+def get_significant_fraction(p_values: Union[list[float], np.ndarray], significance_level: float) -> float:
     """Calculates the fraction of significant rules based on the p-values.
 
     Args:
-        p_values (list[float]): List of p-values.
+        p_values (Union[list[float], np.ndarray]): List of p-values.
         significance_level (float): The significance level.
 
     Returns:
         float: The fraction of significant rules.
     """
-    significant_rules_count = sum(p < significance_level for p in p_values)
-    return significant_rules_count / len(p_values)
+    p_values = np.asarray(p_values, dtype=float)
+    significant_rules_count = np.count_nonzero(p_values < significance_level)
+    return significant_rules_count / p_values.shape[0]
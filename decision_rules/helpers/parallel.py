@@ -0,0 +1,182 @@
+"""
+Contains helpers for running computations in parallel worker processes.
+"""
+from __future__ import annotations
+
+import os
+from multiprocessing import shared_memory
+from typing import Optional
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+def get_workers_count(n_jobs: Optional[int]) -> int:
+    """
+    Args:
+        n_jobs (Optional[int]): number of workers, None means no parallelism and
+            -1 means using all processors
+
+    Raises:
+        ValueError: if n_jobs is 0 or lower than -1
+
+    Returns:
+        int: number of workers
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError(
+            f'n_jobs should be a positive integer, -1 or None, got: {n_jobs}'
+        )
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    return n_jobs
+
+
+class SharedArray:
+    """Numpy array stored in a shared memory block, so it can be passed to worker
+    processes without copying it. Pickling the object transfers only the name of
+    the memory block and the array is attached to it in the worker process.
+
+    The process creating the array owns the memory block and should release it
+    with `close` after all workers finished.
+
+    Args:
+        array (np.ndarray): array to copy into shared memory, it cannot contain
+            Python objects
+    """
+
+    def __init__(self, array: np.ndarray) -> None:
+        self._shm: shared_memory.SharedMemory = shared_memory.SharedMemory(
+            create=True, size=max(array.nbytes, 1)
+        )
+        self._owner: bool = True
+        self.array: np.ndarray = np.ndarray(
+            array.shape, dtype=array.dtype, buffer=self._shm.buf
+        )
+        self.array[...] = array
+
+    def __getstate__(self) -> dict:
+        return {
+            'name': self._shm.name,
+            'shape': self.array.shape,
+            'dtype': self.array.dtype,
+        }
+
+    def __setstate__(self, state: dict):
+        self._shm = shared_memory.SharedMemory(name=state['name'])
+        self._owner = False
+        self.array = np.ndarray(
+            state['shape'], dtype=state['dtype'], buffer=self._shm.buf
+        )
+
+    def close(self):
+        """Detaches the array from the shared memory block and frees the block
+        if this process owns it.
+        """
+        self.array = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+class SharedData:
+    """Numpy array, pandas series or dataframe with numeric values placed in
+    shared memory (see `SharedArray`), so it can be passed to worker processes
+    without copying them. Values of other types (e.g. nominal attributes values)
+    and index of pandas objects are copied to worker processes.
+
+    The process creating the object owns the memory blocks and should release them
+    with `close` after all workers finished.
+
+    Args:
+        data (Union[np.ndarray, pd.Series, pd.DataFrame]): data to share
+    """
+
+    def __init__(self, data: Union[np.ndarray, pd.Series, pd.DataFrame]) -> None:
+        self._shared_arrays: list[SharedArray] = []
+        self._index: Optional[pd.Index] = None
+        self._labels = None
+        if isinstance(data, pd.DataFrame):
+            self._index = data.index
+            self._labels = data.columns
+            self._values = [
+                self._share_values(data.iloc[:, i]) for i in range(data.shape[1])
+            ]
+        elif isinstance(data, pd.Series):
+            self._index = data.index
+            self._labels = data.name
+            self._values = self._share_values(data)
+        else:
+            self._values = self._share_values(data)
+
+    def _share_values(
+        self,
+        values: Union[np.ndarray, pd.Series]
+    ) -> Union[SharedArray, np.ndarray, pd.Series]:
+        # pandas extension types (e.g. categorical) are copied as they are
+        if not isinstance(values.dtype, np.dtype) or values.dtype.hasobject:
+            return values
+        array: SharedArray = SharedArray(np.asarray(values))
+        self._shared_arrays.append(array)
+        return array
+
+    def _get_series(self, values: Union[SharedArray, pd.Series], name=None) -> pd.Series:
+        if isinstance(values, SharedArray):
+            return pd.Series(values.array, index=self._index, name=name, copy=False)
+        return values
+
+    def get(self) -> Union[np.ndarray, pd.Series, pd.DataFrame]:
+        """
+        Returns:
+            Union[np.ndarray, pd.Series, pd.DataFrame]: shared data, arrays and
+                series are views of the shared memory
+        """
+        if self._index is None:
+            return get_array(self._values)
+        if not isinstance(self._values, list):
+            return self._get_series(self._values, self._labels)
+        frame: pd.DataFrame = pd.DataFrame(
+            dict(enumerate(map(self._get_series, self._values))),
+            index=self._index
+        )
+        frame.columns = self._labels
+        return frame
+
+    def close(self):
+        """Detaches the data from the shared memory blocks and frees them if
+        this process owns them.
+        """
+        for array in self._shared_arrays:
+            array.close()
+
+
+def share_array(array: np.ndarray) -> Union[SharedArray, np.ndarray]:
+    """Places array in shared memory if possible. Arrays of Python objects (e.g.
+    nominal attributes values) cannot be shared and are returned unchanged, so
+    they are copied to worker processes.
+
+    Args:
+        array (np.ndarray): array
+
+    Returns:
+        Union[SharedArray, np.ndarray]: shared array or the original array
+    """
+    if array.dtype.hasobject:
+        return array
+    return SharedArray(array)
+
+
+def get_array(array: Union[SharedArray, np.ndarray]) -> np.ndarray:
+    """
+    Args:
+        array (Union[SharedArray, np.ndarray]): array returned by `share_array`
+
+    Returns:
+        np.ndarray: numpy array
+    """
+    if isinstance(array, SharedArray):
+        return array.array
+    return array
@@ -4,12 +4,12 @@ Contains ConditionImportance class for determining importances of condtions in R
 from __future__ import annotations
 
 from typing import Callable
+from typing import Optional
 
 import numpy as np
 from decision_rules.classification.rule import ClassificationRule
-from decision_rules.conditions import CompoundCondition
 from decision_rules.core.coverage import Coverage
-from decision_rules.core.rule import AbstractCondition
+from decision_rules.core.ruleset import AbstractRuleSet
 from decision_rules.importances._core import AbstractRuleSetConditionImportances
 from decision_rules.importances._core import ConditionImportance
 
@@ -18,11 +18,21 @@ class ClassificationRuleSetConditionImportances(AbstractRuleSetConditionImportan
     """Classification ConditionImportance allowing to determine importances of condtions in RuleSet
     """
 
+    def __init__(self, ruleset: AbstractRuleSet, n_jobs: Optional[int] = 1):
+        super().__init__(ruleset, n_jobs)
+        self._labels_masks: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
     def calculate_importances(self, X: np.array, y: np.array, measure: Callable[[Coverage], float]) -> dict[str, dict[str, float]]:
         """Calculate importances of conditions in RuleSet
         """
         rules_by_class = self._split_rules_by_decision_class(
             self.ruleset.rules)
+        self._labels_masks: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        # indices are calculated for rules of all classes at once, so that
+        # worker processes are created only once
+        rules_indices = self._calculate_rules_indices(
+            self.ruleset.rules, X, y, measure)
 
         condition_importances_for_classes = {}
 
@@ -30,8 +40,8 @@ class ClassificationRuleSetConditionImportances(AbstractRuleSetConditionImportan
 
             conditions_with_rules = self._get_conditions_with_rules(
                 class_rules)
-            conditions_importances = self._calculate_conditions_importances(
-                conditions_with_rules, X, y, measure
+            conditions_importances = self._sum_rules_indices(
+                conditions_with_rules, rules_indices
             )
             condition_importances_for_classes[class_name] = conditions_importances
 
@@ -49,41 +59,12 @@ class ClassificationRuleSetConditionImportances(AbstractRuleSetConditionImportan
             rules_by_class[rule.conclusion.value].append(rule)
         return rules_by_class
 
-    def _calculate_index_simplified(self, condition: AbstractCondition, rule: ClassificationRule, X: np.ndarray, y: np.ndarray, measure: Callable[[Coverage], float]) -> float:
-        number_of_conditions = len(rule.premise.subconditions)
-        premise_without_evaluated_condition = rule.premise.remove_condition_recursively(condition)
-
-        factor = 1.0 / number_of_conditions
-        if premise_without_evaluated_condition is None or len(premise_without_evaluated_condition.subconditions) == 0:
-            empty_premise = CompoundCondition(subconditions=[], logic_operator=rule.premise.logic_operator)
-            rule_without_evaluated_condition = ClassificationRule(
-                empty_premise,
-                conclusion=rule.conclusion,
-                column_names=rule.column_names
-            )
-            return factor * (
-                self._calculate_measure(rule, X, y, measure)
-                - self._calculate_measure(rule_without_evaluated_condition, X, y, measure)
-            )
-        else:
-            rule_without_evaluated_condition = ClassificationRule(
-                premise_without_evaluated_condition,
-                conclusion=rule.conclusion,
-                column_names=rule.column_names
-            )
-            premise_with_only_evaluated_condition = CompoundCondition(
-                subconditions=[condition], logic_operator=rule.premise.logic_operator)
-
-            rule_with_only_evaluated_condition = ClassificationRule(
-                premise_with_only_evaluated_condition,
-                conclusion=rule.conclusion,
-                column_names=rule.column_names
-            )
-            return factor * (
-                self._calculate_measure(rule, X, y, measure)
-                - self._calculate_measure(rule_without_evaluated_condition, X, y, measure)
-                + self._calculate_measure(rule_with_only_evaluated_condition, X, y, measure)
-            )
+    def _get_labels_masks(self, rule: ClassificationRule, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # labels masks depend only on the decision class
+        if rule.conclusion.value not in self._labels_masks:
+            self._labels_masks[rule.conclusion.value] = super(
+            )._get_labels_masks(rule, y)
+        return self._labels_masks[rule.conclusion.value]
 
     def _prepare_importances(self, conditions_importances: dict[str, list[ConditionImportance]]) -> dict[str, list[dict]]:
         conditions_importances_sorted = {}
@@ -5,15 +5,27 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Callable
+from typing import Optional
+from typing import Union
 
 import numpy as np
 
 from decision_rules.core.coverage import Coverage
 from decision_rules.core.rule import AbstractCondition, AbstractRule
 from decision_rules.core.ruleset import AbstractRuleSet
+from decision_rules.helpers.parallel import get_array
+from decision_rules.helpers.parallel import get_workers_count
+from decision_rules.helpers.parallel import share_array
+from decision_rules.helpers.parallel import SharedArray
+from decision_rules.importances._core.masks import PremiseMask
+from decision_rules.importances._core.masks import PremiseMasksEngine
+
+# state of worker processes calculating indices of conditions, set once per
+# process by _initialize_worker
+_worker_state: dict = {}
 
 
 @dataclass
@@ -27,10 +39,24 @@ class AbstractRuleSetConditionImportances(ABC):
     """Abstract ConditionImportance allowing to determine importances of condtions in RuleSet
     """
 
-    def __init__(self, ruleset: AbstractRuleSet):
+    def __init__(self, ruleset: AbstractRuleSet, n_jobs: Optional[int] = 1):
         """Constructor method
+
+        Args:
+            ruleset (AbstractRuleSet): ruleset
+            n_jobs (Optional[int], optional): number of processes used to calculate
+                indices of conditions in different rules in parallel. None or 1
+                means no parallelism, -1 means using all processors. Numeric
+                datasets are shared with the processes without copying, the measure
+                has to be picklable (e.g. a function from `decision_rules.measures`).
+                Results do not depend on this parameter. Defaults to 1.
+
+        Raises:
+            ValueError: if n_jobs is 0 or lower than -1
         """
-        self.ruleset = deepcopy(ruleset)
+        get_workers_count(n_jobs)
+        self.ruleset = ruleset.clone()
+        self.n_jobs: Optional[int] = n_jobs
 
     def calculate_importances(self, X: np.array, y: np.array, measure: Callable[[Coverage], float]) -> dict[str, dict[str, float]]:
         """Calculate importances of conditions in RuleSet
@@ -70,23 +96,132 @@ class AbstractRuleSetConditionImportances(ABC):
 
 
     def _calculate_conditions_importances(self, conditions_with_rules: dict[str, list[AbstractRule]],  X: np.ndarray, y: np.ndarray, measure: Callable[[Coverage], float]) -> list[ConditionImportance]:
+        rules: dict[int, AbstractRule] = {}
+        for condition_rules in conditions_with_rules.values():
+            for rule in condition_rules:
+                rules.setdefault(id(rule), rule)
+        rules_indices = self._calculate_rules_indices(
+            list(rules.values()), X, y, measure)
+        return self._sum_rules_indices(conditions_with_rules, rules_indices)
+
+    def _sum_rules_indices(self, conditions_with_rules: dict[str, list[AbstractRule]], rules_indices: dict[int, dict[AbstractCondition, float]]) -> list[ConditionImportance]:
+        """Calculates importances of conditions by summing their indices in
+        all the rules containing them.
+        """
         conditions_importances = []
         for condition, rules in conditions_with_rules.items():
             indices_sum: float = sum(
-                self._calculate_index_simplified(
-                    condition, rule, X, y, measure
-                ) for rule in rules
+                rules_indices[id(rule)][condition] for rule in rules
             )
             conditions_importances.append(ConditionImportance(condition, indices_sum))
 
         return conditions_importances
 
-    @abstractmethod
-    def _calculate_index_simplified(self, condition: AbstractCondition, rule: AbstractRule, X: np.ndarray, y: np.ndarray, measure: Callable[[Coverage], float]) -> float:
-        pass
+    def _calculate_rules_indices(self, rules: list[AbstractRule], X: np.ndarray, y: np.ndarray, measure: Callable[[Coverage], float]) -> dict[int, dict[AbstractCondition, float]]:
+        """Calculates simplified indices of all conditions in all given rules. Instead
+        of building rules without evaluated condition and rules consisting only of it,
+        their covered examples masks are derived from the masks of atomic conditions,
+        each evaluated only once for each rule.
 
-    def _calculate_measure(self, rule: AbstractRule, X: np.ndarray, y: np.ndarray, measure: Callable[[Coverage], float]):
-        return measure(rule.calculate_coverage(X, y))
+        Rules can be processed in parallel (see `n_jobs` parameter), conditions of
+        a single rule are always processed by the same process as calculating
+        their indices may temporarily modify the rule (e.g. regression conclusion).
+        Worker processes and shared datasets are created once per call, so all
+        the rules should be passed at once.
+
+        Returns:
+            dict[int, dict[AbstractCondition, float]]: indices of conditions for
+                every rule (identified by its id)
+        """
+        rules: dict[int, AbstractRule] = {id(rule): rule for rule in rules}
+        workers_count: int = min(get_workers_count(self.n_jobs), len(rules))
+        if workers_count <= 1:
+            engine = PremiseMasksEngine(X)
+            return {
+                rule_id: self._calculate_rule_indices(rule, engine, y, measure)
+                for rule_id, rule in rules.items()
+            }
+        # worker processes have their own copies of the ruleset, so rules are
+        # identified by their positions in it
+        rules_positions: dict[int, int] = {
+            id(rule): i for i, rule in enumerate(self.ruleset.rules)
+        }
+        shared_arrays: list = [share_array(X), share_array(y)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers_count,
+                initializer=_initialize_worker,
+                # the ruleset is unpickled first, so its module imports the
+                # importances modules in the same order as in this process
+                initargs=(self.ruleset, self, *shared_arrays, measure)
+            ) as executor:
+                # results are collected in the submission order, so they are
+                # identical to the serial ones
+                rules_indices_list = list(executor.map(
+                    _calculate_worker_rule_indices,
+                    [rules_positions[rule_id] for rule_id in rules]
+                ))
+        finally:
+            for array in shared_arrays:
+                if isinstance(array, SharedArray):
+                    array.close()
+        return {
+            rule_id: dict(zip(
+                self._get_all_atomic_conditions_from(
+                    rule.premise), rule_indices
+            ))
+            for (rule_id, rule), rule_indices in zip(rules.items(), rules_indices_list)
+        }
+
+    def _calculate_rule_indices(self, rule: AbstractRule, engine: PremiseMasksEngine, y: np.ndarray, measure: Callable[[Coverage], float]) -> dict[AbstractCondition, float]:
+        """Calculates simplified indices of all conditions of the given rule.
+        """
+        conditions = self._get_all_atomic_conditions_from(rule.premise)
+        premise_mask, variants_masks = engine.calculate_premise_masks(
+            rule.premise, conditions)
+        factor = 1.0 / len(rule.premise.subconditions)
+        rule_quality = self._calculate_measure_from_mask(
+            rule, premise_mask, y, measure)
+        empty_rule_quality = None
+        indices = {}
+        for condition, (without_condition_mask, only_condition_mask) in zip(conditions, variants_masks):
+            if without_condition_mask is None:
+                if empty_rule_quality is None:
+                    empty_rule_quality = self._calculate_measure_from_mask(
+                        rule, engine.empty_premise_mask(), y, measure)
+                indices[condition] = factor * (
+                    rule_quality - empty_rule_quality
+                )
+            else:
+                indices[condition] = factor * (
+                    rule_quality
+                    - self._calculate_measure_from_mask(rule, without_condition_mask, y, measure)
+                    + self._calculate_measure_from_mask(rule, only_condition_mask, y, measure)
+                )
+        return indices
+
+    def _calculate_measure_from_mask(self, rule: AbstractRule, premise_mask: PremiseMask, y: np.ndarray, measure: Callable[[Coverage], float]) -> float:
+        """Calculates measure of the rule with premise covering examples specified by
+        the mask.
+        """
+        return measure(self._calculate_coverage_from_mask(
+            rule, premise_mask.covered_mask, y))
+
+    def _calculate_coverage_from_mask(self, rule: AbstractRule, covered_mask: np.ndarray, y: np.ndarray) -> Coverage:
+        positives_mask, negatives_mask = self._get_labels_masks(rule, y)
+        P = np.count_nonzero(positives_mask)  # pylint: disable=invalid-name
+        N = y.shape[0] - P  # pylint: disable=invalid-name
+        p = np.count_nonzero(positives_mask & covered_mask)
+        n = np.count_nonzero(negatives_mask & covered_mask)
+        return Coverage(p, n, P, N)
+
+    def _get_labels_masks(self, rule: AbstractRule, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns:
+            tuple[np.ndarray, np.ndarray]: positive and negative examples masks
+                of the rule
+        """
+        return rule.conclusion.positives_mask(y), rule.conclusion.negatives_mask(y)
 
     def _prepare_importances(self, conditions_importances: list[ConditionImportance]) -> list[dict]:
 
@@ -109,3 +244,30 @@ class AbstractRuleSetConditionImportances(ABC):
             conditions_importances_list, key=lambda x: x["importance"], reverse=True)
 
         return conditions_importances_list
+
+
+def _initialize_worker(
+    ruleset: AbstractRuleSet,  # pylint: disable=unused-argument
+    importances: AbstractRuleSetConditionImportances,
+    X: Union[SharedArray, np.ndarray],
+    y: Union[SharedArray, np.ndarray],
+    measure: Callable[[Coverage], float]
+):
+    # shared arrays are kept in the state, so their memory stays attached
+    _worker_state['shared_arrays'] = (X, y)
+    _worker_state['importances'] = importances
+    _worker_state['engine'] = PremiseMasksEngine(get_array(X))
+    _worker_state['y'] = get_array(y)
+    _worker_state['measure'] = measure
+
+
+def _calculate_worker_rule_indices(rule_position: int) -> list[float]:
+    importances: AbstractRuleSetConditionImportances = _worker_state['importances']
+    indices: dict[AbstractCondition, float] = importances._calculate_rule_indices(  # pylint: disable=protected-access
+        importances.ruleset.rules[rule_position],
+        _worker_state['engine'],
+        _worker_state['y'],
+        _worker_state['measure']
+    )
+    # indices are ordered as atomic conditions of the rule
+    return list(indices.values())
@@ -0,0 +1,288 @@
+"""
+Contains mask algebra engine used for calculating condition importances
+without rebuilding rules and reevaluating their premises.
+"""
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from decision_rules.conditions import CompoundCondition
+from decision_rules.conditions import LogicOperators
+from decision_rules.core.condition import AbstractCondition
+
+
+class PremiseMask:
+    """Examples covered by a (possibly modified) rule premise. Equivalent of
+    premise `_calculate_covered_mask`, `covered_mask` and `_calculate_uncovered_mask`
+    results without building the premise object.
+
+    Args:
+        engine (PremiseMasksEngine): engine which calculated the mask
+        raw_covered_mask (np.ndarray): mask of covered examples before applying
+            the premise negation
+        attributes (frozenset[int]): attributes used by the premise
+        negated (bool, optional): whether the premise is negated. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        engine: PremiseMasksEngine,
+        raw_covered_mask: np.ndarray,
+        attributes: frozenset[int],
+        negated: bool = False
+    ) -> None:
+        self.engine: PremiseMasksEngine = engine
+        self.raw_covered_mask: np.ndarray = raw_covered_mask
+        self.attributes: frozenset[int] = attributes
+        self.negated: bool = negated
+
+    @cached_property
+    def raw_uncovered_mask(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: mask of examples not covered by the premise before
+                applying its negation, only examples without missing values
+                of premise attributes are taken into account
+        """
+        return (
+            np.logical_not(self.raw_covered_mask) &
+            self.engine.valid_examples_mask(self.attributes)
+        )
+
+    @property
+    def covered_mask(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: mask of examples covered by the premise
+        """
+        if self.negated:
+            return self.raw_uncovered_mask
+        return self.raw_covered_mask
+
+
+class PremiseMasksEngine:
+    """Calculates masks of examples covered by a rule premise and by its variants
+    with removed atomic conditions. Each atomic condition of the premise is
+    evaluated only once. Premises without a given condition are derived from
+    prefix and suffix products (conjunctions or alternatives) of the premise
+    top level subconditions masks instead of being rebuilt and reevaluated.
+    Semantics of removing conditions are the same as in
+    `AbstractCondition.remove_condition_recursively`.
+
+    Args:
+        X (np.ndarray): dataset
+    """
+
+    def __init__(self, X: np.ndarray) -> None:
+        self.X: np.ndarray = X
+        self._columns_valid_masks: dict[int, np.ndarray] = {}
+        self._valid_examples_masks: dict[frozenset[int], np.ndarray] = {}
+
+    def valid_examples_mask(self, attributes: frozenset[int]) -> np.ndarray:
+        """
+        Args:
+            attributes (frozenset[int]): attributes indices
+
+        Returns:
+            np.ndarray: mask of examples without missing values of given attributes
+        """
+        if attributes not in self._valid_examples_masks:
+            valid_mask: np.ndarray = np.ones(self.X.shape[0], dtype=bool)
+            for attribute in attributes:
+                if attribute not in self._columns_valid_masks:
+                    self._columns_valid_masks[attribute] = np.asarray(
+                        pd.notnull(self.X[:, attribute]), dtype=bool
+                    )
+                valid_mask = valid_mask & self._columns_valid_masks[attribute]
+            self._valid_examples_masks[attributes] = valid_mask
+        return self._valid_examples_masks[attributes]
+
+    def empty_premise_mask(self) -> PremiseMask:
+        """
+        Returns:
+            PremiseMask: mask of the premise without any subconditions
+        """
+        return PremiseMask(
+            self, np.ones(self.X.shape[0], dtype=bool), frozenset()
+        )
+
+    def calculate_premise_masks(
+        self,
+        premise: AbstractCondition,
+        conditions: list[AbstractCondition]
+    ) -> tuple[PremiseMask, list[tuple[Optional[PremiseMask], PremiseMask]]]:
+        """Calculates masks of the premise and of its variants.
+
+        Args:
+            premise (AbstractCondition): rule premise
+            conditions (list[AbstractCondition]): atomic conditions of the premise
+
+        Returns:
+            tuple[PremiseMask, list[tuple[Optional[PremiseMask], PremiseMask]]]:
+                mask of the whole premise and for each given condition a pair of
+                masks: of the premise without this condition (None if nothing is
+                left) and of the premise consisting only of this condition
+        """
+        atomic_masks: dict[int, np.ndarray] = {}
+        if not isinstance(premise, CompoundCondition):
+            premise_mask = PremiseMask(
+                self,
+                self._get_atomic_mask(premise, atomic_masks),
+                premise.attributes,
+            )
+            return premise_mask, [
+                (None, PremiseMask(
+                    self, self._get_atomic_mask(
+                        condition, atomic_masks), condition.attributes
+                ))
+                for condition in conditions
+            ]
+
+        operator: LogicOperators = premise.logic_operator
+        subconditions_masks: list[np.ndarray] = [
+            self._evaluate(subcondition, None, atomic_masks)[0]
+            for subcondition in premise.subconditions
+        ]
+        prefixes: list[Optional[np.ndarray]] = [None]
+        for mask in subconditions_masks:
+            prefixes.append(self._combine(prefixes[-1], mask, operator))
+        suffixes: list[Optional[np.ndarray]] = [None]
+        for mask in reversed(subconditions_masks):
+            suffixes.append(self._combine(mask, suffixes[-1], operator))
+        suffixes.reverse()
+
+        premise_mask = PremiseMask(
+            self,
+            (
+                prefixes[-1] if prefixes[-1] is not None
+                else np.ones(self.X.shape[0], dtype=bool)
+            ),
+            premise.attributes,
+            premise.negated,
+        )
+        variants_masks: list[tuple[Optional[PremiseMask], PremiseMask]] = []
+        for condition in conditions:
+            variants_masks.append((
+                self._calculate_premise_without_condition_mask(
+                    premise, condition, subconditions_masks,
+                    prefixes, suffixes, atomic_masks
+                ),
+                PremiseMask(
+                    self,
+                    self._get_atomic_mask(condition, atomic_masks),
+                    condition.attributes,
+                )
+            ))
+        return premise_mask, variants_masks
+
+    def _calculate_premise_without_condition_mask(  # pylint: disable=too-many-arguments
+        self,
+        premise: CompoundCondition,
+        condition: AbstractCondition,
+        subconditions_masks: list[np.ndarray],
+        prefixes: list[Optional[np.ndarray]],
+        suffixes: list[Optional[np.ndarray]],
+        atomic_masks: dict[int, np.ndarray],
+    ) -> Optional[PremiseMask]:
+        operator: LogicOperators = premise.logic_operator
+        affected_indices: list[int] = [
+            i for i, subcondition in enumerate(premise.subconditions)
+            if self._is_affected_by_removal(subcondition, condition)
+        ]
+        if len(affected_indices) == 1:
+            i: int = affected_indices[0]
+            mask: Optional[np.ndarray] = self._combine(
+                prefixes[i], suffixes[i + 1], operator)
+        else:
+            mask = None
+            for i, subcondition_mask in enumerate(subconditions_masks):
+                if i not in affected_indices:
+                    mask = self._combine(mask, subcondition_mask, operator)
+        attributes: frozenset[int] = frozenset().union(*[
+            subcondition.attributes
+            for i, subcondition in enumerate(premise.subconditions)
+            if i not in affected_indices
+        ])
+        for i in affected_indices:
+            result = self._evaluate(
+                premise.subconditions[i], condition, atomic_masks)
+            if result is not None:
+                mask = self._combine(mask, result[0], operator)
+                attributes = attributes.union(result[1])
+        if mask is None:
+            return None
+        return PremiseMask(self, mask, attributes, premise.negated)
+
+    def _is_affected_by_removal(
+        self,
+        condition: AbstractCondition,
+        removed_condition: AbstractCondition
+    ) -> bool:
+        if not isinstance(condition, CompoundCondition):
+            return condition == removed_condition
+        # empty compound conditions are removed as well
+        return len(condition.subconditions) == 0 or any(
+            self._is_affected_by_removal(subcondition, removed_condition)
+            for subcondition in condition.subconditions
+        )
+
+    def _evaluate(
+        self,
+        condition: AbstractCondition,
+        removed_condition: Optional[AbstractCondition],
+        atomic_masks: dict[int, np.ndarray],
+    ) -> Optional[tuple[np.ndarray, frozenset[int]]]:
+        """Evaluates covered mask of the condition with removed given condition.
+
+        Returns:
+            Optional[tuple[np.ndarray, frozenset[int]]]: covered mask and attributes
+                of the condition or None if the whole condition was removed
+        """
+        if not isinstance(condition, CompoundCondition):
+            if removed_condition is not None and condition == removed_condition:
+                return None
+            return self._get_atomic_mask(condition, atomic_masks), condition.attributes
+
+        mask: Optional[np.ndarray] = None
+        attributes: frozenset[int] = frozenset()
+        for subcondition in condition.subconditions:
+            result = self._evaluate(
+                subcondition, removed_condition, atomic_masks)
+            if result is not None:
+                mask = self._combine(mask, result[0], condition.logic_operator)
+                attributes = attributes.union(result[1])
+        if mask is None:
+            if removed_condition is not None:
+                return None
+            mask = np.ones(self.X.shape[0], dtype=bool)
+        if condition.negated:
+            mask = np.logical_not(mask) & self.valid_examples_mask(attributes)
+        return mask, attributes
+
+    def _get_atomic_mask(
+        self,
+        condition: AbstractCondition,
+        atomic_masks: dict[int, np.ndarray]
+    ) -> np.ndarray:
+        key: int = id(condition)
+        if key not in atomic_masks:
+            atomic_masks[key] = condition.covered_mask(self.X)
+        return atomic_masks[key]
+
+    def _combine(
+        self,
+        mask: Optional[np.ndarray],
+        other_mask: Optional[np.ndarray],
+        operator: LogicOperators
+    ) -> Optional[np.ndarray]:
+        if mask is None:
+            return other_mask
+        if other_mask is None:
+            return mask
+        if operator == LogicOperators.CONJUNCTION:
+            return mask & other_mask
+        return mask | other_mask
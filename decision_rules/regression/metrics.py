@@ -39,10 +39,10 @@ class RegressionRulesMetrics(AbstractRulesMetrics):
         rule_prediction: np.ndarray = np.array([])
         if rule is not None:
             rule_prediction = np.full(
-                shape=rule.premise.covered_mask(X).shape,
+                shape=y.shape[0],
                 fill_value=rule.conclusion.value
             )
-            rule_covered_examples = y[rule.premise.covered_mask(X)]
+            rule_covered_examples = self._get_covered_y(rule, X, y)
         return {
             'p': lambda: int(rule.coverage.p),
             'n': lambda: int(rule.coverage.n),
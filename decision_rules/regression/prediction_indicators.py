@@ -1,7 +1,12 @@
+from __future__ import annotations
+
 import math
+from typing import Optional
 from typing import TypedDict
 
 import numpy as np
+from decision_rules.core.prediction_indicators import \
+    AbstractPredictionIndicatorsAccumulator
 from decision_rules.problem import ProblemTypes
 from sklearn.metrics import max_error
 from sklearn.metrics import mean_absolute_error
@@ -100,3 +105,290 @@ def calculate_for_regression(
             histogram=histogram.tolist()
         )
     )
+
+
+class RegressionPredictionIndicatorsAccumulator(AbstractPredictionIndicatorsAccumulator):
+    """Mergeable accumulator of regression predictions. It stores sums of
+    squared, absolute and absolute percentage errors, errors extremes and
+    running mean and sum of squared deviations of actual values (merged using
+    Chan's parallel algorithm).
+
+    By default histogram of errors is accumulated in at most `bins_count`
+    bins of equal width. Width is a power of two and bins are aligned to its
+    multiples, so that whenever range of errors grows (or accumulators are
+    merged) bins can be coarsened by summing neighbouring ones. This way memory
+    usage does not depend on the number of examples. Pass fixed `bin_edges` to
+    use your own bins or set `keep_errors` to True to get histogram calculated
+    exactly as in `calculate_for_regression` function (with "auto" bins) - the
+    latter requires keeping errors of all ingested examples (single float per
+    example) until `finalize` is called.
+
+    Args:
+        calculate_only_for_covered_examples (bool, optional): If true, it will
+            calculate indicators only for the examples where prediction was not
+            empty. Otherwise, it will calculate indicators for all the examples.
+            Defaults to False.
+        bin_edges (Optional[np.ndarray], optional): Fixed edges of errors
+            histogram bins. Defaults to None.
+        bins_count (int, optional): Maximum number of bins of errors histogram
+            used when `bin_edges` are not specified. Defaults to 64.
+        keep_errors (bool, optional): If true, errors of all ingested examples
+            are kept and histogram is calculated using "auto" bins. Can not be
+            used together with `bin_edges`. Defaults to False.
+
+    Raises:
+        ValueError: If both `bin_edges` and `keep_errors` are specified or
+            `bins_count` is lower than 2
+    """
+
+    def __init__(
+        self,
+        calculate_only_for_covered_examples: bool = False,
+        bin_edges: Optional[np.ndarray] = None,
+        bins_count: int = 64,
+        keep_errors: bool = False
+    ) -> None:
+        super().__init__(calculate_only_for_covered_examples)
+        if bin_edges is not None and keep_errors:
+            raise ValueError(
+                '"bin_edges" and "keep_errors" parameters are mutually exclusive')
+        if bins_count < 2:
+            raise ValueError('"bins_count" should be at least 2')
+        self.bin_edges: Optional[np.ndarray] = (
+            np.asarray(
+                bin_edges, dtype=float) if bin_edges is not None else None
+        )
+        self.y_true_mean: float = 0.0
+        self.y_true_m2: float = 0.0
+        self.squared_errors_sum: float = 0.0
+        self.absolute_errors_sum: float = 0.0
+        self.absolute_percentage_errors_sum: float = 0.0
+        self.max_absolute_error: float = 0.0
+        self.min_error: float = np.inf
+        self.max_error: float = -np.inf
+        self.bins_count: int = bins_count
+        self.keep_errors: bool = keep_errors
+        self.bin_width: Optional[float] = None
+        self.first_bin: int = 0
+        self.histogram: Optional[np.ndarray] = (
+            np.zeros(len(self.bin_edges) - 1, dtype=int)
+            if self.bin_edges is not None else
+            None if keep_errors else np.zeros(bins_count, dtype=int)
+        )
+        self.errors: Optional[list[np.ndarray]] = [] if keep_errors else None
+
+    def update(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray
+    ) -> RegressionPredictionIndicatorsAccumulator:
+        """Ingests chunk of predictions.
+
+        Args:
+            y_true (np.ndarray): Array containing the actual labels.
+            y_pred (np.ndarray): Array containing the predicted labels.
+
+        Raises:
+            ValueError: If predictions contain NaN values (uncovered examples)
+                and indicators are calculated for all the examples.
+
+        Returns:
+            RegressionPredictionIndicatorsAccumulator: self
+        """
+        y_true = np.asarray(y_true, dtype=float)
+        y_pred = np.asarray(y_pred, dtype=float)
+        examples_count: int = len(y_true)
+        if self.calculate_only_for_covered_examples:
+            y_true, y_pred = _drop_uncovered_examples(y_true, y_pred)
+        if np.any(np.isnan(y_pred)) or np.any(np.isnan(y_true)):
+            raise ValueError('Input contains NaN.')
+        self.all_examples_count += examples_count
+        if len(y_true) == 0:
+            return self
+
+        errors: np.ndarray = y_pred - y_true
+        absolute_errors: np.ndarray = np.abs(errors)
+        self._merge_statistics(
+            count=len(y_true),
+            y_true_mean=np.mean(y_true),
+            y_true_m2=np.sum((y_true - np.mean(y_true)) ** 2),
+        )
+        self.covered_by_prediction += len(y_true)
+        self.squared_errors_sum += np.sum(errors ** 2)
+        self.absolute_errors_sum += np.sum(absolute_errors)
+        self.absolute_percentage_errors_sum += np.sum(
+            absolute_errors / np.maximum(
+                np.abs(y_true), np.finfo(np.float64).eps)
+        )
+        self.max_absolute_error = max(
+            self.max_absolute_error, np.max(absolute_errors))
+        if self.bin_edges is not None:
+            self.histogram += np.histogram(errors, bins=self.bin_edges)[0]
+        elif self.keep_errors:
+            self.errors.append(errors)
+        else:
+            self._fit_bins(
+                min(self.min_error, np.min(errors)),
+                max(self.max_error, np.max(errors)),
+            )
+            self.histogram += np.bincount(
+                np.floor(errors / self.bin_width).astype(int) - self.first_bin,
+                minlength=self.bins_count
+            )
+        self.min_error = min(self.min_error, np.min(errors))
+        self.max_error = max(self.max_error, np.max(errors))
+        return self
+
+    def _fit_bins(
+        self,
+        min_error: float,
+        max_error: float,
+        min_bin_width: float = 0.0
+    ):
+        """Coarsens bins of the histogram (if needed) so that errors from
+        the given range fit in `bins_count` bins and moves the first bin to the
+        one containing `min_error`.
+        """
+        bin_width: float = max(self.bin_width or 0.0, min_bin_width)
+        if bin_width == 0.0:
+            errors_range: float = (
+                (max_error - min_error) or abs(max_error) or 1.0)
+            bin_width = 2.0 ** math.ceil(
+                math.log2(errors_range / self.bins_count))
+        while (
+            math.floor(max_error / bin_width) -
+            math.floor(min_error / bin_width) >= self.bins_count
+        ):
+            bin_width *= 2
+        first_bin: int = math.floor(min_error / bin_width)
+        if self.bin_width is not None:
+            self.histogram = self._regrid_histogram(
+                self.histogram, self.bin_width, self.first_bin,
+                bin_width, first_bin
+            )
+        self.bin_width = bin_width
+        self.first_bin = first_bin
+
+    def _regrid_histogram(
+        self,
+        histogram: np.ndarray,
+        bin_width: float,
+        first_bin: int,
+        new_bin_width: float,
+        new_first_bin: int
+    ) -> np.ndarray:
+        ratio: int = round(new_bin_width / bin_width)
+        bins: np.ndarray = (first_bin + np.arange(len(histogram))) // ratio
+        return np.bincount(
+            bins - new_first_bin,
+            weights=histogram,
+            minlength=self.bins_count
+        )[:self.bins_count].astype(int)
+
+    def _merge_statistics(self, count: int, y_true_mean: float, y_true_m2: float):
+        total_count: int = self.covered_by_prediction + count
+        delta: float = y_true_mean - self.y_true_mean
+        self.y_true_m2 += y_true_m2 + delta ** 2 * \
+            self.covered_by_prediction * count / total_count
+        self.y_true_mean += delta * count / total_count
+
+    def _merge(self, other: RegressionPredictionIndicatorsAccumulator):
+        if (self.bin_edges is None) != (other.bin_edges is None) or (
+            self.bin_edges is not None and
+            not np.array_equal(self.bin_edges, other.bin_edges)
+        ):
+            raise ValueError(
+                'Cannot merge accumulators with different histogram bin edges')
+        if (
+            other.keep_errors != self.keep_errors or
+            other.bins_count != self.bins_count
+        ):
+            raise ValueError(
+                'Cannot merge accumulators with different values of '
+                '"keep_errors" or "bins_count" parameters'
+            )
+        if other.covered_by_prediction == 0:
+            return
+        self._merge_statistics(
+            count=other.covered_by_prediction,
+            y_true_mean=other.y_true_mean,
+            y_true_m2=other.y_true_m2,
+        )
+        self.squared_errors_sum += other.squared_errors_sum
+        self.absolute_errors_sum += other.absolute_errors_sum
+        self.absolute_percentage_errors_sum += other.absolute_percentage_errors_sum
+        self.max_absolute_error = max(
+            self.max_absolute_error, other.max_absolute_error)
+        if self.bin_edges is not None:
+            self.histogram += other.histogram
+        elif self.keep_errors:
+            self.errors.extend(other.errors)
+        else:
+            self._fit_bins(
+                min(self.min_error, other.min_error),
+                max(self.max_error, other.max_error),
+                min_bin_width=other.bin_width
+            )
+            self.histogram += self._regrid_histogram(
+                other.histogram, other.bin_width, other.first_bin,
+                self.bin_width, self.first_bin
+            )
+        self.min_error = min(self.min_error, other.min_error)
+        self.max_error = max(self.max_error, other.max_error)
+
+    def finalize(self) -> RegressionPredictionIndicators:
+        """Calculates prediction indicators from accumulated statistics.
+
+        Raises:
+            ValueError: If no covered examples were ingested
+
+        Returns:
+            RegressionPredictionIndicators:  A dictionary containing
+            prediction indicators
+        """
+        count: int = self.covered_by_prediction
+        if count == 0:
+            raise ValueError(
+                'Cannot calculate prediction indicators without any examples')
+        RMSE = math.sqrt(self.squared_errors_sum / count)
+        MAE = float(self.absolute_errors_sum / count)
+        if count < 2:
+            R2 = np.nan
+        elif self.y_true_m2 == 0:
+            R2 = 1.0 if self.squared_errors_sum == 0 else 0.0
+        else:
+            R2 = float(1 - self.squared_errors_sum / self.y_true_m2)
+
+        if self.bin_edges is not None:
+            bin_edges: np.ndarray = self.bin_edges
+            histogram: np.ndarray = self.histogram
+        elif self.keep_errors:
+            errors: np.ndarray = np.concatenate(self.errors)
+            bin_edges = np.histogram_bin_edges(errors, bins='auto')
+            histogram, _ = np.histogram(errors, bins=bin_edges)
+        else:
+            bins_count: int = math.floor(
+                self.max_error / self.bin_width) - self.first_bin + 1
+            bin_edges = (
+                self.first_bin + np.arange(bins_count + 1)) * self.bin_width
+            histogram = self.histogram[:bins_count]
+        return RegressionPredictionIndicators(
+            type_of_problem=ProblemTypes.REGRESSION.value,
+            general=RegressionGeneralPredictionIndicators(**{
+                "RMSE": RMSE,
+                "MAE": MAE,
+                "MAPE": float(self.absolute_percentage_errors_sum / count),
+                "rRMSE": float(RMSE / self.y_true_mean),
+                "rMAE": float(MAE / self.y_true_mean),
+                "maxError": float(self.max_absolute_error),
+                "R^2": R2,
+                "Covered_by_prediction": count,
+                "Not_covered_by_prediction": self.not_covered_by_prediction,
+            }),
+            histogram=RegressionPredictionHistogram(
+                max=self.max_error,
+                min=self.min_error,
+                bin_edges=bin_edges.tolist(),
+                histogram=histogram.tolist()
+            )
+        )
@@ -135,8 +135,16 @@ class RegressionRule(AbstractRule):
             P: int = None,
             N: int = None
     ) -> Coverage:
-        covered_y: np.ndarray = y[self.premise.covered_mask(X)]
+        self.update_conclusion_using_covered_y(y[self.premise.covered_mask(X)])
+        return super().calculate_coverage(X, y, P, N)
+
+    def update_conclusion_using_covered_y(self, covered_y: np.ndarray):
+        """Updates conclusion statistics of covered examples labels. If conclusion
+        is not fixed, its value and boundaries are recalculated as well.
 
+        Args:
+            covered_y (np.ndarray): labels of examples covered by the rule
+        """
         # np.min and max will fail badly on empty arrays, mean and std will raise warnings
         if covered_y.shape[0] == 0:
             self.conclusion.train_covered_y_std: float = np.nan
@@ -156,7 +164,6 @@ class RegressionRule(AbstractRule):
         if not self.conclusion.fixed:
             self.conclusion.value = self.conclusion.train_covered_y_mean
             self.conclusion.calculate_low_high()
-        return super().calculate_coverage(X, y, P, N)
 
     def get_coverage_dict(self) -> dict:
         coverage = super().get_coverage_dict()
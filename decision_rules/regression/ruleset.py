@@ -3,17 +3,21 @@ Contains regression ruleset class.
 """
 from __future__ import annotations
 
+import math
 from typing import Callable
+from typing import Optional
 from typing import Type
 
 import numpy as np
 import pandas as pd
 from decision_rules.core.coverage import Coverage
+from decision_rules.core.coverage import CoverageTable
 from decision_rules.core.coverage import RegressionCoverageInfodict
 from decision_rules.core.metrics import AbstractRulesMetrics
 from decision_rules.core.prediction import BestRulePredictionStrategy
 from decision_rules.core.prediction import PredictionStrategy
 from decision_rules.core.ruleset import AbstractRuleSet
+from decision_rules.helpers.p_values import chi2_variance_p_values
 from decision_rules.importances._regression.attributes import \
     RegressionRuleSetAttributeImportances
 from decision_rules.importances._regression.conditions import \
@@ -102,14 +106,28 @@ class RegressionRuleSet(AbstractRuleSet):
     def _calculate_P_N(self, y_uniques: np.ndarray, y_values_count: np.ndarray):  # pylint: disable=invalid-name
         return
 
+    def _get_coverage_table_extras(self) -> dict[str, np.ndarray]:
+        return {
+            name: np.array(
+                [getattr(rule.conclusion, name) for rule in self.rules], dtype=float
+            )
+            for name in (
+                'train_covered_y_mean',
+                'train_covered_y_std',
+                'train_covered_y_min',
+                'train_covered_y_max',
+            )
+        }
+
     def calculate_condition_importances(
             self,
             X: pd.DataFrame,  # pylint: disable=invalid-name
             y: pd.Series,  # pylint: disable=invalid-name
-            measure: Callable[[Coverage], float]
+            measure: Callable[[Coverage], float],
+            n_jobs: Optional[int] = 1,
     ) -> dict[str, dict[str, float]]:
         condition_importances_generator = RegressionRuleSetConditionImportances(
-            self)
+            self, n_jobs)
         self.condition_importances = condition_importances_generator.calculate_importances(
             X.to_numpy(), y.to_numpy(), measure)
         return self.condition_importances
@@ -121,11 +139,12 @@ class RegressionRuleSet(AbstractRuleSet):
         return self.attribute_importances
 
     def calculate_p_values(self, y: np.ndarray) -> list:
-        metrics: AbstractRulesMetrics = self.get_metrics_object_instance()
-        p_values = []
-        for rule in self.rules:
-            p_values.append(metrics.calculate_p_value(rule=rule, y=y))
-        return p_values
+        table: CoverageTable = self._get_calculated_coverage_table()
+        return chi2_variance_p_values(
+            covered_count=table.p + table.n,
+            covered_y_std=table.extras['train_covered_y_std'],
+            y_std=math.sqrt(y.var())
+        ).tolist()
 
     @property
     def prediction_strategies_choice(self) -> dict[str, Type[PredictionStrategy]]:
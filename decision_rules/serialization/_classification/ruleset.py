@@ -9,9 +9,8 @@ from typing import Optional
 import numpy as np
 from pydantic import BaseModel
 
-from decision_rules.classification.rule import ClassificationRule
 from decision_rules.classification.ruleset import ClassificationRuleSet
-from decision_rules.core.coverage import Coverage
+from decision_rules.core.coverage import CoverageTable
 from decision_rules.serialization._classification.rule import _ClassificationRuleConclusionSerializer
 from decision_rules.serialization._classification.rule import _ClassificationRuleSerializer
 from decision_rules.serialization.utils import JSONClassSerializer
@@ -36,18 +35,18 @@ class _ClassificationRuleSetSerializer(JSONClassSerializer):
 
     @classmethod
     def _from_pydantic_model(cls: type, model: _Model) -> ClassificationRuleSet:
+        rules, coverage_table = _ClassificationRuleSerializer.deserialize_rules(
+            model.rules)
         ruleset = ClassificationRuleSet(  # pylint: disable=abstract-class-instantiated
-            rules=[
-                JSONSerializer.deserialize(rule, ClassificationRule)
-                for rule in model.rules
-            ],
+            rules=rules,
         )
         ruleset.y_values = np.array(
             list(model.meta.decision_attribute_distribution.keys())
         )
         ruleset.column_names = model.meta.attributes
         ruleset.decision_attribute = model.meta.decision_attribute
-        _ClassificationRuleSetSerializer._calculate_P_N(model, ruleset)
+        _ClassificationRuleSetSerializer._calculate_P_N(
+            model, ruleset, coverage_table)
         _ClassificationRuleSetSerializer._set_default_conclusion(
             ruleset, model.meta.default_conclusion
         )
@@ -55,7 +54,10 @@ class _ClassificationRuleSetSerializer(JSONClassSerializer):
 
     @classmethod
     def _calculate_P_N(
-        cls: type, model: _Model, ruleset: ClassificationRuleSet
+        cls: type,
+        model: _Model,
+        ruleset: ClassificationRuleSet,
+        coverage_table: Optional[CoverageTable],
     ):  # pylint: disable=invalid-name
         all_example_count = sum(
             model.meta.decision_attribute_distribution.values())
@@ -70,6 +72,15 @@ class _ClassificationRuleSetSerializer(JSONClassSerializer):
                 rule.coverage.P = ruleset.train_P[rule.conclusion.value]
                 rule.coverage.N = ruleset.train_N[rule.conclusion.value]
             rule.conclusion.column_name = model.meta.decision_attribute
+        if coverage_table is not None:
+            rules_classes: list = [
+                rule.conclusion.value for rule in ruleset.rules]
+            coverage_table.P[:] = [
+                ruleset.train_P[value] for value in rules_classes]
+            coverage_table.N[:] = [
+                ruleset.train_N[value] for value in rules_classes]
+            ruleset._bind_coverage_table(  # pylint: disable=protected-access
+                coverage_table)
 
     @classmethod
     def _set_default_conclusion(
@@ -101,6 +112,6 @@ class _ClassificationRuleSetSerializer(JSONClassSerializer):
                     instance.default_conclusion, mode
                 ),
             ),
-            rules=[JSONSerializer.serialize(rule, mode)
-                   for rule in instance.rules],
+            rules=_ClassificationRuleSerializer.serialize_rules(
+                instance, mode),
         )
@@ -6,10 +6,14 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
+import numpy as np
 from pydantic import BaseModel
 
 from decision_rules.core.coverage import Coverage
+from decision_rules.core.coverage import CoverageTable
+from decision_rules.core.coverage import CoverageView
 from decision_rules.core.rule import AbstractRule
+from decision_rules.core.ruleset import AbstractRuleSet
 from decision_rules.serialization._core.conditions import _ConditionSerializer
 from decision_rules.serialization.utils import (
     JSONClassSerializer,
@@ -19,6 +23,7 @@ from decision_rules.serialization.utils import (
 )
 
 
+@register_serializer(CoverageView)
 @register_serializer(Coverage)
 class _CoverageSerializer(JSONClassSerializer):
 
@@ -50,6 +55,48 @@ class _CoverageSerializer(JSONClassSerializer):
             N=int(instance.N) if instance.N is not None else None,
         )
 
+    @staticmethod
+    def table_from_models(
+        models: list[Optional[_CoverageSerializer._Model]],
+    ) -> Optional[CoverageTable]:
+        """Reads serialized coverages of all rules directly into coverage table arrays
+        without creating coverage object for each rule.
+
+        Args:
+            models (list[Optional[_CoverageSerializer._Model]]): serialized coverages
+
+        Returns:
+            Optional[CoverageTable]: coverage table or None if some rule has no coverage
+        """
+        if any(model is None for model in models):
+            return None
+        values: np.ndarray = np.array(
+            [(model.p, model.n, model.P, model.N) for model in models], dtype=object
+        ).reshape(len(models), 4)
+        values[values == None] = CoverageTable.MISSING_VALUE  # pylint: disable=singleton-comparison
+        return CoverageTable(*values.astype(np.int64).T)
+
+    @staticmethod
+    def models_from_table(table: CoverageTable) -> list[dict]:
+        """Serializes coverages of all rules stored in the coverage table at once.
+
+        Args:
+            table (CoverageTable): coverage table
+
+        Returns:
+            list[dict]: serialized coverages, the same as serialized coverages of rules
+        """
+        columns: list[list[Optional[int]]] = [
+            np.where(
+                values == CoverageTable.MISSING_VALUE, None, values
+            ).tolist()
+            for values in (table.p, table.n, table.P, table.N)
+        ]
+        return [
+            {"p": p, "n": n, "P": P, "N": N}
+            for p, n, P, N in zip(*columns)  # pylint: disable=invalid-name
+        ]
+
 
 class _BaseRuleSerializer(JSONClassSerializer):
 
@@ -66,6 +113,12 @@ class _BaseRuleSerializer(JSONClassSerializer):
 
     @classmethod
     def _from_pydantic_model(cls: type, model: _Model) -> AbstractRule:
+        rule: AbstractRule = cls._create_rule(model)
+        rule.coverage = JSONSerializer.deserialize(model.coverage, Coverage)
+        return rule
+
+    @classmethod
+    def _create_rule(cls: type, model: _Model) -> AbstractRule:
         rule: AbstractRule = cls.rule_class(
             premise=_ConditionSerializer.deserialize(model.premise),
             conclusion=JSONSerializer.deserialize(
@@ -74,11 +127,66 @@ class _BaseRuleSerializer(JSONClassSerializer):
             column_names=[],  # must be populated when deserializing ruleset!
         )
         rule._uuid = model.uuid  # pylint: disable=protected-access
-        rule.coverage = JSONSerializer.deserialize(model.coverage, Coverage)
         if model.voting_weight is not None:
             rule.voting_weight = model.voting_weight
         return rule
 
+    @classmethod
+    def deserialize_rules(
+        cls: type, models: list[_Model]
+    ) -> tuple[list[AbstractRule], Optional[CoverageTable]]:
+        """Deserializes all rules of a ruleset. If every rule has a coverage, coverages
+        are read at once into a coverage table, which should be then bound to the
+        ruleset, instead of creating coverage object for each rule.
+
+        Args:
+            models (list[_Model]): serialized rules
+
+        Returns:
+            tuple[list[AbstractRule], Optional[CoverageTable]]: rules and coverage table
+                or None if some rule has no coverage (in such case coverages are set on
+                rules)
+        """
+        rules: list[AbstractRule] = [
+            cls._create_rule(model) for model in models]
+        table: Optional[CoverageTable] = _CoverageSerializer.table_from_models(
+            [model.coverage for model in models]
+        )
+        if table is None:
+            for rule, model in zip(rules, models):
+                rule.coverage = JSONSerializer.deserialize(
+                    model.coverage, Coverage)
+        return rules, table
+
+    @classmethod
+    def serialize_rules(
+        cls: type, ruleset: AbstractRuleSet, mode: SerializationModes
+    ) -> list[dict]:
+        """Serializes all rules of a ruleset. In full mode coverages stored in the coverage
+        table bound to the ruleset are written at once from the table arrays.
+
+        Args:
+            ruleset (AbstractRuleSet): ruleset
+            mode (SerializationModes): serialization mode
+
+        Returns:
+            list[dict]: serialized rules
+        """
+        table: Optional[CoverageTable] = (
+            ruleset._get_bound_coverage_table()  # pylint: disable=protected-access
+            if mode == SerializationModes.FULL else None
+        )
+        if table is None or any(type(rule) is not cls.rule_class for rule in ruleset.rules):
+            return [JSONSerializer.serialize(rule, mode) for rule in ruleset.rules]
+        return [
+            cls._create_model(
+                rule, mode, coverage, rule.voting_weight
+            ).model_dump()
+            for rule, coverage in zip(
+                ruleset.rules, _CoverageSerializer.models_from_table(table)
+            )
+        ]
+
     @classmethod
     def _to_pydantic_model(
         cls: type,
@@ -86,11 +194,21 @@ class _BaseRuleSerializer(JSONClassSerializer):
         mode: SerializationModes,  # pylint: disable=unused-argument
     ) -> _Model:
         if mode == SerializationModes.FULL:
-            coverage: Coverage = instance.coverage
+            coverage: Optional[dict] = JSONSerializer.serialize(
+                instance.coverage, mode)
             voting_weight: float = instance.voting_weight
         else:
             coverage = voting_weight = None
+        return cls._create_model(instance, mode, coverage, voting_weight)
 
+    @classmethod
+    def _create_model(
+        cls: type,
+        instance: AbstractRule,
+        mode: SerializationModes,
+        coverage: Optional[dict],
+        voting_weight: Optional[float],
+    ) -> _Model:
         model = _BaseRuleSerializer._Model(
             uuid=instance.uuid,
             string=instance.__str__(  # pylint: disable=unnecessary-dunder-call
@@ -100,7 +218,7 @@ class _BaseRuleSerializer(JSONClassSerializer):
                 instance.premise, mode
             ),  # pylint: disable=duplicate-code
             conclusion=JSONSerializer.serialize(instance.conclusion, mode),
-            coverage=JSONSerializer.serialize(coverage, mode),
+            coverage=coverage,
             voting_weight=voting_weight,
         )
         return model
@@ -7,9 +7,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
-from decision_rules.core.coverage import Coverage
 from decision_rules.regression.rule import RegressionConclusion
-from decision_rules.regression.rule import RegressionRule
 from decision_rules.regression.ruleset import RegressionRuleSet
 from decision_rules.serialization._regression.rule import _RegressionRuleConclusionSerializer
 from decision_rules.serialization._regression.rule import _RegressionRuleSerializer
@@ -35,21 +33,21 @@ class _RegressionRuleSetSerializer(JSONClassSerializer):
 
     @classmethod
     def _from_pydantic_model(cls: type, model: _Model) -> RegressionRuleSet:
+        rules, coverage_table = _RegressionRuleSerializer.deserialize_rules(
+            model.rules)
         ruleset = RegressionRuleSet(  # pylint: disable=abstract-class-instantiated
-            rules=[
-                JSONSerializer.deserialize(rule, RegressionRule) for rule in model.rules
-            ],
+            rules=rules,
         )
         ruleset.column_names = model.meta.attributes
         ruleset.decision_attribute = model.meta.decision_attribute
-        for i, rule in enumerate(ruleset.rules):
+        for rule in ruleset.rules:
             rule.column_names = ruleset.column_names
             rule.column_names = ruleset.column_names
             rule.conclusion.column_name = model.meta.decision_attribute
             rule.train_covered_y_mean = rule.conclusion.train_covered_y_mean
-            if model.rules[i].coverage is not None:
-                rule.coverage = Coverage(
-                    **model.rules[i].coverage.model_dump())
+        if coverage_table is not None:
+            ruleset._bind_coverage_table(  # pylint: disable=protected-access
+                coverage_table)
         ruleset._y_train_median = (
             model.meta.y_train_median
         )  # pylint: disable=protected-access
@@ -88,6 +86,5 @@ class _RegressionRuleSetSerializer(JSONClassSerializer):
                     instance.default_conclusion, mode
                 ),
             ),
-            rules=[JSONSerializer.serialize(rule, mode)
-                   for rule in instance.rules],
+            rules=_RegressionRuleSerializer.serialize_rules(instance, mode),
         )
@@ -5,18 +5,16 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel
 
-from decision_rules.core.coverage import Coverage
 from decision_rules.serialization._survival.kaplan_meier import \
     _KaplanMeierEstimatorModel
 from decision_rules.serialization._survival.rule import _SurvivalRuleSerializer
 from decision_rules.serialization.utils import JSONClassSerializer
-from decision_rules.serialization.utils import JSONSerializer
 from decision_rules.serialization.utils import register_serializer
 from decision_rules.serialization.utils import SerializationModes
 from decision_rules.survival.kaplan_meier import KaplanMeierEstimator
-from decision_rules.survival.rule import SurvivalRule
 from decision_rules.survival.ruleset import SurvivalRuleSet
 
 
@@ -25,6 +23,7 @@ class _SurvivalMetaDataModel(BaseModel):
     decision_attribute: str
     survival_time_attribute: str
     default_conclusion: _KaplanMeierEstimatorModel
+    time_grid: Optional[list[float]] = None
 
 
 @register_serializer(SurvivalRuleSet)
@@ -36,16 +35,18 @@ class _SurvivalRuleSetSerializer(JSONClassSerializer):
 
     @classmethod
     def _from_pydantic_model(cls: type, model: _Model) -> SurvivalRuleSet:
+        rules, coverage_table = _SurvivalRuleSerializer.deserialize_rules(
+            model.rules)
         ruleset = SurvivalRuleSet(  # pylint: disable=abstract-class-instantiated
-            rules=[
-                JSONSerializer.deserialize(rule, SurvivalRule) for rule in model.rules
-            ],
+            rules=rules,
             survival_time_attr=model.meta.survival_time_attribute,
         )
         ruleset.column_names = model.meta.attributes
         ruleset.decision_attribute = model.meta.decision_attribute
+        if model.meta.time_grid is not None:
+            ruleset.time_grid = np.array(model.meta.time_grid, dtype=float)
         _SurvivalRuleSetSerializer._update_default_conclusion(ruleset, model)
-        for i, rule in enumerate(ruleset.rules):
+        for rule in ruleset.rules:
             rule.column_names = ruleset.column_names
             rule.set_survival_time_attr(model.meta.survival_time_attribute)
             rule.conclusion.column_name = model.meta.decision_attribute
@@ -56,9 +57,9 @@ class _SurvivalRuleSetSerializer(JSONClassSerializer):
             rule.conclusion.median_survival_time_ci_upper = (
                 rule.conclusion.median_survival_time_ci_upper,
             )
-            if model.rules[i].coverage is not None:
-                rule.coverage = Coverage(
-                    **model.rules[i].coverage.model_dump())
+        if coverage_table is not None:
+            ruleset._bind_coverage_table(  # pylint: disable=protected-access
+                coverage_table)
         return ruleset
 
     @classmethod
@@ -93,7 +94,10 @@ class _SurvivalRuleSetSerializer(JSONClassSerializer):
                 decision_attribute=instance.rules[0].conclusion.column_name,
                 survival_time_attribute=instance.rules[0].survival_time_attr,
                 default_conclusion=default_conclusion,
+                time_grid=(
+                    None if instance.time_grid is None
+                    else instance.time_grid.tolist()
+                ),
             ),
-            rules=[JSONSerializer.serialize(rule, mode)
-                   for rule in instance.rules],
+            rules=_SurvivalRuleSerializer.serialize_rules(instance, mode),
         )
@@ -1,4 +1,5 @@
 from decision_rules.similarity.calculate import calculate_rule_similarity
 from decision_rules.similarity.calculate import SimilarityMeasure
 from decision_rules.similarity.calculate import SimilarityType
+from decision_rules.similarity.index import RuleSimilarityIndex
 from decision_rules.similarity.ruleset import calculate_ruleset_similarity
@@ -0,0 +1,232 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from decision_rules.core.rule import AbstractRule
+from decision_rules.core.ruleset import AbstractRuleSet
+
+# maximum number of elements of (hash functions x covered examples) and
+# (rules x examples) arrays created at once when calculating MinHash signatures
+_SIGNATURES_ELEMENTS_COUNT: int = 2 ** 24
+# Mersenne prime used as the modulus of universal hash functions of examples
+_HASH_PRIME: int = 2 ** 31 - 1
+# number of candidate pairs of rules for which the exact similarity is calculated at once
+_PAIRS_CHUNK_SIZE: int = 2 ** 14
+# number of set bits in each byte value
+_BITS_COUNTS: np.ndarray = np.array(
+    [bin(value).count("1") for value in range(256)], dtype=np.int64)
+
+
+class RuleSimilarityIndex:
+    """
+    Index for searching the most similar rules of a ruleset without calculating the whole
+    similarity matrix. Rules are compared by the Jaccard similarity of the sets of examples
+    they cover in a reference dataset (the same as the semantic similarity with Jaccard
+    measure).
+
+    Each rule is represented by a MinHash signature of its coverage and the signatures are
+    split into bands (locality sensitive hashing). Only rules sharing at least one band with
+    the queried rule are candidates and the exact similarity is calculated for them. Rules
+    with the Jaccard similarity s are candidates with the probability 1 - (1 - s^r)^b, where
+    b is the number of bands and r the number of hash functions in each band, so very
+    dissimilar rules may be missing in the results. Rules covering no examples are never
+    returned.
+
+    :param ruleset: ruleset to index
+    :param dataset: reference dataset
+    :param signature_size: number of hash functions of MinHash signatures
+    :param bands_count: number of bands, must divide the signature size
+    :param random_state: seed of the random number generator used for hash functions
+    """
+
+    def __init__(
+            self, ruleset: AbstractRuleSet, dataset: pd.DataFrame,
+            signature_size: int = 128, bands_count: int = 32,
+            random_state: Optional[int] = None
+    ):
+        if signature_size < 1 or bands_count < 1:
+            raise ValueError(
+                "signature_size and bands_count should be positive integers, got: "
+                f"{signature_size} and {bands_count}")
+        if signature_size % bands_count != 0:
+            raise ValueError(
+                f"bands_count ({bands_count}) should divide signature_size ({signature_size})")
+        self.ruleset: AbstractRuleSet = ruleset
+        self._X: np.ndarray = ruleset._sanitize_dataset(dataset)
+        self._examples_count: int = self._X.shape[0]
+        self._bands_count: int = bands_count
+        rng = np.random.default_rng(random_state)
+        # universal hash functions (a * x + b) mod p of examples indices x, they
+        # are evaluated when needed instead of storing permutations of examples
+        self._hash_multipliers: np.ndarray = rng.integers(
+            1, _HASH_PRIME, size=signature_size, dtype=np.int64)
+        self._hash_offsets: np.ndarray = rng.integers(
+            0, _HASH_PRIME, size=signature_size, dtype=np.int64)
+        self._band_multipliers: np.ndarray = rng.integers(
+            1, 2 ** 63, size=signature_size // bands_count, dtype=np.uint64) | np.uint64(1)
+
+        coverage_matrix: np.ndarray = ruleset.calculate_coverage_matrix(
+            dataset).T
+        coverage_matrix = coverage_matrix.reshape(
+            len(ruleset.rules), self._examples_count)
+        self._coverages: np.ndarray = np.packbits(coverage_matrix, axis=1)
+        self._coverages_sizes: np.ndarray = coverage_matrix.sum(
+            axis=1).astype(np.int64)
+        bands_keys: np.ndarray = self._calculate_bands_keys(
+            self._calculate_signatures(coverage_matrix))
+        # for each band rules indices sorted by their keys, for binary search of buckets
+        rules_indices: np.ndarray = np.flatnonzero(self._coverages_sizes > 0)
+        self._bands: list[tuple[np.ndarray, np.ndarray]] = []
+        for band_keys in bands_keys.T:
+            order = np.argsort(band_keys[rules_indices], kind="stable")
+            self._bands.append(
+                (band_keys[rules_indices][order], rules_indices[order]))
+
+    def query(self, rule: AbstractRule, k: int = 10) -> list[tuple[int, float]]:
+        """
+        Finds the rules of the indexed ruleset most similar to the given rule.
+
+        :param rule: queried rule, it does not have to belong to the indexed ruleset
+        :param k: maximum number of returned rules
+        :return: list of pairs (index of a rule in the ruleset, similarity) sorted by
+            decreasing similarity
+        """
+        mask = rule.premise.covered_mask(self._X)
+        return self._query(mask, k, excluded_index=None)
+
+    def query_index(self, rule_index: int, k: int = 10) -> list[tuple[int, float]]:
+        """
+        Finds the rules of the indexed ruleset most similar to the rule of this ruleset
+        with the given index. The rule itself is not returned.
+
+        :param rule_index: index of the queried rule in the indexed ruleset
+        :param k: maximum number of returned rules
+        :return: list of pairs (index of a rule in the ruleset, similarity) sorted by
+            decreasing similarity
+        """
+        mask = np.unpackbits(
+            self._coverages[rule_index], count=self._examples_count).astype(bool)
+        return self._query(mask, k, excluded_index=rule_index)
+
+    def find_near_duplicates(self, threshold: float = 0.9) -> list[tuple[int, int, float]]:
+        """
+        Finds pairs of rules of the indexed ruleset with the similarity of at least
+        the given threshold.
+
+        :param threshold: minimum similarity of returned pairs of rules
+        :return: list of triples (index of the first rule, index of the second rule,
+            similarity), where the first index is lower than the second one, sorted
+            by decreasing similarity
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(
+                f"threshold should be in range (0, 1], got: {threshold}")
+        rules_count = len(self.ruleset.rules)
+        candidates: list[np.ndarray] = []
+        for sorted_keys, rules_indices in self._bands:
+            # buckets are runs of equal keys
+            boundaries = np.flatnonzero(np.diff(sorted_keys) != 0) + 1
+            for bucket in np.split(rules_indices, boundaries):
+                if bucket.shape[0] < 2:
+                    continue
+                first, second = np.triu_indices(bucket.shape[0], k=1)
+                first, second = bucket[first], bucket[second]
+                candidates.append(
+                    np.minimum(first, second) * rules_count + np.maximum(first, second))
+        if not candidates:
+            return []
+        pairs = np.unique(np.concatenate(candidates))
+        first, second = pairs // rules_count, pairs % rules_count
+        similarities = np.empty(pairs.shape[0], dtype=float)
+        for start in range(0, pairs.shape[0], _PAIRS_CHUNK_SIZE):
+            end = start + _PAIRS_CHUNK_SIZE
+            similarities[start:end] = self._calculate_jaccard(
+                self._coverages[first[start:end]],
+                self._coverages_sizes[first[start:end]],
+                self._coverages[second[start:end]],
+                self._coverages_sizes[second[start:end]],
+            )
+        selected = np.flatnonzero(similarities >= threshold)
+        order = np.lexsort(
+            (second[selected], first[selected], -similarities[selected]))
+        return [
+            (int(first[i]), int(second[i]), float(similarities[i]))
+            for i in selected[order]
+        ]
+
+    def _query(
+            self, mask: np.ndarray, k: int, excluded_index: Optional[int]
+    ) -> list[tuple[int, float]]:
+        if k < 1:
+            raise ValueError(f"k should be a positive integer, got: {k}")
+        mask = mask.reshape(1, self._examples_count)
+        size = int(mask.sum())
+        if size == 0:
+            return []
+        bands_keys = self._calculate_bands_keys(
+            self._calculate_signatures(mask))[0]
+        candidates: list[np.ndarray] = []
+        for band_key, (sorted_keys, rules_indices) in zip(bands_keys, self._bands):
+            start = np.searchsorted(sorted_keys, band_key, side="left")
+            end = np.searchsorted(sorted_keys, band_key, side="right")
+            candidates.append(rules_indices[start:end])
+        candidates_indices = np.unique(np.concatenate(candidates))
+        if excluded_index is not None:
+            candidates_indices = candidates_indices[candidates_indices !=
+                                                    excluded_index]
+        similarities = self._calculate_jaccard(
+            np.packbits(mask, axis=1), np.int64(size),
+            self._coverages[candidates_indices],
+            self._coverages_sizes[candidates_indices],
+        )
+        order = np.lexsort((candidates_indices, -similarities))[:k]
+        return [
+            (int(candidates_indices[i]), float(similarities[i])) for i in order
+        ]
+
+    def _calculate_signatures(self, coverage_matrix: np.ndarray) -> np.ndarray:
+        # MinHash value is the lowest hash of a covered example, rules covering
+        # no examples get the modulus (greater than all hashes)
+        signatures = np.full(
+            (coverage_matrix.shape[0], self._hash_multipliers.shape[0]),
+            _HASH_PRIME, dtype=np.int64)
+        rules_chunk_size = max(
+            1, _SIGNATURES_ELEMENTS_COUNT // max(1, self._examples_count))
+        for start in range(0, coverage_matrix.shape[0], rules_chunk_size):
+            end = start + rules_chunk_size
+            self._fill_signatures(
+                coverage_matrix[start:end], signatures[start:end])
+        return signatures
+
+    def _fill_signatures(self, coverage_matrix: np.ndarray, signatures: np.ndarray):
+        # fills signatures (a view) of a chunk of rules in place
+        rules_indices, examples_indices = np.nonzero(coverage_matrix)
+        if examples_indices.shape[0] == 0:
+            return
+        covering_rules, starts = np.unique(rules_indices, return_index=True)
+        examples_indices = examples_indices.astype(np.int64)
+        hashes_chunk_size = max(
+            1, _SIGNATURES_ELEMENTS_COUNT // examples_indices.shape[0])
+        for start in range(0, signatures.shape[1], hashes_chunk_size):
+            end = start + hashes_chunk_size
+            hashes = (
+                self._hash_multipliers[start:end, np.newaxis] * examples_indices +
+                self._hash_offsets[start:end, np.newaxis]
+            ) % _HASH_PRIME
+            signatures[covering_rules, start:end] = np.minimum.reduceat(
+                hashes, starts, axis=1).T
+
+    def _calculate_bands_keys(self, signatures: np.ndarray) -> np.ndarray:
+        # hash rows of each band into a single key, collisions only add candidates
+        bands = signatures.astype(np.uint64).reshape(
+            signatures.shape[0], self._bands_count, -1)
+        return np.sum(bands * self._band_multipliers, axis=2, dtype=np.uint64)
+
+    @staticmethod
+    def _calculate_jaccard(
+            coverages1: np.ndarray, sizes1: np.ndarray,
+            coverages2: np.ndarray, sizes2: np.ndarray
+    ) -> np.ndarray:
+        intersection = np.sum(
+            _BITS_COUNTS[np.bitwise_and(coverages1, coverages2)], axis=1)
+        return intersection / (sizes1 + sizes2 - intersection)
@@ -1,41 +1,102 @@
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 
 from decision_rules.core.ruleset import AbstractRuleSet
 
+# number of coverage signatures processed at once when counting pairs of examples,
+# it bounds memory usage to (chunk size x number of signatures)
+_SIGNATURES_CHUNK_SIZE: int = 1024
+
 
 def calculate_ruleset_similarity(
-        ruleset1: AbstractRuleSet, ruleset2: AbstractRuleSet, dataset: pd.DataFrame
+        ruleset1: AbstractRuleSet, ruleset2: AbstractRuleSet, dataset: pd.DataFrame,
+        sample_size: Optional[int] = None, random_state: Optional[int] = None
 ) -> float:
     """
     Calculates the similarity between two rulesets based on the number of pairs of examples
-    that are covered by the same rules in both rulesets.
+    that are covered by the same rules in both rulesets. A pair of examples agrees if in both
+    rulesets it is covered by at least one common rule or in none of the rulesets it is.
+
+    Examples are grouped by their coverage signatures (sets of rules covering them in both
+    rulesets) and agreeing pairs are counted for pairs of signatures, so the memory usage
+    does not depend quadratically on the number of examples.
 
     :param ruleset1: first ruleset
     :param ruleset2: second ruleset
     :param dataset: dataset to calculate the similarity for
+    :param sample_size: optional number of randomly drawn pairs of examples used to
+        estimate the similarity (unbiased estimate), if None the exact similarity is
+        calculated
+    :param random_state: seed of the random number generator used for sampling pairs
     :return: similarity between the rulesets
     """
     # calculate covered indices matrices for both rulesets
-    matrix1 = ruleset1.calculate_coverage_matrix(dataset).T
-    matrix2 = ruleset2.calculate_coverage_matrix(dataset).T
+    matrix1 = ruleset1.calculate_coverage_matrix(dataset)
+    matrix2 = ruleset2.calculate_coverage_matrix(dataset)
     # Make sure they have the same number of examples
-    if matrix1.shape[1] != matrix2.shape[1]:
+    if matrix1.shape[0] != matrix2.shape[0]:
         raise ValueError("Wrong dimensions of the matrices")
+    if sample_size is not None:
+        return _estimate_agreeing_pairs_fraction(
+            matrix1, matrix2, sample_size, random_state)
     # calculate the number of possible pairs in the dataset overall (denominator)
-    dataset_size = matrix1.shape[1]
+    dataset_size = matrix1.shape[0]
     all_dataset_pairs = dataset_size * (dataset_size - 1) / 2
-    # calculate matrices of pairs - whether they are covered by at least one common rule
-    a1 = np.matmul(matrix1.T, matrix1)
-    a2 = np.matmul(matrix2.T, matrix2)
-    # complementary - whether a pair is covered by no common rule
-    b1 = np.logical_not(a1)
-    b2 = np.logical_not(a2)
-    # find overlap of those pairs between rulesets
-    a = np.logical_and(a1, a2)
-    b = np.logical_and(b1, b2)
-    # calculate numbers of pairs a and b
-    a = np.tril(a).sum() - a.trace()
-    b = np.tril(b).sum() - b.trace()
-    # return result
-    return (a + b) / all_dataset_pairs
+    return _count_agreeing_pairs(matrix1, matrix2) / all_dataset_pairs
+
+
+def _count_agreeing_pairs(matrix1: np.ndarray, matrix2: np.ndarray) -> int:
+    # group examples by their coverage signatures (packed rows of both matrices)
+    packed = np.packbits(np.hstack((matrix1, matrix2)), axis=1)
+    packed = np.ascontiguousarray(packed).view(
+        np.dtype((np.void, packed.shape[1]))).ravel()
+    _, first_indices, counts = np.unique(
+        packed, return_index=True, return_counts=True)
+    signatures1 = matrix1[first_indices].astype(np.float32)
+    signatures2 = matrix2[first_indices].astype(np.float32)
+    counts = counts.astype(np.int64)
+
+    # pairs of examples with the same signature agree if they are covered by rules
+    # in both rulesets or in none of them
+    agreeing_pairs = np.sum(np.where(
+        signatures1.any(axis=1) == signatures2.any(axis=1),
+        counts * (counts - 1) // 2,
+        0
+    ))
+    # pairs of examples with different signatures
+    for start in range(0, counts.shape[0], _SIGNATURES_CHUNK_SIZE):
+        end = start + _SIGNATURES_CHUNK_SIZE
+        # whether pairs of signatures share at least one rule in each ruleset
+        common1 = np.matmul(signatures1[start:end], signatures1.T) > 0
+        common2 = np.matmul(signatures2[start:end], signatures2.T) > 0
+        pairs_counts = counts[start:end, np.newaxis] * counts[np.newaxis, :]
+        # count each pair of signatures once
+        different_mask = (
+            np.arange(start, start + pairs_counts.shape[0])[:, np.newaxis] <
+            np.arange(counts.shape[0])[np.newaxis, :]
+        )
+        agreeing_pairs += np.sum(
+            pairs_counts[(common1 == common2) & different_mask])
+    return int(agreeing_pairs)
+
+
+def _estimate_agreeing_pairs_fraction(
+        matrix1: np.ndarray, matrix2: np.ndarray,
+        sample_size: int, random_state: Optional[int]
+) -> float:
+    if sample_size < 1:
+        raise ValueError(
+            f"sample_size should be a positive integer, got: {sample_size}")
+    dataset_size = matrix1.shape[0]
+    if dataset_size < 2:
+        raise ValueError("At least two examples are required to sample pairs")
+    rng = np.random.default_rng(random_state)
+    # draw pairs of different examples uniformly
+    first = rng.integers(dataset_size, size=sample_size)
+    second = rng.integers(dataset_size - 1, size=sample_size)
+    second[second >= first] += 1
+    common1 = np.any(matrix1[first] & matrix1[second], axis=1)
+    common2 = np.any(matrix2[first] & matrix2[second], axis=1)
+    return float(np.mean(common1 == common2))
@@ -43,36 +43,56 @@ def calculate_semantic_similarity_matrix(
     return similarity_matrix
 
 
+# number of examples processed at once when counting examples covered by pairs of
+# rules, it bounds memory usage and keeps float32 sums exact (below 2^24)
+_EXAMPLES_CHUNK_SIZE: int = 2 ** 16
+
+
 def _calculate_contingency_matrices(
         matrix1: np.array, matrix2: np.array
 ) -> tuple[np.array, np.array, np.array, np.array]:
     """
     Calculates the contingency matrices out of covered indices matrices for two rulesets.
+    Only the numbers of examples covered by both rules (a) are counted, the others
+    are derived from numbers of examples covered by each rule.
     :param matrix1: covered indices matrix for ruleset 1
     :param matrix2: covered indices matrix for ruleset 2
-    :return: contingency matrices a, b, c, d
+    :return: contingency matrices a, b, c, d (integer)
     """
-    numbers1 = matrix1.astype(np.float32)
-    numbers1_inverted = np.invert(matrix1).astype(np.float32)
-    numbers2 = matrix2.astype(np.float32)
-    numbers2_inverted = np.invert(matrix2).astype(np.float32)
-    a = np.matmul(numbers1, numbers2.T)
-    b = np.matmul(numbers1, numbers2_inverted.T)
-    c = np.matmul(numbers1_inverted, numbers2.T)
-    d = np.matmul(numbers1_inverted, numbers2_inverted.T)
+    a = _count_commonly_covered_examples(matrix1, matrix2)
+    b = np.count_nonzero(matrix1, axis=1)[:, np.newaxis] - a
+    c = np.count_nonzero(matrix2, axis=1)[np.newaxis, :] - a
+    d = matrix1.shape[1] - a - b - c
     return a, b, c, d
 
 
+def _count_commonly_covered_examples(matrix1: np.array, matrix2: np.array) -> np.array:
+    a = np.zeros((matrix1.shape[0], matrix2.shape[0]), dtype=np.int64)
+    for start in range(0, matrix1.shape[1], _EXAMPLES_CHUNK_SIZE):
+        end = start + _EXAMPLES_CHUNK_SIZE
+        # float32 multiplication uses BLAS and is exact for chunks of this size
+        a += np.matmul(
+            matrix1[:, start:end].astype(np.float32),
+            matrix2[:, start:end].astype(np.float32).T
+        ).astype(np.int64)
+    return a
+
+
 def _calculate_jaccard(matrix1: np.array, matrix2: np.array) -> np.array:
     a, b, c, d = _calculate_contingency_matrices(matrix1, matrix2)
-    return a / (a + b + c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return a / (a + b + c)
 
 
 def _calculate_corr(matrix1: np.array, matrix2: np.array) -> np.array:
     a, b, c, d = _calculate_contingency_matrices(matrix1, matrix2)
-    return (a * d - b * c) / np.sqrt((a + b) * (a + c) * (b + d) * (c + d))
+    # products of counts may overflow integers on large datasets
+    a, b, c, d = (x.astype(np.float64) for x in (a, b, c, d))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (a * d - b * c) / np.sqrt((a + b) * (a + c) * (b + d) * (c + d))
 
 
 def _calculate_kulcz(matrix1: np.array, matrix2: np.array) -> np.array:
     a, b, c, d = _calculate_contingency_matrices(matrix1, matrix2)
-    return 0.5 * ((a / (a + b)) + (a / (a + c)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 0.5 * ((a / (a + b)) + (a / (a + c)))
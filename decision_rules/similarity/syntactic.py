@@ -1,5 +1,4 @@
 from collections import defaultdict
-from itertools import product
 
 import numpy as np
 import pandas as pd
@@ -9,6 +8,9 @@ from decision_rules.conditions import NominalCondition
 from decision_rules.core.ruleset import AbstractRuleSet
 from decision_rules.core.simplifier import RulesetSimplifier
 
+# maximum number of elements of (rules1 x rules2 x attributes) arrays created at once
+_BLOCK_ELEMENTS_COUNT: int = 2 ** 22
+
 
 class SyntacticRuleSimilarityCalculator:
     """
@@ -20,29 +22,83 @@ class SyntacticRuleSimilarityCalculator:
         self.ruleset1 = RulesetSimplifier(ruleset1).simplify()
         self.ruleset2 = RulesetSimplifier(ruleset2).simplify()
         self.dataset = dataset
+        self._columns_bounds: dict[str, tuple[float, float]] = {}
         self.ruleset1 = self._parse_rules_to_conditions(self.ruleset1)
         self.ruleset2 = self._parse_rules_to_conditions(self.ruleset2)
 
     def calculate(self) -> np.ndarray:
         # calculate rule similarity in a matrix of rule pairs in a vectorized way
-        rule_pairs = np.array(list(product(self.ruleset1, self.ruleset2)))
-        result = [self._calculate_rule_sim(*rule_pair)
-                  for rule_pair in rule_pairs]
-        result = np.array(result)
-        result = result.reshape(len(self.ruleset1), len(self.ruleset2))
-        return result
-
-    def _calculate_rule_sim(self, rule1: dict, rule2: dict) -> float:
+        elementary_keys = sorted({
+            key for rule in self.ruleset1 + self.ruleset2 for key in rule["elementary"]
+        })
+        nominal_keys = sorted({
+            key for rule in self.ruleset1 + self.ruleset2 for key in rule["nominal"]
+        })
+        intervals1 = self._encode_elementary_conditions(
+            self.ruleset1, elementary_keys)
+        intervals2 = self._encode_elementary_conditions(
+            self.ruleset2, elementary_keys)
+        result = np.empty(
+            (len(self.ruleset1), len(self.ruleset2)), dtype=float)
+        # rules of the first ruleset are processed in blocks to bound memory usage
+        block_size = max(
+            1, _BLOCK_ELEMENTS_COUNT // max(1, len(self.ruleset2) * len(elementary_keys)))
+        for start in range(0, len(self.ruleset1), block_size):
+            end = start + block_size
+            result[start:end] = self._calculate_elementary_condition_sim_sums(
+                tuple(array[start:end] for array in intervals1), intervals2)
+        nominal_present1 = np.zeros(
+            (len(self.ruleset1), len(nominal_keys)), dtype=bool)
+        nominal_present2 = np.zeros(
+            (len(self.ruleset2), len(nominal_keys)), dtype=bool)
+        for i, key in enumerate(nominal_keys):
+            values_sets1, values_sets2 = self._encode_nominal_conditions(key)
+            nominal_present1[:, i] = values_sets1.any(axis=1)
+            nominal_present2[:, i] = values_sets2.any(axis=1)
+            result += self._calculate_nominal_condition_sim_sums(
+                values_sets1, values_sets2)
         # calculations for denominator
-        denominator = len(rule1["elementary"]) + len(rule2["elementary"]) + \
-            len(rule1["nominal"]) + len(rule2["nominal"])
-        # elementary conditions sums
-        elem_sum = self._calculate_elementary_condition_sim_sum(
-            rule1["elementary"], rule2["elementary"])
-        # nominal conditions sums
-        nomin_sum = self._calculate_nominal_condition_sim_sum(
-            rule1["nominal"], rule2["nominal"])
-        return (elem_sum + nomin_sum) / denominator
+        conditions_counts1 = intervals1[2].sum(
+            axis=1) + nominal_present1.sum(axis=1)
+        conditions_counts2 = intervals2[2].sum(
+            axis=1) + nominal_present2.sum(axis=1)
+        denominator = conditions_counts1[:, np.newaxis] + \
+            conditions_counts2[np.newaxis, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return result / denominator
+
+    @staticmethod
+    def _encode_elementary_conditions(
+            rules: list[dict], keys: list[str]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # dense (rules x attributes) arrays of intervals boundaries and presence
+        left = np.zeros((len(rules), len(keys)), dtype=float)
+        right = np.zeros((len(rules), len(keys)), dtype=float)
+        present = np.zeros((len(rules), len(keys)), dtype=bool)
+        keys_indices = {key: i for i, key in enumerate(keys)}
+        for i, rule in enumerate(rules):
+            for key, (left_boundary, right_boundary) in rule["elementary"].items():
+                j = keys_indices[key]
+                left[i, j] = left_boundary
+                right[i, j] = right_boundary
+                present[i, j] = True
+        return left, right, present
+
+    def _encode_nominal_conditions(self, key: str) -> tuple[np.ndarray, np.ndarray]:
+        # (rules x values) sets of values of conditions on the given attribute
+        values_indices: dict = {}
+        for rule in self.ruleset1 + self.ruleset2:
+            for value in rule["nominal"].get(key, []):
+                values_indices.setdefault(value, len(values_indices))
+        values_sets = []
+        for rules in (self.ruleset1, self.ruleset2):
+            rules_values_sets = np.zeros(
+                (len(rules), len(values_indices)), dtype=bool)
+            for i, rule in enumerate(rules):
+                for value in rule["nominal"].get(key, []):
+                    rules_values_sets[i, values_indices[value]] = True
+            values_sets.append(rules_values_sets)
+        return values_sets[0], values_sets[1]
 
     def _parse_rules_to_conditions(self, ruleset: AbstractRuleSet) -> list[dict]:
         rules = []
@@ -72,39 +128,41 @@ class SyntacticRuleSimilarityCalculator:
         # if a condition is one-sided, change the appropriate +/- inf bound
         # to the actual max/min value of the column in the dataset
         if boundary == float("inf"):
-            return self.dataset[column_name].max()
+            return self._get_column_bounds(column_name)[1]
         if boundary == float("-inf"):
-            return self.dataset[column_name].min()
+            return self._get_column_bounds(column_name)[0]
         return boundary
 
-    def _calculate_elementary_condition_sim_sum(self, elementary_conditions1, elementary_conditions2) -> float:
-        keys = set(elementary_conditions1) & set(elementary_conditions2)
-        sim_sum = 0.0
-        for key in keys:
-            interval1, interval2 = elementary_conditions1[key], elementary_conditions2[key]
-            overlap = self._calculate_overlap(interval1, interval2)
-            rirj = overlap / (interval1[1] - interval1[0])
-            sim_sum += rirj
-            rjri = overlap / (interval2[1] - interval2[0])
-            sim_sum += rjri
-        return sim_sum
+    def _get_column_bounds(self, column_name: str) -> tuple[float, float]:
+        if column_name not in self._columns_bounds:
+            column = self.dataset[column_name]
+            self._columns_bounds[column_name] = column.min(), column.max()
+        return self._columns_bounds[column_name]
 
     @staticmethod
-    def _calculate_nominal_condition_sim_sum(nominal_conditions1, nominal_conditions2) -> float:
-        keys = set(nominal_conditions1) & set(nominal_conditions2)
-        sim_sum = 0.0
-        for key in keys:
-            overlap = set(nominal_conditions1[key]) & set(
-                nominal_conditions2[key])
-            set_ij = set(nominal_conditions1[key])
-            set_ji = set(nominal_conditions2[key])
-            sim_sum += len(overlap) / len(set_ij)
-            sim_sum += len(overlap) / len(set_ji)
-        return sim_sum
+    def _calculate_elementary_condition_sim_sums(
+            intervals1: tuple[np.ndarray, np.ndarray, np.ndarray],
+            intervals2: tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> np.ndarray:
+        # broadcast to (rules1 x rules2 x attributes) arrays
+        left1, right1, present1 = (array[:, np.newaxis, :]
+                                   for array in intervals1)
+        left2, right2, present2 = (array[np.newaxis, :, :]
+                                   for array in intervals2)
+        overlap = np.maximum(
+            0.0, np.minimum(right1, right2) - np.maximum(left1, left2))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sims = overlap / (right1 - left1) + overlap / (right2 - left2)
+        return np.sum(np.where(present1 & present2, sims, 0.0), axis=2)
 
     @staticmethod
-    def _calculate_overlap(interval1: tuple[float, float], interval2: tuple[float, float]) -> float:
-        # helper function to calculate overlap between two intervals
-        left_bound = max(interval1[0], interval2[0])
-        right_bound = min(interval1[1], interval2[1])
-        return max(0.0, right_bound - left_bound)
+    def _calculate_nominal_condition_sim_sums(
+            values_sets1: np.ndarray, values_sets2: np.ndarray
+    ) -> np.ndarray:
+        overlap = np.matmul(
+            values_sets1.astype(float), values_sets2.astype(float).T)
+        sizes1 = values_sets1.sum(axis=1)[:, np.newaxis]
+        sizes2 = values_sets2.sum(axis=1)[np.newaxis, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sims = overlap / sizes1 + overlap / sizes2
+        return np.where((sizes1 > 0) & (sizes2 > 0), sims, 0.0)
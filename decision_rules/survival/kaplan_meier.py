@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import warnings
 from bisect import bisect_left
 from typing import Optional
 from typing import TypedDict
@@ -36,77 +37,370 @@ class SurvInfo:
         self.sq: np.ndarray = np.zeros(shape=len(time))
 
 
+def encode_survival_status(survival_status: np.ndarray) -> np.ndarray:
+    """Encodes survival status into a boolean mask of event occurrence. Already
+    encoded (boolean) arrays are returned unchanged, so the (expensive) string
+    comparison is only performed once at the API boundary.
+
+    Args:
+        survival_status (np.ndarray): survival status, either boolean array or
+            array of "0" (censored) and "1" (event) strings
+
+    Returns:
+        np.ndarray: boolean array, True for examples with event occurrence
+    """
+    survival_status = np.asarray(survival_status)
+    if survival_status.dtype == bool:
+        return survival_status
+    return survival_status == "1"
+
+
+def discretize_survival_time(
+    survival_time: np.ndarray, time_grid: np.ndarray
+) -> np.ndarray:
+    """Rounds survival times up to the nearest point of the time grid.
+
+    Args:
+        survival_time (np.ndarray): survival times
+        time_grid (np.ndarray): sorted time grid, its last point should not be
+            lower than any of the survival times
+
+    Raises:
+        ValueError: if any of the survival times is greater than the last grid point
+
+    Returns:
+        np.ndarray: discretized survival times
+    """
+    survival_time = np.asarray(survival_time, dtype=float)
+    time_grid = np.asarray(time_grid, dtype=float)
+    indices: np.ndarray = np.searchsorted(
+        time_grid, survival_time, side="left")
+    if np.any(indices >= time_grid.shape[0]):
+        raise ValueError(
+            "Time grid should cover all survival times. Its last point is "
+            + f"{time_grid[-1]} but maximum survival time is {survival_time.max()}."
+        )
+    return time_grid[indices]
+
+
+def _group_sorted_survival_data(
+    survival_time: np.ndarray,
+    events_mask: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Groups survival data sorted ascending by survival time by unique times.
+
+    Args:
+        survival_time (np.ndarray): sorted survival times
+        events_mask (np.ndarray): boolean mask of examples with event occurrence
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: unique times, events
+            counts, censored counts and at risk counts
+    """
+    groups_starts: np.ndarray = np.concatenate((
+        [0], np.flatnonzero(survival_time[1:] != survival_time[:-1]) + 1
+    ))
+    groups_sizes: np.ndarray = np.diff(
+        np.append(groups_starts, survival_time.shape[0])
+    )
+    events_count: np.ndarray = np.add.reduceat(
+        events_mask.astype(int), groups_starts
+    )
+    censored_count: np.ndarray = groups_sizes - events_count
+    at_risk_count: np.ndarray = survival_time.shape[0] - np.concatenate((
+        [0], np.cumsum(groups_sizes)[:-1]
+    ))
+    return (
+        survival_time[groups_starts],
+        events_count,
+        censored_count,
+        at_risk_count,
+    )
+
+
+def _calculate_qth_survival_time(
+    q: float, times: np.ndarray, probabilities: np.ndarray
+) -> float:
+    """Returns the time when survival function reaches the qth percentile, that is,
+    solves  :math:`q = S(t)` for :math:`t`. Returns infinity if survival function
+    never reaches it.
+    """
+    if len(times) == 0 or probabilities[-1] > q:
+        return np.inf
+    return times[np.searchsorted(-probabilities, -q, side="left")]
+
+
+def _calculate_probabilities(
+    events_count: np.ndarray, at_risk_count: np.ndarray
+) -> np.ndarray:
+    """Calculates Kaplan-Meier survival probabilities from events and at risk counts.
+
+    Returns:
+        np.ndarray: survival probabilities
+    """
+    probability: np.ndarray = np.zeros(shape=at_risk_count.shape)
+    non_zero_probability_mask = at_risk_count != 0
+    masked_at_risk_count = at_risk_count[non_zero_probability_mask]
+    probability[non_zero_probability_mask] = (
+        masked_at_risk_count - events_count[non_zero_probability_mask]
+    ) / masked_at_risk_count
+    return np.cumprod(probability)
+
+
+def _calculate_greenwood_bounds(
+    probabilities: np.ndarray,
+    cumulative_sq: np.ndarray,
+    alpha: float = 0.05,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates confidence interval of the survival function using the exponential
+    Greenwood formula. See https://www.math.wustl.edu/%7Esawyer/handouts/greenwood.pdf
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: lower and upper bounds of the survival function
+    """
+    z = norm.ppf(1 - alpha / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.log(probabilities)
+        lower_bound = np.exp(-np.exp(np.log(-v) - z *
+                             np.sqrt(cumulative_sq) / v))
+        upper_bound = np.exp(-np.exp(np.log(-v) + z *
+                             np.sqrt(cumulative_sq) / v))
+    lower_bound[np.isnan(lower_bound)] = 1.0
+    upper_bound[np.isnan(upper_bound)] = 1.0
+    return lower_bound, upper_bound
+
+
+def _calculate_survival_function_bounds(
+    events_counts: np.ndarray,
+    at_risk_counts: np.ndarray,
+    probabilities: np.ndarray,
+    alpha: float = 0.05,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates confidence interval of the survival function from events and
+    at risk counts.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: lower and upper bounds of the survival function
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tmp = events_counts / \
+            (at_risk_counts * (at_risk_counts - events_counts))
+    cumulative_sq = np.cumsum(np.nan_to_num(tmp, posinf=0, neginf=0))
+    return _calculate_greenwood_bounds(probabilities, cumulative_sq, alpha)
+
+
+def _create_bounds_frame(
+    times: np.ndarray,
+    lower_bound: np.ndarray,
+    upper_bound: np.ndarray,
+    alpha: float = 0.05,
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "prob_lower_%g" % (1 - alpha): lower_bound,
+            "prob_upper_%g" % (1 - alpha): upper_bound,
+        },
+        index=times,
+    )
+
+
+def _calculate_median_survival_time_ci(
+    times: np.ndarray,
+    events_counts: np.ndarray,
+    at_risk_counts: np.ndarray,
+    probabilities: np.ndarray,
+    alpha: float = 0.05,
+) -> tuple[float, float]:
+    """Calculates confidence interval of the median survival time as medians of the
+    lower and upper bounds of the survival function.
+
+    Returns:
+        tuple[float, float]: lower and upper bound of the median survival time
+    """
+    if len(times) == 0:
+        return np.inf, np.inf
+    lower_bound, upper_bound = _calculate_survival_function_bounds(
+        events_counts, at_risk_counts, probabilities, alpha
+    )
+    return (
+        _calculate_qth_survival_time(0.5, times, lower_bound),
+        _calculate_qth_survival_time(0.5, times, upper_bound),
+    )
+
+
+def _warn_deprecated(name: str, replacement: str):
+    warnings.warn(
+        f"KaplanMeierEstimator.{name} is deprecated and will be removed in "
+        + f"a future version, use {replacement} instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
 class KaplanMeierEstimator:
+    """Kaplan-Meier estimator of the survival function. All of its data (times,
+    events, censored and at risk counts and probabilities) is stored in a single
+    structured numpy array of `KaplanMeierEstimator.DTYPE` type and the estimator
+    has no instance dictionary, so estimators of many rules take little memory.
+    Attributes such as `times` or `probabilities` are views of this array.
+    """
+
+    DTYPE: np.dtype = np.dtype([
+        ("time", np.float64),
+        ("events_count", np.int64),
+        ("censored_count", np.int64),
+        ("at_risk_count", np.int64),
+        ("probability", np.float64),
+    ])
+
+    __slots__ = (
+        "_data",
+        "median_survival_time",
+        "median_survival_time_ci_lower",
+        "median_survival_time_ci_upper",
+        "restricted_mean_survival_time",
+    )
 
     def __init__(self, surv_info: Optional[SurvInfo] = None) -> None:
         self.median_survival_time: float = None
-        self.median_survival_time_cli: float = None
+        self.median_survival_time_ci_lower: float = None
+        self.median_survival_time_ci_upper: float = None
         self.restricted_mean_survival_time: float = None
-        self.interval: float = None
-
-        self.times: np.ndarray = np.array([])
-        self.events_counts: np.ndarray = np.array([])
-        self.censored_counts: np.ndarray = np.array([])
-        self.at_risk_counts: np.ndarray = np.array([])
-        self.probabilities: np.ndarray = np.array([])
-
-        if surv_info is None:
-            self._surv_info: SurvInfo = SurvInfo(
-                time=np.array([]),
-                events_count=np.array([]),
-                censored_count=np.array([]),
-                at_risk_count=np.array([]),
-                probability=np.array([]),
-            )
-        else:
-            self._surv_info: SurvInfo = surv_info
-            self.process_surv_info(self._surv_info)
+
+        self._data: np.ndarray = np.empty(
+            shape=(0,), dtype=KaplanMeierEstimator.DTYPE)
+
+        if surv_info is not None:
+            self.process_surv_info(surv_info)
             self._update_additional_indicators()
 
+    @staticmethod
+    def _create_data(
+        time: np.ndarray,
+        events_count: np.ndarray,
+        censored_count: np.ndarray,
+        at_risk_count: np.ndarray,
+        probability: np.ndarray,
+    ) -> np.ndarray:
+        data: np.ndarray = np.empty(
+            shape=(len(time),), dtype=KaplanMeierEstimator.DTYPE)
+        data["time"] = time
+        data["events_count"] = events_count
+        data["censored_count"] = censored_count
+        data["at_risk_count"] = at_risk_count
+        data["probability"] = probability
+        return data
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._data["time"]
+
+    @property
+    def events_counts(self) -> np.ndarray:
+        return self._data["events_count"]
+
+    @property
+    def censored_counts(self) -> np.ndarray:
+        return self._data["censored_count"]
+
+    @property
+    def at_risk_counts(self) -> np.ndarray:
+        return self._data["at_risk_count"]
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._data["probability"]
+
+    @property
+    def len_of_times(self) -> int:
+        return self._data.shape[0]
+
+    @property
+    def events_count_sum(self) -> int:
+        return np.sum(self._data["events_count"])
+
+    @property
+    def censored_count_sum(self) -> int:
+        return np.sum(self._data["censored_count"])
+
     @property
     def surv_info(self) -> SurvInfo:
-        return self._surv_info
+        """Estimator data in a form of SurvInfo object. It is built on demand and
+        its arrays are views of the estimator data.
+        """
+        return SurvInfo(
+            time=self.times,
+            events_count=self.events_counts,
+            censored_count=self.censored_counts,
+            at_risk_count=self.at_risk_counts,
+            probability=self.probabilities,
+        )
 
     @surv_info.setter
     def surv_info(self, surv_info: SurvInfo):
-        self._surv_info = surv_info
         self.process_surv_info(surv_info)
 
-    def process_surv_info(self, surv_info: SurvInfo):
-        self.times = surv_info.time
-        self.events_counts = surv_info.events_count
-        self.censored_counts = surv_info.censored_count
-        self.at_risk_counts = surv_info.at_risk_count
-        self.probabilities = surv_info.probability
+    @property
+    def interval(self) -> Optional[pd.DataFrame]:
+        """Confidence intervals of the survival function. This DataFrame is built
+        on demand and is not stored in the estimator.
+        """
+        if len(self.times) == 0:
+            return None
+        return self.calculate_interval()
 
-        self.len_of_times = len(surv_info.time)
-        self.events_count_sum = np.sum(surv_info.events_count)
-        self.censored_count_sum = np.sum(surv_info.censored_count)
+    @property
+    def median_survival_time_cli(self) -> Optional[pd.DataFrame]:
+        """Confidence interval of the median survival time in a form of single-row
+        DataFrame (kept for backward compatibility). Use `median_survival_time_ci_lower`
+        and `median_survival_time_ci_upper` attributes to avoid building it.
+        """
+        if self.median_survival_time_ci_lower is None:
+            return None
+        return pd.DataFrame(
+            {
+                "prob_lower_0.95": [self.median_survival_time_ci_lower],
+                "prob_upper_0.95": [self.median_survival_time_ci_upper],
+            },
+            index=[0.5],
+        )
+
+    def process_surv_info(self, surv_info: SurvInfo):
+        self._data = KaplanMeierEstimator._create_data(
+            time=surv_info.time,
+            events_count=surv_info.events_count,
+            censored_count=surv_info.censored_count,
+            at_risk_count=surv_info.at_risk_count,
+            probability=surv_info.probability,
+        )
 
     def update(
         self,
         kaplan_meier_estimator_dict: KaplanMeierEstimatorDict,
         update_additional_indicators: bool = False,
     ) -> KaplanMeierEstimator:
-        kaplan_meier_estimator_dict: KaplanMeierEstimatorDict = {
-            k: np.array(v) for k, v in kaplan_meier_estimator_dict.items()
-        }
-        self.surv_info = SurvInfo(
+        self._data = KaplanMeierEstimator._create_data(
             time=kaplan_meier_estimator_dict["times"],
             events_count=kaplan_meier_estimator_dict["events_count"],
             censored_count=kaplan_meier_estimator_dict["censored_count"],
             at_risk_count=kaplan_meier_estimator_dict["at_risk_count"],
             probability=kaplan_meier_estimator_dict["probabilities"],
         )
-        self.process_surv_info(self.surv_info)
         if update_additional_indicators:
             self._update_additional_indicators()
         return self
 
     def _update_additional_indicators(self):
-        self.interval = self.calculate_interval()
-        self.median_survival_time, self.median_survival_time_cli = (
-            self.calcualte_indicators()
+        self.median_survival_time = _calculate_qth_survival_time(
+            0.5, self.times, self.probabilities
+        )
+        self.median_survival_time_ci_lower, self.median_survival_time_ci_upper = (
+            _calculate_median_survival_time_ci(
+                self.times,
+                self.events_counts,
+                self.at_risk_counts,
+                self.probabilities,
+            )
         )
 
     def fit(
@@ -114,6 +408,7 @@ class KaplanMeierEstimator:
         survival_time: np.ndarray,
         survival_status: np.ndarray,
         skip_sorting: bool = False,
+        time_grid: Optional[np.ndarray] = None,
     ) -> KaplanMeierEstimator:
         """Fit Kaplan Meier estimator on given data
 
@@ -124,195 +419,148 @@ class KaplanMeierEstimator:
                 on survival time. It could be used to speed up the computation if the provided
                 data is already sorted ascending by survival time. Defaults to False (this method
                 will sort the data under the hood).
+            time_grid (Optional[np.ndarray], optional): Optional sorted time grid. If passed,
+                every survival time is rounded up to the nearest grid point, so the estimator
+                has at most as many entries as there are grid points. Defaults to None.
 
         Returns:
             KaplanMeierEstimator: fitted estimator
         """
+        survival_time = np.asarray(survival_time)
+        survival_status = np.asarray(survival_status)
         if survival_time.shape[0] == 0:
             return self
 
         if not skip_sorting:
             # sort surv_info_list by survival_time
-            sorted_indices = np.argsort(survival_time)
+            sorted_indices = np.argsort(survival_time, kind="stable")
             survival_time = survival_time[sorted_indices]
             survival_status = survival_status[sorted_indices]
+        if time_grid is not None:
+            survival_time = discretize_survival_time(survival_time, time_grid)
 
-        events_ocurences: np.ndarray = survival_status == "1"
-        censored_ocurences = np.logical_not(events_ocurences).astype(int)
-        events_ocurences = events_ocurences.astype(int)
-
-        events_counts = events_ocurences
-        censored_counts = censored_ocurences
-        at_risk_count = np.zeros(shape=survival_time.shape)
-
-        at_risk_count = survival_time.shape[0]
-        grouped_data = {
-            "events_count": {},
-            "censored_count": {},
-            "at_risk_count": {},
-        }
-        time_point_prev = survival_time[0]
-        for time_point, event_count, censored_count in zip(
-            survival_time, events_counts, censored_counts
-        ):
-            if time_point != time_point_prev:
-                grouped_data["at_risk_count"][time_point_prev] = at_risk_count
-                at_risk_count -= grouped_data["events_count"][time_point_prev]
-                at_risk_count -= grouped_data["censored_count"][time_point_prev]
-                time_point_prev = time_point
-            if time_point in grouped_data["events_count"]:
-                grouped_data["events_count"][time_point] += event_count
-                grouped_data["censored_count"][time_point] += censored_count
-            else:
-                grouped_data["events_count"][time_point] = event_count
-                grouped_data["censored_count"][time_point] = censored_count
-
-        grouped_data["at_risk_count"][time_point] = at_risk_count
-
-        unique_times = np.array(list(grouped_data["events_count"].keys()))
-        events_count = np.array(list(grouped_data["events_count"].values()))
-        censored_count = np.array(
-            list(grouped_data["censored_count"].values()))
-        at_risk_count = np.array(list(grouped_data["at_risk_count"].values()))
-
-        surv_info = SurvInfo(
+        unique_times, events_count, censored_count, at_risk_count = (
+            _group_sorted_survival_data(
+                survival_time, encode_survival_status(survival_status)
+            )
+        )
+        self._data = KaplanMeierEstimator._create_data(
             time=unique_times,
             events_count=events_count,
             censored_count=censored_count,
             at_risk_count=at_risk_count,
-            probability=np.zeros(shape=unique_times.shape),
+            probability=_calculate_probabilities(events_count, at_risk_count),
         )
-
-        surv_info = self.calculate_probabilities(surv_info)
-        self.surv_info = surv_info
         self._update_additional_indicators()
         return self
 
     def calculate_probabilities(self, surv_info: SurvInfo) -> SurvInfo:
-        surv_info.probability = np.zeros(shape=surv_info.at_risk_count.shape)
-        non_zero_probability_mask = surv_info.at_risk_count != 0
-
-        masked_at_risk_count = surv_info.at_risk_count[non_zero_probability_mask]
-        events_count = surv_info.events_count[non_zero_probability_mask]
-
-        surv_info.probability[non_zero_probability_mask] = (
-            masked_at_risk_count - events_count
-        ) / masked_at_risk_count
-        surv_info.probability = np.cumprod(surv_info.probability)
+        surv_info.probability = _calculate_probabilities(
+            surv_info.events_count, surv_info.at_risk_count
+        )
         return surv_info
 
     def calculate_interval(self) -> pd.DataFrame:
-        with np.errstate(divide="ignore", invalid="ignore"):
-            tmp = self.events_counts / (
-                self.at_risk_counts *
-                (self.at_risk_counts - self.events_counts)
-            )
-        cumulative_sq_ = np.cumsum(np.nan_to_num(tmp, posinf=0, neginf=0))
-        return self.calculate_bounds(self.times, self.probabilities, cumulative_sq_)
-
-    def calcualte_indicators(self) -> tuple[float, float]:
-        survival_function = pd.DataFrame(index=self.times)
-        survival_function["KM_estimate"] = self.probabilities
-        median_survival_time = self.calculate_median_survival_time(
-            survival_function)
-        median_survival_time_cli = self.calculate_median_survival_time(
-            self.interval)
-        return median_survival_time, median_survival_time_cli
+        lower_bound, upper_bound = _calculate_survival_function_bounds(
+            self.events_counts, self.at_risk_counts, self.probabilities
+        )
+        return _create_bounds_frame(self.times, lower_bound, upper_bound)
+
+    def calcualte_indicators(self) -> tuple[float, pd.DataFrame]:
+        """Deprecated, use `median_survival_time` and `median_survival_time_cli`
+        attributes instead.
+        """
+        _warn_deprecated(
+            "calcualte_indicators",
+            "median_survival_time and median_survival_time_cli attributes",
+        )
+        return self.median_survival_time, self.median_survival_time_cli
 
     def calculate_median_survival_time(
         self, survival_function: pd.DataFrame
     ) -> Union[float, pd.DataFrame]:
-        return self.qth_survival_times(0.5, survival_function)
+        """Deprecated, use `median_survival_time` attribute instead.
+        """
+        _warn_deprecated(
+            "calculate_median_survival_time", "median_survival_time attribute"
+        )
+        return self._calculate_qth_survival_times(0.5, survival_function)
 
     def qth_survival_times(
         self, q: float, survival_functions: pd.DataFrame
     ) -> Union[float, pd.DataFrame]:
+        """Deprecated, find the times when one or more survival functions reach the
+        qth percentile.
         """
-        Find the times when one or more survival functions reach the qth percentile.
-        """
-        # pylint: disable=cell-var-from-loop,misplaced-comparison-constant,no-else-return
-        q = self._to_1d_array(q)
-        q = pd.Series(q.reshape(q.size), dtype=float)
-
-        if not ((q <= 1).all() and (0 <= q).all()):
-            raise ValueError("q must be between 0 and 1")
-
-        if survival_functions.shape[1] == 1 and q.shape == (1,):
-            q = q[0]
-            return survival_functions.apply(
-                lambda s: self.qth_survival_time(q, s)
-            ).iloc[0]
-        else:
-            d = {
-                _q: survival_functions.apply(
-                    lambda s: self.qth_survival_time(_q, s))
-                for _q in q
-            }
-            survival_times = pd.DataFrame(d).T
-            if q.duplicated().any():
-                survival_times = survival_times.loc[q]
-
-            return survival_times
+        _warn_deprecated(
+            "qth_survival_times", "median_survival_time attribute"
+        )
+        return self._calculate_qth_survival_times(q, survival_functions)
 
     def qth_survival_time(
         self, q: float, survival_function: Union[pd.DataFrame, pd.Series]
     ) -> float:
+        """Deprecated, returns the time when a single survival function reaches
+        the qth percentile, that is, solves  :math:`q = S(t)` for :math:`t`.
         """
-        Returns the time when a single survival function reaches the qth percentile, that is,
-        solves  :math:`q = S(t)` for :math:`t`.
-        """
+        _warn_deprecated(
+            "qth_survival_time", "median_survival_time attribute"
+        )
         if isinstance(survival_function, pd.DataFrame):
             if survival_function.shape[1] > 1:
                 raise ValueError(
-                    "Expecting a DataFrame (or Series) with a single column. Provide that or use utils.qth_survival_times."
+                    "Expecting a DataFrame (or Series) with a single column."
                 )
-            return self.qth_survival_time(q, survival_function.T.squeeze())
-        elif isinstance(survival_function, pd.Series):
-            if survival_function.iloc[-1] > q:
-                return np.inf
-            return survival_function.index[(-survival_function).searchsorted([-q])[0]]
-        else:
+            survival_function = survival_function.iloc[:, 0]
+        if not isinstance(survival_function, pd.Series):
             raise ValueError(
-                "Unable to compute median of object %s - should be a DataFrame, Series or lifelines univariate model"
-                % survival_function
+                f"Unable to compute median of object {survival_function} - "
+                + "should be a DataFrame or Series"
             )
-
-    def _to_1d_array(self, x) -> np.ndarray:
-        v = np.atleast_1d(x)
-        try:
-            if v.shape[0] > 1 and v.shape[1] > 1:
-                raise ValueError("Wrong shape (2d) given to _to_1d_array")
-        except IndexError:
-            pass
-        return v
+        return _calculate_qth_survival_time(
+            q, survival_function.index.to_numpy(), survival_function.to_numpy()
+        )
 
     def calculate_bounds(
         self,
-        times: np.array,
-        probabilities: np.array,
-        cumulative_sq: np.array,
-        alpha=0.05,
+        times: np.ndarray,
+        probabilities: np.ndarray,
+        cumulative_sq: np.ndarray,
+        alpha: float = 0.05,
     ) -> pd.DataFrame:
-        # This method calculates confidence intervals using the exponential Greenwood formula.
-        # See https://www.math.wustl.edu/%7Esawyer/handouts/greenwood.pdf
-        z = norm.ppf(1 - alpha / 2)
-        df = pd.DataFrame(index=times)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            v = np.array(np.log(probabilities)).reshape(-1, 1)
-            cumulative_sq_ = np.array(cumulative_sq).reshape(-1, 1)
-
-            ci_labels = [
-                "%s_lower_%g" % ("prob", 1 - alpha),
-                "%s_upper_%g" % ("prob", 1 - alpha),
-            ]
-
-            df[ci_labels[0]] = np.exp(
-                -np.exp(np.log(-v) - z * np.sqrt(cumulative_sq_) / v)
-            )
-            df[ci_labels[1]] = np.exp(
-                -np.exp(np.log(-v) + z * np.sqrt(cumulative_sq_) / v)
-            )
-        return df.fillna(1.0)
+        """Deprecated, use `calculate_interval` instead.
+        """
+        _warn_deprecated("calculate_bounds", "calculate_interval")
+        lower_bound, upper_bound = _calculate_greenwood_bounds(
+            np.asarray(probabilities, dtype=float),
+            np.asarray(cumulative_sq, dtype=float),
+            alpha,
+        )
+        return _create_bounds_frame(times, lower_bound, upper_bound, alpha)
+
+    @staticmethod
+    def _calculate_qth_survival_times(
+        q: float, survival_functions: pd.DataFrame
+    ) -> Union[float, pd.DataFrame]:
+        q = np.atleast_1d(np.asarray(q, dtype=float)).reshape(-1)
+        if not ((q <= 1).all() and (q >= 0).all()):
+            raise ValueError("q must be between 0 and 1")
+        times: np.ndarray = survival_functions.index.to_numpy()
+        survival_times = pd.DataFrame(
+            {
+                column: [
+                    _calculate_qth_survival_time(
+                        q_value, times, survival_functions[column].to_numpy()
+                    )
+                    for q_value in q
+                ]
+                for column in survival_functions.columns
+            },
+            index=q,
+        )
+        if survival_functions.shape[1] == 1 and q.shape == (1,):
+            return survival_times.iloc[0, 0]
+        return survival_times
 
     @staticmethod
     def average(estimators: list[KaplanMeierEstimator]) -> KaplanMeierEstimator:
@@ -330,19 +578,15 @@ class KaplanMeierEstimator:
             )
             probabilities[i] = probabilities_sum / number_of_estimators
 
-        surv_info = SurvInfo(
+        avg_estimator = KaplanMeierEstimator()
+        avg_estimator._data = KaplanMeierEstimator._create_data(  # pylint: disable=protected-access
             time=unique_times,
-            events_count=np.zeros(shape=unique_times.shape),
-            censored_count=np.zeros(shape=unique_times.shape),
-            at_risk_count=np.zeros(shape=unique_times.shape),
+            events_count=0,
+            censored_count=0,
+            at_risk_count=0,
             probability=probabilities,
         )
-        avg_estimator = KaplanMeierEstimator()
-        avg_estimator.surv_info = surv_info
-        avg_estimator.interval = avg_estimator.calculate_interval()
-        avg_estimator.median_survival_time, avg_estimator.median_survival_time_cli = (
-            avg_estimator.calcualte_indicators()
-        )
+        avg_estimator._update_additional_indicators()  # pylint: disable=protected-access
         return avg_estimator
 
     def binary_search(self, arr, target):
@@ -365,6 +609,25 @@ class KaplanMeierEstimator:
 
         return self.probabilities[index - 1]
 
+    def get_probabilities_at(self, times: np.ndarray) -> np.ndarray:
+        """Vectorized version of `get_probability_at` evaluating the survival
+        function at many time points at once.
+
+        Args:
+            times (np.ndarray): time points
+
+        Returns:
+            np.ndarray: survival probabilities at given time points
+        """
+        times = np.asarray(times, dtype=float)
+        if len(self.times) == 0:
+            return np.ones(shape=times.shape)
+        indices = np.searchsorted(self.times, times, side="right") - 1
+        probabilities = np.ones(shape=times.shape)
+        known_mask = indices >= 0
+        probabilities[known_mask] = self.probabilities[indices[known_mask]]
+        return probabilities
+
     def get_events_count_at(self, time: int) -> int:
         index = self.binary_search(self.times, time)
         if index >= 0:
@@ -386,16 +649,18 @@ class KaplanMeierEstimator:
         return self.at_risk_counts[index]
 
     def reverse(self) -> KaplanMeierEstimator:
-        surv_info_rev = SurvInfo(
-            time=np.copy(self.surv_info.time),
-            # notice how events_count and censored_count are switche
-            events_count=np.copy(self.surv_info.censored_count),
-            censored_count=np.copy(self.surv_info.events_count),
-            at_risk_count=np.copy(self.surv_info.at_risk_count),
-            probability=np.zeros(shape=self.times.shape),
+        # notice how events_count and censored_count are switched
+        events_count: np.ndarray = self.censored_counts
+        at_risk_count: np.ndarray = self.at_risk_counts
+        rev_km = KaplanMeierEstimator()
+        rev_km._data = KaplanMeierEstimator._create_data(  # pylint: disable=protected-access
+            time=self.times,
+            events_count=events_count,
+            censored_count=self.events_counts,
+            at_risk_count=at_risk_count,
+            probability=_calculate_probabilities(events_count, at_risk_count),
         )
-        surv_info_rev = self.calculate_probabilities(surv_info_rev)
-        rev_km = KaplanMeierEstimator(surv_info=surv_info_rev)
+        rev_km._update_additional_indicators()  # pylint: disable=protected-access
         return rev_km
 
     @staticmethod
@@ -44,6 +44,18 @@ class SurvivalPrediction(TypedDict):
         ))
 
 
+class SurvivalMatrixPrediction(TypedDict):
+    """Object describing survival prediction for many examples on a shared
+    time grid. Row `i` of `probabilities` contains the survival function of
+    the i-th example evaluated at `times`. Examples for which no prediction
+    could be made (uncovered examples with disabled default conclusion) have
+    their rows and median survival times filled with NaN.
+    """
+    times: np.ndarray
+    probabilities: np.ndarray
+    median_survival_times: np.ndarray
+
+
 class VotingPredictionStrategy(PredictionStrategy):
     """Voting prediction strategy for survival prediction.
 
@@ -1,10 +1,21 @@
+from __future__ import annotations
+
+from typing import Optional
 from typing import TypedDict
+from typing import Union
 
 import numpy as np
 import pandas as pd
 
+from decision_rules.core.exceptions import InvalidStateError
+from decision_rules.core.prediction_indicators import \
+    AbstractPredictionIndicatorsAccumulator
 from decision_rules.problem import ProblemTypes
 from decision_rules.survival import SurvivalRuleSet
+from decision_rules.survival.kaplan_meier import encode_survival_status
+from decision_rules.survival.kaplan_meier import KaplanMeierEstimator
+from decision_rules.survival.prediction import SurvivalMatrixPrediction
+from decision_rules.survival.prediction import SurvivalPrediction
 
 
 class SurvivalGeneralPredictionIndicators(TypedDict):
@@ -61,3 +72,193 @@ def calculate_for_survival(
             Not_covered_by_prediction=not_covered_by_prediction,
         )
     )
+
+
+class SurvivalPredictionIndicatorsAccumulator(AbstractPredictionIndicatorsAccumulator):
+    """Mergeable accumulator of survival predictions. Integrated Brier Score
+    is calculated on a fixed time grid. For each point of the grid the
+    accumulator stores the sum of Brier score components of all ingested
+    covered examples, so its memory usage does not depend on the number of
+    examples. When the grid consists of all distinct survival times of the
+    evaluated examples, the result is the same as the one calculated by
+    `SurvivalRuleSet.integrated_bier_score` method.
+
+    Args:
+        ruleset (SurvivalRuleSet): ruleset used for prediction, its default
+            conclusion is used to estimate censoring distribution.
+        times (Optional[np.ndarray], optional): time grid on which Brier score
+            is evaluated. If not provided, all distinct survival times from
+            the training dataset are used. Defaults to None.
+        calculate_only_for_covered_examples (bool, optional): If true, it will
+            calculate indicators only for the examples where prediction was not
+            empty. Otherwise, it will calculate indicators for all the examples.
+            Defaults to False.
+
+    Raises:
+        InvalidStateError: If ruleset was not updated
+    """
+
+    def __init__(
+        self,
+        ruleset: SurvivalRuleSet,
+        times: Optional[np.ndarray] = None,
+        calculate_only_for_covered_examples: bool = False
+    ) -> None:
+        super().__init__(calculate_only_for_covered_examples)
+        if ruleset._stored_default_conclusion is None:  # pylint: disable=protected-access
+            raise InvalidStateError(
+                "Cannot calculate IBS without default conclusion. "
+                + "Maybe you forgot to call update(...) method?"
+            )
+        censoring_KM: KaplanMeierEstimator = (
+            # pylint: disable=protected-access
+            ruleset._stored_default_conclusion.estimator.reverse()
+        )
+        self.survival_time_attr_name: str = ruleset.survival_time_attr_name
+        self.times: np.ndarray = ruleset._prepare_prediction_time_grid(  # pylint: disable=protected-access
+            times)
+        self.censoring_KM: KaplanMeierEstimator = censoring_KM
+        self.brier_scores_sum: np.ndarray = np.zeros(len(self.times))
+        self.evaluated_examples_count: int = 0
+
+    def update(
+        self,
+        X: pd.DataFrame,
+        y_true: np.ndarray,
+        y_pred: Union[np.ndarray, SurvivalMatrixPrediction]
+    ) -> SurvivalPredictionIndicatorsAccumulator:
+        """Ingests chunk of predictions.
+
+        Args:
+            X (pd.DataFrame): Dataset chunk
+            y_true (np.ndarray): Survival status column
+            y_pred (Union[np.ndarray, SurvivalMatrixPrediction]): Either array
+                of predictions returned by `SurvivalRuleSet.predict` method or
+                prediction returned by `SurvivalRuleSet.predict_survival_matrix`
+                method.
+
+        Returns:
+            SurvivalPredictionIndicatorsAccumulator: self
+        """
+        survival_times: np.ndarray = np.asarray(
+            X[self.survival_time_attr_name], dtype=float)
+        events_mask: np.ndarray = encode_survival_status(np.asarray(y_true))
+        covered_mask, probabilities = self._get_survival_probabilities(y_pred)
+        self.all_examples_count += len(survival_times)
+        if self.calculate_only_for_covered_examples:
+            self.covered_by_prediction += int(np.count_nonzero(covered_mask))
+        else:
+            self.covered_by_prediction += len(survival_times)
+        self.evaluated_examples_count += len(probabilities)
+        self.brier_scores_sum += self._calculate_brier_scores_sum(
+            survival_times[covered_mask],
+            events_mask[covered_mask],
+            probabilities
+        )
+        return self
+
+    def _get_survival_probabilities(
+        self,
+        y_pred: Union[np.ndarray, SurvivalMatrixPrediction]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns:
+            tuple[np.ndarray, np.ndarray]: mask of covered examples and matrix of
+                their survival probabilities evaluated on the accumulator time grid
+        """
+        if isinstance(y_pred, dict):
+            probabilities: np.ndarray = y_pred['probabilities']
+            covered_mask: np.ndarray = ~np.any(np.isnan(probabilities), axis=1)
+            prediction_times: np.ndarray = y_pred['times']
+            if not np.array_equal(prediction_times, self.times):
+                indices: np.ndarray = np.searchsorted(
+                    prediction_times, self.times, side='right') - 1
+                probabilities = np.where(
+                    indices >= 0,
+                    probabilities[:, np.maximum(indices, 0)],
+                    1.0
+                )
+            return covered_mask, np.asarray(probabilities[covered_mask], dtype=float)
+
+        y_pred = np.asarray(y_pred, dtype=object)
+        covered_mask = np.array(
+            [prediction is not None for prediction in y_pred], dtype=bool)
+        probabilities = np.empty(
+            shape=(np.count_nonzero(covered_mask), len(self.times)))
+        # the same prediction objects are often shared by many examples
+        cache: dict[int, np.ndarray] = {}
+        for i, prediction in enumerate(y_pred[covered_mask]):
+            key: int = id(prediction)
+            if key not in cache:
+                cache[key] = SurvivalPrediction.to_kaplan_meier(
+                    prediction
+                ).get_probabilities_at(self.times)
+            probabilities[i] = cache[key]
+        return covered_mask, probabilities
+
+    def _calculate_brier_scores_sum(
+        self,
+        survival_times: np.ndarray,
+        events_mask: np.ndarray,
+        probabilities: np.ndarray
+    ) -> np.ndarray:
+        examples_censoring_probabilities: np.ndarray = (
+            self.censoring_KM.get_probabilities_at(survival_times)
+        )
+        times_censoring_probabilities: np.ndarray = (
+            self.censoring_KM.get_probabilities_at(self.times)
+        )
+        event_occurred_mask: np.ndarray = (
+            survival_times[:, np.newaxis] <= self.times[np.newaxis, :]
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            event_components: np.ndarray = np.where(
+                event_occurred_mask & (
+                    events_mask & (examples_censoring_probabilities > 0)
+                )[:, np.newaxis],
+                (probabilities * probabilities) /
+                examples_censoring_probabilities[:, np.newaxis],
+                0.0
+            )
+            at_risk_components: np.ndarray = np.where(
+                ~event_occurred_mask & (times_censoring_probabilities > 0),
+                ((1 - probabilities) * (1 - probabilities)) /
+                times_censoring_probabilities,
+                0.0
+            )
+        return np.sum(event_components + at_risk_components, axis=0)
+
+    def _merge(self, other: SurvivalPredictionIndicatorsAccumulator):
+        if not np.array_equal(self.times, other.times) or not np.array_equal(
+            self.censoring_KM.probabilities, other.censoring_KM.probabilities
+        ):
+            raise ValueError(
+                'Cannot merge accumulators with different time grids '
+                'or censoring distributions'
+            )
+        self.brier_scores_sum += other.brier_scores_sum
+        self.evaluated_examples_count += other.evaluated_examples_count
+
+    def finalize(self) -> SurvivalPredictionIndicators:
+        """Calculates prediction indicators from accumulated Brier score components.
+
+        Raises:
+            ValueError: If no covered examples were ingested
+
+        Returns:
+            SurvivalPredictionIndicators:  A dictionary containing
+            prediction indicators
+        """
+        if self.evaluated_examples_count == 0 or len(self.times) == 0:
+            raise ValueError(
+                'Cannot calculate prediction indicators without any covered examples')
+        brier_scores: np.ndarray = self.brier_scores_sum / self.evaluated_examples_count
+        diffs: np.ndarray = np.diff(self.times, prepend=0.0)
+        return SurvivalPredictionIndicators(
+            type_of_problem=ProblemTypes.SURVIVAL.value,
+            general=SurvivalGeneralPredictionIndicators(
+                ibs=float(np.sum(diffs * brier_scores) / self.times[-1]),
+                Covered_by_prediction=self.covered_by_prediction,
+                Not_covered_by_prediction=self.not_covered_by_prediction,
+            )
+        )
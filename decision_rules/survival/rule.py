@@ -3,6 +3,8 @@ Contains survival rule and conclusion classes.
 """
 from __future__ import annotations
 
+import copy
+
 import numpy as np
 from decision_rules import settings
 from decision_rules.core.condition import AbstractCondition
@@ -122,10 +124,13 @@ class SurvivalRule(AbstractRule):
             uncovered_mask = self.premise.uncovered_mask(X)
 
         if not self.conclusion.fixed:
-            self.conclusion.estimator.fit(
+            # estimator may be shared with clones of this rule, so it is never
+            # fitted in place
+            self.conclusion.estimator = copy.copy(self.conclusion.estimator).fit(
                 X[covered_mask, self.survival_time_attr_idx],
                 y[covered_mask],
-                skip_sorting=kwargs.get('skip_sorting', False)
+                skip_sorting=kwargs.get('skip_sorting', False),
+                time_grid=kwargs.get('time_grid'),
             )
         covered_examples_indexes = np.where(covered_mask)[0]
         uncovered_examples_indexes = np.where(uncovered_mask)[0]
@@ -138,10 +143,8 @@ class SurvivalRule(AbstractRule):
             return_stats=True,
         )
         self.conclusion.value = self.conclusion.estimator.median_survival_time
-        self.conclusion.median_survival_time_ci_lower = self.conclusion.estimator.median_survival_time_cli.iloc[
-            0]["prob_lower_0.95"]
-        self.conclusion.median_survival_time_ci_upper = self.conclusion.estimator.median_survival_time_cli.iloc[
-            0]["prob_upper_0.95"]
+        self.conclusion.median_survival_time_ci_lower = self.conclusion.estimator.median_survival_time_ci_lower
+        self.conclusion.median_survival_time_ci_upper = self.conclusion.estimator.median_survival_time_ci_upper
         return super().calculate_coverage(X, y, P, N)
 
     def get_coverage_dict(self) -> dict:
@@ -3,6 +3,7 @@ Contains survival ruleset class.
 """
 from __future__ import annotations
 
+import copy
 from typing import Optional
 from typing import Type
 from typing import Union
@@ -10,6 +11,7 @@ from typing import Union
 import numpy as np
 import pandas as pd
 
+from decision_rules.core.coverage import CoverageTable
 from decision_rules.core.coverage import SurvivalCoverageInfodict
 from decision_rules.core.exceptions import InvalidStateError
 from decision_rules.core.metrics import AbstractRulesMetrics
@@ -21,9 +23,11 @@ from decision_rules.importances._survival.attributes import (
 from decision_rules.importances._survival.conditions import (
     SurvivalRuleSetConditionImportances,
 )
+from decision_rules.survival.kaplan_meier import encode_survival_status
 from decision_rules.survival.kaplan_meier import KaplanMeierEstimator
 from decision_rules.survival.metrics import SurvivalRulesMetrics
 from decision_rules.survival.prediction import BestRulePredictionStrategy
+from decision_rules.survival.prediction import SurvivalMatrixPrediction
 from decision_rules.survival.prediction import SurvivalPrediction
 from decision_rules.survival.prediction import VotingPredictionStrategy
 from decision_rules.survival.rule import SurvivalConclusion
@@ -45,6 +49,7 @@ class SurvivalRuleSet(AbstractRuleSet):
         self.rules: list[SurvivalRule]
         super().__init__(rules)
         self.survival_time_attr_name: str = survival_time_attr
+        self.time_grid: Optional[np.ndarray] = None
         self.decision_attribute: str = (
             self.rules[0].conclusion.column_name if len(rules) > 0 else None
         )
@@ -61,6 +66,25 @@ class SurvivalRuleSet(AbstractRuleSet):
     def get_metrics_object_instance(self) -> AbstractRulesMetrics:
         return SurvivalRulesMetrics(self.rules)
 
+    def _get_coverage_table_extras(self) -> dict[str, np.ndarray]:
+        return {
+            'median_survival_time': np.array(
+                [rule.conclusion.value for rule in self.rules], dtype=float
+            ),
+            'events_count': np.array(
+                [rule.conclusion.estimator.events_count_sum for rule in self.rules],
+                dtype=float
+            ),
+            'censored_count': np.array(
+                [rule.conclusion.estimator.censored_count_sum for rule in self.rules],
+                dtype=float
+            ),
+            'log_rank': np.array(
+                [getattr(rule, 'log_rank', np.nan) for rule in self.rules],
+                dtype=float
+            ),
+        }
+
     def update_using_coverages(
         self,
         coverages_info: dict[str, SurvivalCoverageInfodict],
@@ -70,7 +94,9 @@ class SurvivalRuleSet(AbstractRuleSet):
     ):
         for rule in self.rules:
             coverage_info: SurvivalCoverageInfodict = coverages_info[rule.uuid]
-            rule.conclusion.estimator.update(
+            # estimator may be shared with clones of the rule, so it is replaced
+            # with an updated copy instead of being modified in place
+            rule.conclusion.estimator = copy.copy(rule.conclusion.estimator).update(
                 coverage_info["kaplan_meier_estimator"],
                 update_additional_indicators=True,
             )
@@ -81,8 +107,6 @@ class SurvivalRuleSet(AbstractRuleSet):
             rule.conclusion.median_survival_time_ci_upper = coverage_info[
                 "median_survival_time_ci_upper"
             ]
-            rule.conclusion.estimator.events_count = coverage_info["events_count"]
-            rule.conclusion.estimator.censored_count = coverage_info["censored_count"]
             rule.log_rank = coverage_info["log_rank"]
 
         super().update_using_coverages(
@@ -90,8 +114,47 @@ class SurvivalRuleSet(AbstractRuleSet):
         )
 
     def update(
-        self, X_train: pd.DataFrame, y_train: pd.Series, _measure=None
+        self,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        _measure=None,
+        time_grid: Optional[Union[int, np.ndarray]] = None,
     ) -> np.ndarray:
+        """Updates ruleset using training dataset. This method should be called
+        both after creation of new ruleset or after manipulating any of its rules
+        or internal conditions. This method recalculates rules coverages, Kaplan-Meier
+        estimators and voting weights making it ready for prediction
+
+        Args:
+            X_train (pd.DataFrame):
+            y_train (pd.Series): survival status column
+            _measure: not used, `log_rank` is always used as a voting measure
+            time_grid (Optional[Union[int, np.ndarray]], optional): Optional fixed time
+                grid on which all Kaplan-Meier estimators (rules' and the default one)
+                are fitted. It is either the number K of points of a grid built from
+                quantiles of training survival times or an array of time points. Every
+                survival time is rounded up to the nearest grid point (the grid is
+                extended with the maximum training survival time if needed), so each
+                estimator stores at most K entries regardless of the dataset size.
+
+                This is an approximation of the exact estimator. At grid points the
+                survival function is exact unless some examples are censored inside a
+                grid interval before an event in the same interval, in which case it is
+                slightly overestimated (examples censored inside the interval are still
+                counted as at risk at its end). Between grid points the curve keeps the
+                value of the previous grid point, so the error there is bounded by the
+                drop of the exact curve within the interval. Log-rank statistics
+                (and so voting weights) are always calculated on exact times.
+
+                The grid is stored in the `time_grid` attribute and reused by later
+                updates called without this parameter (e.g. during filtering or
+                metrics calculation). To fit exact estimators again, set the
+                `time_grid` attribute to None before calling this method.
+                Defaults to None (the stored grid, exact estimators if there is none).
+
+        Returns:
+            np.ndarray: coverage matrix
+        """
         # the `measure` is always `log_rank` for survival rulesets,
         # but the parameter is kept for compatibility with other types
         if _measure is not None:
@@ -115,6 +178,10 @@ class SurvivalRuleSet(AbstractRuleSet):
         survival_time_sorted = survival_time[sorted_indices]
         y_train_sorted = y_train[sorted_indices]
         X_train_sorted = X_train[sorted_indices, :]
+        if time_grid is None:
+            time_grid = self.time_grid
+        self.time_grid = self._prepare_time_grid(
+            time_grid, survival_time_sorted)
 
         # fit Kaplan Meier estimator on whole dataset as default conclusion
         self.default_conclusion = SurvivalConclusion(
@@ -125,6 +192,7 @@ class SurvivalRuleSet(AbstractRuleSet):
             survival_time_sorted,
             y_train_sorted,
             skip_sorting=True,  # skip sorting (dataset is already sorted)
+            time_grid=self.time_grid,
         )
         self.default_conclusion.value = (
             self.default_conclusion.estimator.median_survival_time
@@ -139,12 +207,42 @@ class SurvivalRuleSet(AbstractRuleSet):
             X_train_sorted,
             y_train_sorted,
             skip_sorting=True,  # skip sorting (dataset is already sorted)
+            time_grid=self.time_grid,
         )
         self.calculate_rules_weights(KaplanMeierEstimator.log_rank)
 
         reverted_sorted_indices = np.argsort(sorted_indices)
         return coverage_matrix[reverted_sorted_indices]
 
+    def _prepare_time_grid(
+        self,
+        time_grid: Optional[Union[int, np.ndarray]],
+        survival_time_sorted: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        if time_grid is None:
+            return None
+        survival_time_sorted = survival_time_sorted.astype(float)
+        if isinstance(time_grid, (int, np.integer)):
+            if time_grid < 1:
+                raise ValueError(
+                    '"time_grid" should be a positive number of grid points, '
+                    + f"is: {time_grid}."
+                )
+            time_grid = np.quantile(
+                survival_time_sorted, np.linspace(0.0, 1.0, time_grid)
+            )
+        time_grid = np.asarray(time_grid, dtype=float)
+        if time_grid.ndim != 1 or time_grid.shape[0] == 0:
+            raise ValueError(
+                '"time_grid" should be either a number of grid points or a non-empty '
+                + "1D array of time points."
+            )
+        time_grid = np.unique(time_grid)
+        max_survival_time: float = survival_time_sorted[-1]
+        if time_grid[-1] < max_survival_time:
+            time_grid = np.append(time_grid, max_survival_time)
+        return time_grid
+
     def calculate_rules_metrics(
         self,
         X: pd.DataFrame,  # pylint: disable=invalid-name
@@ -154,10 +252,10 @@ class SurvivalRuleSet(AbstractRuleSet):
         for rule in self.rules:
             rule.premise.cached = True
         try:
-            self.update(X, y)
+            coverage_matrix: np.ndarray = self.update(X, y)
             metrics: SurvivalRulesMetrics = self.get_metrics_object_instance()
             metrics_values: dict = metrics.calculate(
-                X, y, metrics_to_calculate)
+                X, y, metrics_to_calculate, coverage_matrix=coverage_matrix)
             return metrics_values
         except Exception as e:
             raise e
@@ -189,11 +287,11 @@ class SurvivalRuleSet(AbstractRuleSet):
         self._voting_weights_calculated = True
 
     def calculate_condition_importances(
-        self, X: pd.DataFrame, y: pd.Series, *args
+        self, X: pd.DataFrame, y: pd.Series, *args, n_jobs: Optional[int] = 1
     ) -> dict[str, float]:
         X, y = self._sanitize_dataset(X, y)
         condtion_importances_generator = SurvivalRuleSetConditionImportances(
-            self)
+            self, n_jobs)
         self.condition_importances = (
             condtion_importances_generator.calculate_importances(X, y)
         )
@@ -233,6 +331,309 @@ class SurvivalRuleSet(AbstractRuleSet):
         ]
         return rules_covering_instance, prediction
 
+    def predict_survival_matrix(
+        self,
+        X: pd.DataFrame,
+        times: Optional[np.ndarray] = None,
+        dtype: np.dtype = np.float64,
+    ) -> SurvivalMatrixPrediction:
+        """Predicts survival functions of all examples on a shared time grid.
+        Unlike `predict` it returns a single dense (n_examples x n_times) matrix
+        instead of an object array of separate Kaplan-Meier curves. Survival
+        function of each example is determined by the current prediction strategy:
+        an average of the curves of all rules covering it for the "vote" strategy
+        or the curve of the best rule covering it for the "best_rule" strategy.
+
+        Args:
+            X (pd.DataFrame): dataset
+            times (Optional[np.ndarray], optional): time grid on which survival
+                functions are evaluated. If not provided, all distinct survival times
+                from the training dataset are used. Defaults to None.
+            dtype (np.dtype, optional): dtype of the probabilities matrix.
+                Defaults to np.float64.
+
+        Raises:
+            ValueError: if the current prediction strategy is neither voting nor
+                best rule strategy
+
+        Returns:
+            SurvivalMatrixPrediction: prediction
+        """
+        X: np.ndarray = self._sanitize_dataset(X)
+        coverage_matrix: np.ndarray = self.calculate_coverage_matrix(X)
+        return self.predict_survival_matrix_using_coverage_matrix(
+            coverage_matrix, times=times, dtype=dtype
+        )
+
+    def predict_survival_matrix_using_coverage_matrix(
+        self,
+        coverage_matrix: np.ndarray,
+        times: Optional[np.ndarray] = None,
+        dtype: np.dtype = np.float64,
+    ) -> SurvivalMatrixPrediction:
+        """Same as `predict_survival_matrix` but uses precalculated coverage matrix
+        instead of the original dataset.
+
+        Args:
+            coverage_matrix (np.ndarray): coverage matrix
+            times (Optional[np.ndarray], optional): time grid on which survival
+                functions are evaluated. If not provided, all distinct survival times
+                from the training dataset are used. Defaults to None.
+            dtype (np.dtype, optional): dtype of the probabilities matrix.
+                Defaults to np.float64.
+
+        Returns:
+            SurvivalMatrixPrediction: prediction
+        """
+        self._validate_object_state_before_prediction()
+        self._validate_coverage_matrix_param(coverage_matrix)
+        times = self._prepare_prediction_time_grid(times)
+        probabilities: np.ndarray = self._calculate_survival_probabilities(
+            coverage_matrix, times, dtype
+        )
+        return SurvivalMatrixPrediction(
+            times=times,
+            probabilities=probabilities,
+            median_survival_times=self._calculate_median_survival_times(
+                times, probabilities
+            ),
+        )
+
+    def predict_survival_at(
+        self,
+        X: pd.DataFrame,
+        times: np.ndarray,
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
+        """Predicts survival probabilities of all examples only at the requested
+        time points. Probabilities are evaluated directly from the rules' survival
+        curves so the cost does not depend on the number of distinct training times.
+
+        Args:
+            X (pd.DataFrame): dataset
+            times (np.ndarray): time points at which survival probabilities
+                should be evaluated (e.g. 1, 3 and 5 years).
+            dtype (np.dtype, optional): dtype of the returned matrix.
+                Defaults to np.float64.
+
+        Raises:
+            ValueError: if the current prediction strategy is neither voting nor
+                best rule strategy
+
+        Returns:
+            np.ndarray: (n_examples x n_times) matrix of survival probabilities
+                with columns in the same order as the passed `times`. Rows of
+                examples for which no prediction could be made are filled with NaN.
+        """
+        X: np.ndarray = self._sanitize_dataset(X)
+        coverage_matrix: np.ndarray = self.calculate_coverage_matrix(X)
+        self._validate_object_state_before_prediction()
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        return self._calculate_survival_probabilities(coverage_matrix, times, dtype)
+
+    def predict_median(self, X: pd.DataFrame) -> np.ndarray:
+        """Predicts only median survival times of all examples. The median is found
+        by a simultaneous binary search over the rules' event times for all examples,
+        without building the predicted survival curves.
+
+        Args:
+            X (pd.DataFrame): dataset
+
+        Raises:
+            ValueError: if the current prediction strategy is neither voting nor
+                best rule strategy
+
+        Returns:
+            np.ndarray: median survival times. They are infinite if survival function
+                never drops to 0.5 and NaN for examples for which no prediction
+                could be made.
+        """
+        X: np.ndarray = self._sanitize_dataset(X)
+        coverage_matrix: np.ndarray = self.calculate_coverage_matrix(X)
+        self._validate_object_state_before_prediction()
+
+        estimators: list[KaplanMeierEstimator] = [
+            rule.conclusion.estimator for rule in self.rules
+        ]
+        default_estimator: Optional[KaplanMeierEstimator] = (
+            self.default_conclusion.estimator
+        )
+        candidate_times: np.ndarray = np.unique(np.concatenate(
+            [np.asarray(estimator.times, dtype=float)
+             for estimator in estimators]
+            + ([] if default_estimator is None else [
+                np.asarray(default_estimator.times, dtype=float)
+            ])
+            + [np.empty(shape=(0,))]
+        ))
+        rules_weights: np.ndarray = self._get_prediction_rules_weights(
+            coverage_matrix)
+        rules_weights_sums: np.ndarray = rules_weights.sum(axis=1)
+        covered_mask: np.ndarray = rules_weights_sums > 0
+
+        # survival function is non-increasing, so we can binary search for the first
+        # candidate time at which it drops to 0.5 or below
+        lower: np.ndarray = np.zeros(
+            shape=(coverage_matrix.shape[0],), dtype=int)
+        upper: np.ndarray = np.full(
+            shape=(coverage_matrix.shape[0],), fill_value=len(candidate_times)
+        )
+        active_mask: np.ndarray = lower < upper
+        while active_mask.any():
+            middle: np.ndarray = (lower + upper) // 2
+            middle_times: np.ndarray = candidate_times[
+                np.minimum(middle, len(candidate_times) - 1)
+            ]
+            probabilities_sums: np.ndarray = np.zeros(
+                shape=(coverage_matrix.shape[0],))
+            for i, estimator in enumerate(estimators):
+                rule_covered_mask: np.ndarray = (
+                    (rules_weights[:, i] > 0) & active_mask)
+                probabilities_sums[rule_covered_mask] += (
+                    rules_weights[rule_covered_mask, i] *
+                    estimator.get_probabilities_at(
+                        middle_times[rule_covered_mask])
+                )
+            probabilities: np.ndarray = np.ones(
+                shape=(coverage_matrix.shape[0],))
+            probabilities[covered_mask] = (
+                probabilities_sums[covered_mask] /
+                rules_weights_sums[covered_mask]
+            )
+            if default_estimator is not None:
+                uncovered_active_mask: np.ndarray = ~covered_mask & active_mask
+                probabilities[uncovered_active_mask] = (
+                    default_estimator.get_probabilities_at(
+                        middle_times[uncovered_active_mask]
+                    )
+                )
+            below_median_mask: np.ndarray = probabilities <= 0.5
+            upper = np.where(active_mask & below_median_mask, middle, upper)
+            lower = np.where(active_mask & ~below_median_mask,
+                             middle + 1, lower)
+            active_mask = lower < upper
+
+        median_survival_times: np.ndarray = np.full(
+            shape=(coverage_matrix.shape[0],), fill_value=np.inf
+        )
+        reached_median_mask: np.ndarray = lower < len(candidate_times)
+        median_survival_times[reached_median_mask] = candidate_times[
+            lower[reached_median_mask]
+        ]
+        if default_estimator is None:
+            median_survival_times[~covered_mask] = np.nan
+        return median_survival_times
+
+    def _prepare_prediction_time_grid(
+        self, times: Optional[np.ndarray]
+    ) -> np.ndarray:
+        if times is not None:
+            return np.unique(np.asarray(times, dtype=float))
+        if (
+            self._stored_default_conclusion is None
+            or self._stored_default_conclusion.estimator is None
+        ):
+            raise InvalidStateError(
+                "Cannot determine training survival times to use as a time grid. "
+                + "Maybe you forgot to call update(...) method? "
+                + 'Alternatively pass the "times" parameter explicitly.'
+            )
+        return np.asarray(
+            self._stored_default_conclusion.estimator.times, dtype=float
+        )
+
+    def _get_prediction_rules_weights(self, coverage_matrix: np.ndarray) -> np.ndarray:
+        """Returns weights of rules' survival curves in the survival functions
+        predicted by the current prediction strategy. Survival function of
+        an example is a weighted average of the curves of rules with positive
+        weights or the default curve if all weights are zero.
+
+        Raises:
+            ValueError: if the current prediction strategy is neither voting nor
+                best rule strategy
+
+        Returns:
+            np.ndarray: (n_examples x n_rules) matrix of weights
+        """
+        strategy: PredictionStrategy = self._get_prediction_strategy()
+        if isinstance(strategy, VotingPredictionStrategy):
+            return coverage_matrix.astype(float)
+        if isinstance(strategy, BestRulePredictionStrategy):
+            best_rules_indices: np.ndarray = strategy.find_best_rules(
+                coverage_matrix)
+            covered_mask: np.ndarray = best_rules_indices != -1
+            rules_weights: np.ndarray = np.zeros(
+                shape=coverage_matrix.shape, dtype=float)
+            rules_weights[covered_mask, best_rules_indices[covered_mask]] = 1.0
+            return rules_weights
+        raise ValueError(
+            "Predicting survival functions on a time grid is supported only for "
+            + '"vote" and "best_rule" prediction strategies, current strategy is: '
+            + f'"{type(strategy).__name__}".'
+        )
+
+    def _get_rules_probabilities(
+        self, times: np.ndarray, dtype: np.dtype = np.float64
+    ) -> np.ndarray:
+        """Evaluates survival functions of all rules on a given time grid.
+
+        Returns:
+            np.ndarray: (n_rules x n_times) matrix of survival probabilities
+        """
+        rules_probabilities: np.ndarray = np.empty(
+            shape=(len(self.rules), len(times)), dtype=dtype
+        )
+        for i, rule in enumerate(self.rules):
+            rules_probabilities[i] = rule.conclusion.estimator.get_probabilities_at(
+                times
+            )
+        return rules_probabilities
+
+    def _calculate_survival_probabilities(
+        self,
+        coverage_matrix: np.ndarray,
+        times: np.ndarray,
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
+        rules_probabilities: np.ndarray = self._get_rules_probabilities(
+            times, dtype
+        )
+        rules_weights: np.ndarray = self._get_prediction_rules_weights(
+            coverage_matrix).astype(dtype)
+        probabilities: np.ndarray = rules_weights @ rules_probabilities
+        rules_weights_sums: np.ndarray = rules_weights.sum(axis=1)
+        covered_mask: np.ndarray = rules_weights_sums > 0
+        probabilities[covered_mask] /= rules_weights_sums[covered_mask, None]
+
+        default_estimator: Optional[KaplanMeierEstimator] = (
+            self.default_conclusion.estimator
+        )
+        if default_estimator is None:
+            probabilities[~covered_mask] = np.nan
+        else:
+            probabilities[~covered_mask] = default_estimator.get_probabilities_at(
+                times
+            )
+        return probabilities
+
+    @staticmethod
+    def _calculate_median_survival_times(
+        times: np.ndarray, probabilities: np.ndarray
+    ) -> np.ndarray:
+        # median is the first time at which survival function drops to 0.5 or below,
+        # it is infinite if survival function never reaches 0.5 (same as in
+        # `KaplanMeierEstimator.median_survival_time`)
+        below_median_mask: np.ndarray = probabilities <= 0.5
+        reached_median_mask: np.ndarray = below_median_mask.any(axis=1)
+        median_survival_times: np.ndarray = np.full(
+            shape=(probabilities.shape[0],), fill_value=np.inf
+        )
+        median_survival_times[reached_median_mask] = times[
+            below_median_mask[reached_median_mask].argmax(axis=1)
+        ]
+        median_survival_times[np.isnan(probabilities).any(axis=1)] = np.nan
+        return median_survival_times
+
     def integrated_bier_score(
         self, X: pd.DataFrame, y: pd.Series, y_pred: Optional[np.ndarray] = None
     ) -> float:
@@ -249,8 +650,7 @@ class SurvivalRuleSet(AbstractRuleSet):
             float: Integrated Brier Score value
         """
         survival_times = X[self.survival_time_attr_name].to_numpy()
-        survival_status = y.to_numpy()
-        X, y = self._sanitize_dataset(X, y)
+        X, survival_status = self._sanitize_dataset(X, y)
 
         if self._stored_default_conclusion is None:
             raise InvalidStateError(
@@ -262,7 +662,7 @@ class SurvivalRuleSet(AbstractRuleSet):
             self._stored_default_conclusion.estimator.reverse()
         )
 
-        censored_events_mask = survival_status == "0"
+        censored_events_mask = ~survival_status
         info_list: list[_IBSInfo] = []
         prediction: np.ndarray = self.predict(X) if y_pred is None else y_pred
         zipped_data = zip(survival_times, censored_events_mask, prediction)
@@ -312,16 +712,19 @@ class SurvivalRuleSet(AbstractRuleSet):
 
     def calculate_p_values(self) -> list[float]:
         """
-        Calculates the p-value for each survival rule using the metrics instance.
+        Calculates the p-value for each survival rule based on its log-rank value.
 
         Returns:
             list[float]: A list of p-values for each rule.
         """
-        metrics: AbstractRulesMetrics = self.get_metrics_object_instance()
-        p_values = []
-        for rule in self.rules:
-            p_values.append(metrics.calculate_p_value(rule=rule))
-        return p_values
+        table: CoverageTable = self._get_calculated_coverage_table()
+        log_ranks: np.ndarray = table.extras['log_rank']
+        if np.any(np.isnan(log_ranks)):
+            rule: SurvivalRule = self.rules[int(
+                np.argmax(np.isnan(log_ranks)))]
+            raise ValueError(
+                f"log_rank has not been computed for the rule with uuid: {rule.uuid}")
+        return (1 - log_ranks).tolist()
 
     def _sanitize_dataset(
         self,
@@ -329,17 +732,30 @@ class SurvivalRuleSet(AbstractRuleSet):
         y: Optional[Union[np.ndarray, pd.Series]] = None,
         to_numpy: bool = True,
     ) -> Union[tuple[np.ndarray, np.ndarray], np.ndarray]:
+        """Sanitize and prepare dataset for other operations. Apart from the base class
+        behavior, it validates the survival status column and encodes it into a boolean
+        array of events occurrence which is then used internally instead of strings.
+        """
         res = super()._sanitize_dataset(X, y, to_numpy)
         if y is not None:
-            y_sanitized: np.ndarray = res[1]
-            self._validate_survival_status_column(y_sanitized)
+            X_sanitized, y_sanitized = res
+            return X_sanitized, self._encode_survival_status_column(
+                np.asarray(y_sanitized)
+            )
         return res
 
-    def _validate_survival_status_column(self, survival_status: np.ndarray):
-        if set(np.unique(survival_status)) - {"0", "1"}:
+    def _encode_survival_status_column(self, survival_status: np.ndarray) -> np.ndarray:
+        if survival_status.dtype == bool:
+            # already encoded
+            return survival_status
+        events_mask: np.ndarray = encode_survival_status(survival_status)
+        if survival_status.dtype.kind not in ("U", "S", "O") or not np.all(
+            events_mask | (survival_status == "0")
+        ):
             raise ValueError(
                 'y (survival status) must be of string type and contain only "0" and "1" values.'
             )
+        return events_mask
 
     def _map_prediction_values(self, predictions: np.ndarray) -> np.ndarray:
         return np.array(
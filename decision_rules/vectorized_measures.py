@@ -0,0 +1,436 @@
+"""
+Contains vectorized versions of the quality measures from `decision_rules.measures`.
+Each function takes arrays (or scalars) of p, n, P and N values describing many
+coverages at once and returns an array of measure values. Special cases handled
+explicitly by the scalar measures (e.g. returning 0 for rules covering no examples)
+give exactly the same values. Cases in which scalar measures would raise an error
+(e.g. division by zero) result in `inf` or `nan` values instead.
+
+Example
+-------
+.. code-block:: python
+    >>> from decision_rules import vectorized_measures
+    >>> vectorized_measures.precision(p=[10, 0], n=[5, 0], P=20, N=30)
+    array([0.66666667, 0.        ])
+"""
+import sys
+from typing import Union
+
+import numpy as np
+
+ArrayLike = Union[np.ndarray, list, int, float]
+
+
+def _as_arrays(*values: ArrayLike) -> tuple[np.ndarray, ...]:
+    return tuple(np.broadcast_arrays(*[
+        np.asarray(value, dtype=np.float64) for value in values
+    ]))
+
+
+def _where(condition: np.ndarray, value: ArrayLike, otherwise: np.ndarray) -> np.ndarray:
+    return np.where(condition, value, otherwise).astype(np.float64)
+
+
+# Measures are computed in the same operations order as their scalar versions
+# so that the results are identical. Numpy warnings about division by zero are
+# suppressed as the corresponding values are either replaced by explicit special
+# cases or are expected to be inf or nan.
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def accuracy(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return p - n
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def kappa(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        ((P + N) * (p / (p + n)) - P) /
+        ((P + N) / 2 * ((p + n + P) / (p + n)) - P)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def c1(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    cohen: np.ndarray = kappa(p, n, P, N)
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        ((N * p - P * n) / (N * (p + n))) * ((2.0 + cohen) / 3.0)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def c2(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) | (p + n == 0) | (N == 0), 0.0,
+        (((P + N) * p / (p + n) - P) / N) *
+        ((1 + p / P) / 2)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def c_foil(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        p == 0, 0.0,
+        p * (np.log2(p / (p + n)) - np.log2(P / (P + N)))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def coverage(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return p / P
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def cn2_significnce(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) | (n == 0), 0.0,
+        2 * (
+            p * np.log(p / ((p + n) * P / (P + N))) +
+            n * np.log(n / ((p + n) * N / (P + N)))
+        )
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def full_coverage(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (p + n) / (P + N)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def laplace(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (p + 1) / (p + n + 2)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def weighted_laplace(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (p + 1) * (P + N) / ((p + n + 2) * P)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def specificity(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (N - n) / N
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def sensitivity(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return p / P
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def lift(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p + n) == 0, 0.0,
+        p * (P + N) / ((p + n) * P)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def precision(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p + n) == 0, 0.0,
+        p / (p + n)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def correlation(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    denominator: np.ndarray = np.sqrt(
+        P * N * (p + n) * (P - p + N - n)
+    )
+    return _where(
+        denominator == 0.0, 0.0,
+        (p * N - P * n) / denominator
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def rss(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return p / P - n / N
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def odds_ratio(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (
+        (p * (N - n)) /
+        (n * (P - p) + 1)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def f_bayesian_confirmation(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        (p * N - n * P) / (p * N + n * P)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def f_measure(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    beta_2: float = 2 * 2
+    return _where(
+        p == 0, 0.0,
+        (beta_2 + 1) * (p / (p + n)) *
+        (p / P) / (beta_2 * (p / (p + n) + p / P))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def geo_rss(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return np.sqrt(p / P * (1 - n / N))
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def g_measure(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    g: float = 2
+    return p / (p + n + g)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def information_gain(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    # pylint: disable=invalid-name
+    p, n, P, N = _as_arrays(p, n, P, N)
+    consequent: np.ndarray = P
+    not_consequent: np.ndarray = N
+
+    antecedent: np.ndarray = p + n
+    not_antecedent: np.ndarray = P + N - p - n
+
+    antecedent_and_consequent: np.ndarray = p
+    antecedent_but_not_consequent = antecedent - antecedent_and_consequent
+
+    not_antecedent_and_not_consequent: np.ndarray = not_consequent - \
+        antecedent_but_not_consequent
+    not_antecedent_but_consequent: np.ndarray = not_antecedent - \
+        not_antecedent_and_not_consequent
+
+    v: np.ndarray = consequent + not_consequent
+
+    a: np.ndarray = consequent / v
+    b: np.ndarray = not_consequent / v
+
+    info_all_examples: np.ndarray = _where(
+        b > 0,
+        -(a * np.log2(a) + b * np.log2(b)),
+        -(a * np.log2(a))
+    )
+
+    # if rule is not accurate
+    a = antecedent_and_consequent / antecedent
+    b = antecedent_but_not_consequent / antecedent
+    info_matched_examples: np.ndarray = _where(
+        (antecedent_and_consequent != 0) & (
+            antecedent_but_not_consequent != 0),
+        -(a * np.log2(a) + b * np.log2(b)),
+        0.0
+    )
+
+    a = not_antecedent_but_consequent / not_antecedent
+    b = not_antecedent_and_not_consequent / not_antecedent
+    info_not_matched_examples: np.ndarray = _where(
+        (not_antecedent_but_consequent != 0) & (
+            not_antecedent_and_not_consequent != 0),
+        -(a * np.log2(a) + b * np.log2(b)),
+        0.0
+    )
+
+    c: np.ndarray = antecedent / v
+    info_rule: np.ndarray = c * info_matched_examples + \
+        (1 - c) * info_not_matched_examples
+
+    info: np.ndarray = info_all_examples - info_rule
+
+    # this makes measure monotone
+    return _where(
+        (antecedent_but_not_consequent > 0) &
+        (antecedent_and_consequent / antecedent_but_not_consequent <
+         consequent / not_consequent),
+        -info,
+        info
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def j_measure(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    a: np.ndarray = _where(
+        p == 0, 0.0,
+        p * np.log(p * (P + N) / ((p + n) * P))
+    )
+    b: np.ndarray = _where(
+        n == 0, 0.0,
+        n * np.log(n * (P + N) / ((p + n) * N))
+    )
+    return (1.0 / (P + N)) * (a + b)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def klosgen(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    omega: float = 1.0
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        np.power((p + n) / (P + N), omega) * (p / (p + n) - P / (P + N))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def logical_sufficiency(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (n == 0) | (P == 0), sys.float_info.max,
+        p + N / (n * P)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def m_estimate(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    m: float = 2.0
+    return (p + m * P / (P + N)) / (p + n + m)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def mutual_support(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return p / (n + P)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def novelty(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return p / (P + N) - (P * (p + n) / ((P + N) * (P + N)))
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def one_way_support(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        p == 0.0, 0.0,
+        p / (p + n) * np.log(p * (P + N) / ((p + n) * P))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def pawlak_dependency_factor(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        (p * (P + N) - P * (p + n)) / (p * (P + N) + P * (p + n))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def q2(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (p / P - n / N) * (1 - n / N)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def relative_risk(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        (p / (p + n)) * ((P + N - p - n) / (P - p + 1))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def ripper(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        (p - n) / (p + n)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def rule_interest(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (p * (P + N) - (p + n) * P) / (P + N)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def s_bayesian(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return np.select(
+        [
+            (p == P) & (n == N),
+            (p == 0) & (n == 0),
+        ],
+        [
+            0.0,
+            - (P - p) / (P - p + N - n),
+        ],
+        default=p / (p + n) - (P - p) / (P - p + N - n)
+    ).astype(np.float64)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def two_way_support(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        p == 0.0, 0.0,
+        (p / (P + N)) * np.log(p * (P + N) / ((p + n) * P))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def weighted_relative_accuracy(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        (p + n) / (P + N) * (p / (p + n) - P / (P + N))
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def yails(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    prec: np.ndarray = precision(p, n, P, N)
+    w1: np.ndarray = 0.5 + 0.25 * prec
+    w2: np.ndarray = 0.5 - 0.25 * prec
+    return _where(
+        (p == 0) & (n == 0), 0.0,
+        w1 * p / (p + n) + w2 * (p / P)
+    )
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def confidence(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike) -> np.ndarray:  # pylint: disable=invalid-name,missing-function-docstring
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return (P + N) / (P + N + n + p)
+
+
+@np.errstate(divide='ignore', invalid='ignore')
+def lord(p: ArrayLike, n: ArrayLike, P: ArrayLike, N: ArrayLike, m: float = 0.1) -> np.ndarray:  # pylint: disable=invalid-name
+    """Vectorized version of `decision_rules.measures.lord` (m-estimate heuristic
+    used in LORD algorithm).
+    """
+    p, n, P, N = _as_arrays(p, n, P, N)
+    return _where(
+        p + n + m == 0, 0.0,
+        (p + m * (P / (P + N))) / (p + n + m)
+    )
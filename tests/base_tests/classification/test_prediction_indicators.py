@@ -1,13 +1,21 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 import os
 import unittest
+import warnings
 
 import numpy as np
 import pandas as pd
+from imblearn.metrics import geometric_mean_score
+from sklearn.metrics import balanced_accuracy_score
+from sklearn.metrics import cohen_kappa_score
+from sklearn.metrics import f1_score
+from sklearn.metrics import recall_score
 from decision_rules import measures
 from decision_rules.classification.ruleset import ClassificationRuleSet
 from decision_rules.classification.prediction_indicators import \
     calculate_for_classification
+from decision_rules.classification.prediction_indicators import \
+    ClassificationPredictionIndicatorsAccumulator
 from tests.loaders import load_classification_dataset
 from tests.loaders import load_classification_ruleset
 from tests.loaders import load_resources_path
@@ -46,3 +54,60 @@ class TestClassificationPredictionIndicators(unittest.TestCase):
             indicators_on_full_dataset['general']['Balanced_accuracy'],
             'Balanced accuracy should be better when calculated only on covered examples'
         )
+
+    def test_prediction_indicators_match_sklearn_scorers(self):
+        self.ruleset.rules = self.ruleset.rules[int(
+            len(self.ruleset.rules) / 10 * 8):]
+        self.ruleset.set_default_conclusion_enabled(False)
+        y_pred: np.ndarray = self.ruleset.predict(self.X)
+        y_true: np.ndarray = self.y.to_numpy()
+        with self.assertWarns(UserWarning):
+            indicators: dict = calculate_for_classification(
+                y_true=y_true, y_pred=y_pred
+            )['general']
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertEqual(
+                indicators['Balanced_accuracy'],
+                balanced_accuracy_score(y_true, y_pred)
+            )
+        self.assertEqual(
+            indicators['Cohen_kappa'], cohen_kappa_score(y_true, y_pred)
+        )
+        for average in ['micro', 'macro', 'weighted']:
+            self.assertEqual(
+                indicators[f'F1_{average}'],
+                f1_score(y_true, y_pred, average=average)
+            )
+            self.assertEqual(
+                indicators[f'Recall_{average}'],
+                recall_score(y_true, y_pred, average=average,
+                             zero_division=0.0)
+            )
+            self.assertEqual(
+                indicators[f'G_mean_{average}'],
+                geometric_mean_score(y_true, y_pred, average=average)
+            )
+
+    def test_accumulator(self):
+        self.ruleset.rules = self.ruleset.rules[int(
+            len(self.ruleset.rules) / 10 * 8):]
+        self.ruleset.set_default_conclusion_enabled(False)
+        y_pred: np.ndarray = self.ruleset.predict(self.X)
+        y_true: np.ndarray = self.y.to_numpy()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for only_covered in [False, True]:
+                expected_indicators: dict = calculate_for_classification(
+                    y_true, y_pred, calculate_only_for_covered_examples=only_covered
+                )
+                accumulators: list[ClassificationPredictionIndicatorsAccumulator] = [
+                    ClassificationPredictionIndicatorsAccumulator(
+                        calculate_only_for_covered_examples=only_covered
+                    ).update(y_true[i:i + 10], y_pred[i:i + 10])
+                    for i in range(0, len(y_true), 10)
+                ]
+                accumulator = accumulators[0]
+                for other in accumulators[1:]:
+                    accumulator.merge(other)
+                self.assertEqual(accumulator.finalize(), expected_indicators)
@@ -1,6 +1,7 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,protected-access,invalid-name
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from decision_rules.classification.metrics import ClassificationRulesMetrics
@@ -264,6 +265,35 @@ class TestClassificationRulesMetrics(BaseRulesMetricsTestCase):
             'Uniquely covered negative examples for rule 3 do not match expected value'
         )
 
+    def test_uniqueness_metrics_match_masks_union(self):
+        X_np = self.X.values
+        y_np = self.y.values
+        metrics_values: dict = self.ruleset.calculate_rules_metrics(
+            self.X, self.y, metrics_to_calculate=[
+                'unique_in_pos', 'unique_in_neg', 'p_unique', 'n_unique', 'all_unique'
+            ]
+        )
+        for rule in self.ruleset.rules:
+            others = [r for r in self.ruleset.rules if r.uuid != rule.uuid]
+            others_covered = np.zeros(y_np.shape, dtype=bool)
+            others_pos = np.zeros(y_np.shape, dtype=bool)
+            others_neg = np.zeros(y_np.shape, dtype=bool)
+            for other in others:
+                others_covered |= other.premise.covered_mask(X_np)
+                others_pos |= other.positive_covered_mask(X_np, y_np)
+                others_neg |= other.negative_covered_mask(X_np, y_np)
+            pos_mask = rule.positive_covered_mask(X_np, y_np)
+            neg_mask = rule.negative_covered_mask(X_np, y_np)
+            expected = {
+                'unique_in_pos': np.count_nonzero(pos_mask & ~others_pos),
+                'unique_in_neg': np.count_nonzero(neg_mask & ~others_neg),
+                'p_unique': np.count_nonzero(pos_mask & ~others_covered),
+                'n_unique': np.count_nonzero(neg_mask & ~others_covered),
+                'all_unique': np.count_nonzero(
+                    rule.premise.covered_mask(X_np) & ~others_covered),
+            }
+            self.assertEqual(metrics_values[rule.uuid], expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,9 @@
 import json
 import os
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -11,6 +14,8 @@ from decision_rules.classification.rule import ClassificationRule
 from decision_rules.classification.ruleset import ClassificationRuleSet
 from decision_rules.conditions import CompoundCondition
 from decision_rules.conditions import NominalCondition
+from decision_rules.core.coverage import Coverage
+from decision_rules.core.coverage import CoverageTable
 from decision_rules.core.exceptions import InvalidStateError
 from decision_rules.serialization.utils import JSONSerializer
 from tests.loaders import load_resources_path
@@ -143,6 +148,32 @@ class TestClassificationRuleSet(unittest.TestCase):
                 'Prediction should be the same as y in this example'
             )
 
+    def test_find_best_rules(self):
+        X, y = self._prepare_prediction_dataset_with_numerical_labels()
+        column_names = X.columns.tolist()
+        ruleset = ClassificationRuleSet([
+            ClassificationRule(
+                premise=NominalCondition(column_index=0, value=1),
+                conclusion=ClassificationConclusion(
+                    value=0, column_name='class'),
+                column_names=column_names
+            ),
+            ClassificationRule(
+                premise=NominalCondition(column_index=1, value=1),
+                conclusion=ClassificationConclusion(
+                    value=1, column_name='class'),
+                column_names=column_names
+            ),
+        ])
+        coverage_matrix: np.ndarray = ruleset.update(
+            X, y, measure=measures.precision)
+        ruleset.set_prediction_strategy('best_rule')
+
+        strategy = ruleset._get_prediction_strategy()
+        self.assertTrue(np.array_equal(
+            strategy.find_best_rules(coverage_matrix), [-1, 0, 0, 0]
+        ))
+
     def test_on_different_columns_order(self):
         X, y = self._prepare_prediction_dataset_with_nominal_labels()
         ruleset = self._prepare_ruleset_for_predicting_nominal_labels(
@@ -184,6 +215,25 @@ class TestClassificationRuleSet(unittest.TestCase):
             'Prediction for all examples should not be empty'
         )
 
+    def test_prediction_with_long_default_conclusion(self):
+        X, _ = self._prepare_prediction_dataset_with_nominal_labels()
+        y = pd.Series(['a', 'default', 'default', 'default'])
+        ruleset = self._prepare_ruleset_for_predicting_nominal_labels(
+            column_names=X.columns.tolist()
+        )
+        # leave only the rule for class 'a', default class is longer than it
+        ruleset.rules = ruleset.rules[:1]
+        ruleset.update(X, y, measure=measures.c2)
+
+        for strategy in ruleset.prediction_strategies_choice.keys():
+            ruleset.set_prediction_strategy(strategy)
+            prediction: np.ndarray = ruleset.predict(X)
+            self.assertEqual(
+                prediction.tolist(), ['default', 'default',
+                                      'default', 'default'],
+                'Default conclusion should not be truncated'
+            )
+
     def test_set_enable_default_conclusion(self):
         X, y = self._prepare_prediction_dataset_with_nominal_labels()
         ruleset = self._prepare_ruleset_for_predicting_nominal_labels(
@@ -331,6 +381,86 @@ class TestClassificationRuleSet(unittest.TestCase):
                 'Condition importances should be the same as in RuleXAI'
             )
 
+    def test_parallel_condition_importances(self):
+        importances_path = os.path.join(load_resources_path(), "importances")
+        df = pd.read_csv(os.path.join(importances_path, "car.csv"), sep=";")
+        y = df['class']
+        X = df.drop('class', axis=1)
+        with open(os.path.join(importances_path, "car_ruleset.json"), "r") as fp:
+            ruleset: ClassificationRuleSet = JSONSerializer.deserialize(
+                json.load(fp), target_class=ClassificationRuleSet)
+        ruleset.update(X, y, measure=measures.c2)
+
+        condition_importances = ruleset.calculate_condition_importances(
+            X, y, measure=measures.c2)
+        with mock.patch(
+            'decision_rules.importances._core.conditions.ProcessPoolExecutor',
+            wraps=ProcessPoolExecutor
+        ) as executor_class:
+            parallel_condition_importances = ruleset.calculate_condition_importances(
+                X, y, measure=measures.c2, n_jobs=2)
+        self.assertEqual(condition_importances, parallel_condition_importances)
+        self.assertEqual(
+            executor_class.call_count, 1,
+            'Worker processes should be created once for all decision classes'
+        )
+
+    def test_coverage_table(self):
+        df = pd.read_csv(os.path.join(
+            load_resources_path(), 'classification', 'heart-c.csv'))
+        with open(os.path.join(
+            load_resources_path(), 'classification', 'heart_c_ruleset.json'
+        ), 'r', encoding='utf-8') as file:
+            ruleset: ClassificationRuleSet = JSONSerializer.deserialize(
+                json.load(file), ClassificationRuleSet
+            )
+        X = df.drop(columns=[ruleset.decision_attribute])
+        y = df[ruleset.decision_attribute]
+        ruleset.update(X, y, measure=measures.correlation)
+
+        table: CoverageTable = ruleset.coverage_table
+        self.assertEqual(len(table), len(ruleset.rules))
+        for i, rule in enumerate(ruleset.rules):
+            self.assertEqual(rule.coverage.as_tuple(),
+                             tuple(table.as_array()[i]))
+            self.assertEqual(
+                rule.voting_weight, measures.correlation(
+                    rule.coverage.detach()),
+                'Voting weights calculated on coverage table should be the same '
+                'as calculated rule by rule'
+            )
+        self.assertIs(ruleset.coverage_table, table)
+
+        # views write through to the table
+        ruleset.rules[0].coverage.p -= 1
+        self.assertEqual(table.p[0], ruleset.rules[0].coverage.p)
+
+        # copies are detached from the table
+        coverage_copy: Coverage = deepcopy(ruleset.rules[0].coverage)
+        self.assertIs(type(coverage_copy), Coverage)
+        self.assertEqual(coverage_copy, ruleset.rules[0].coverage)
+
+        deserialized_ruleset: ClassificationRuleSet = JSONSerializer.deserialize(
+            JSONSerializer.serialize(ruleset), ClassificationRuleSet
+        )
+        self.assertEqual(deserialized_ruleset.coverage_table, table)
+
+        # reading the table does not modify rules
+        with mock.patch.object(
+            ruleset, '_get_coverage_table_extras'
+        ) as get_extras_mock:
+            self.assertIs(ruleset.coverage_table, table)
+            get_extras_mock.assert_not_called()
+
+        # table is rebuilt when rule coverage is assigned directly
+        coverage = Coverage(p=1, n=1, P=10, N=10)
+        ruleset.rules[1].coverage = coverage
+        new_table: CoverageTable = ruleset.coverage_table
+        self.assertIsNot(new_table, table)
+        self.assertIs(ruleset.rules[1].coverage, coverage)
+        self.assertEqual(new_table.p[1], 1)
+        self.assertEqual(ruleset.coverage_table, new_table)
+
     def _condition_importances_to_DataFrame(self, condition_importances):
         importances_df = pd.DataFrame()
         for class_name in condition_importances.keys():
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from decision_rules import measures
@@ -8,6 +9,10 @@ from decision_rules.classification import ClassificationRule
 from decision_rules.classification import ClassificationRuleSet
 from decision_rules.conditions import CompoundCondition
 from decision_rules.conditions import ElementaryCondition
+from tests.loaders import load_classification_dataset
+from tests.loaders import load_classification_ruleset
+from tests.loaders import load_survival_dataset
+from tests.loaders import load_survival_ruleset
 
 
 class TestCalculateRulesetStats(unittest.TestCase):
@@ -134,3 +139,58 @@ class TestCalculateRulesetStats(unittest.TestCase):
         assert stats['rules_count'] == 2
         assert stats['total_conditions_count'] == 3
         assert stats['avg_conditions_count'] == 1.5
+
+
+class TestRuleSetClone(unittest.TestCase):
+
+    def test_clone_is_independent(self):
+        ruleset = load_classification_ruleset()
+        dataset = load_classification_dataset()
+        X, y = dataset.drop('Salary', axis=1), dataset['Salary']
+        ruleset.update(X, y, measure=measures.c2)
+        rules_before = [str(rule) for rule in ruleset.rules]
+        coverages_before = [str(rule.coverage) for rule in ruleset.rules]
+
+        cloned_ruleset = ruleset.clone()
+        self.assertEqual(ruleset, cloned_ruleset)
+        self.assertIs(ruleset.column_names, cloned_ruleset.column_names)
+        for rule, cloned_rule in zip(ruleset.rules, cloned_ruleset.rules):
+            self.assertIsNot(rule, cloned_rule)
+            self.assertIsNot(rule.premise, cloned_rule.premise)
+            self.assertEqual(rule.uuid, cloned_rule.uuid)
+            self.assertEqual(rule.coverage, cloned_rule.coverage)
+
+        cloned_ruleset.rules[0].premise.subconditions[0].negated = True
+        cloned_ruleset.rules.pop()
+        cloned_ruleset.update(X[:100], y[:100], measure=measures.c2)
+
+        self.assertEqual(rules_before, [str(rule) for rule in ruleset.rules])
+        self.assertEqual(
+            coverages_before, [str(rule.coverage) for rule in ruleset.rules]
+        )
+
+    def test_clone_shares_survival_estimators(self):
+        ruleset = load_survival_ruleset()
+        dataset = load_survival_dataset()
+        X, y = dataset.drop('survival_status',
+                            axis=1), dataset['survival_status']
+        ruleset.update(X, y)
+        probabilities_before = [
+            rule.conclusion.estimator.probabilities.copy() for rule in ruleset.rules
+        ]
+
+        cloned_ruleset = ruleset.clone()
+        for rule, cloned_rule in zip(ruleset.rules, cloned_ruleset.rules):
+            self.assertIsNot(rule.conclusion, cloned_rule.conclusion)
+            self.assertIs(rule.conclusion.estimator,
+                          cloned_rule.conclusion.estimator)
+
+        cloned_ruleset.update(X[:50], y[:50])
+        for rule, cloned_rule, probabilities in zip(
+            ruleset.rules, cloned_ruleset.rules, probabilities_before
+        ):
+            self.assertIsNot(rule.conclusion.estimator,
+                             cloned_rule.conclusion.estimator)
+            self.assertTrue(np.array_equal(
+                rule.conclusion.estimator.probabilities, probabilities
+            ))
@@ -0,0 +1,85 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import unittest
+
+import numpy as np
+
+from decision_rules.conditions import CompoundCondition
+from decision_rules.conditions import ElementaryCondition
+from decision_rules.conditions import LogicOperators
+from decision_rules.core.condition import AbstractCondition
+from decision_rules.importances._core.masks import PremiseMasksEngine
+
+
+def _negated(condition: AbstractCondition) -> AbstractCondition:
+    condition.negated = True
+    return condition
+
+
+class TestPremiseMasksEngine(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.X = rng.uniform(0, 10, size=(200, 4))
+        self.X[rng.uniform(size=self.X.shape) < 0.05] = np.nan
+        a = ElementaryCondition(0, left=3.0, left_closed=True)
+        b = ElementaryCondition(1, right=6.0, right_closed=True)
+        c = _negated(ElementaryCondition(2, left=2.0, right=5.0))
+        d = ElementaryCondition(3, left=4.0)
+        alternative = LogicOperators.ALTERNATIVE
+        self.premises: list[CompoundCondition] = [
+            CompoundCondition([a, b, c, d]),
+            CompoundCondition([a, CompoundCondition([b, c], alternative), d]),
+            CompoundCondition(
+                [a, _negated(CompoundCondition([b, a], alternative))]),
+            CompoundCondition([
+                CompoundCondition([a, b]),
+                CompoundCondition([c, d], alternative)
+            ], alternative),
+            _negated(CompoundCondition([b, c, b])),
+            CompoundCondition([a]),
+        ]
+
+    def _get_atomic_conditions(self, condition: AbstractCondition) -> list[AbstractCondition]:
+        if not condition.subconditions:
+            return [condition]
+        atomic_conditions: list[AbstractCondition] = []
+        for subcondition in condition.subconditions:
+            for atomic_condition in self._get_atomic_conditions(subcondition):
+                if atomic_condition not in atomic_conditions:
+                    atomic_conditions.append(atomic_condition)
+        return atomic_conditions
+
+    def test_masks_same_as_for_modified_premises(self):
+        engine = PremiseMasksEngine(self.X)
+        for premise in self.premises:
+            conditions = self._get_atomic_conditions(premise)
+            premise_mask, variants_masks = engine.calculate_premise_masks(
+                premise, conditions)
+            self.assertTrue(np.array_equal(
+                premise_mask.covered_mask, premise.covered_mask(self.X)))
+            self.assertTrue(np.array_equal(
+                premise_mask.raw_uncovered_mask,
+                premise._calculate_uncovered_mask(
+                    self.X)  # pylint: disable=protected-access
+            ))
+            for condition, (without_mask, only_mask) in zip(conditions, variants_masks):
+                premise_without_condition = premise.remove_condition_recursively(
+                    condition)
+                if premise_without_condition is None:
+                    self.assertIsNone(without_mask)
+                else:
+                    self.assertTrue(np.array_equal(
+                        without_mask.covered_mask,
+                        premise_without_condition.covered_mask(self.X)
+                    ))
+                    self.assertTrue(np.array_equal(
+                        without_mask.raw_covered_mask,
+                        premise_without_condition._calculate_covered_mask(  # pylint: disable=protected-access
+                            self.X)
+                    ))
+                self.assertTrue(np.array_equal(
+                    only_mask.covered_mask, condition.covered_mask(self.X)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -47,6 +47,33 @@ class BaseRulesMetricsTestCase(unittest.TestCase):
             'Calculation of covered_mask should be called only once for each rule premise'
         )
 
+    @skip_if_base_class
+    def test_calculate_using_coverage_matrix(self):
+        expected_metrics_values: dict = self.ruleset.calculate_rules_metrics(
+            self.X, self.y)
+        coverage_matrix: np.ndarray = self.ruleset.calculate_rules_coverages(
+            self.X, self.y)
+
+        covered_mask_calucation_count: int = {'count': 0}
+        _calculate_covered_mask = NominalCondition._calculate_covered_mask
+
+        def mock_calculate_covered_mask(self, X: np.ndarray) -> np.ndarray:
+            covered_mask_calucation_count['count'] += 1
+            return _calculate_covered_mask(self, X)
+        NominalCondition._calculate_covered_mask = mock_calculate_covered_mask
+        self.addCleanup(
+            setattr, NominalCondition, '_calculate_covered_mask', _calculate_covered_mask
+        )
+
+        metrics: AbstractRulesMetrics = self.get_metrics_object_instance()
+        metrics_values: dict = metrics.calculate(
+            self.X, self.y, coverage_matrix=coverage_matrix)
+        self.assertEqual(
+            covered_mask_calucation_count['count'], 0,
+            'Premises should not be evaluated when coverage matrix is given'
+        )
+        self.assertEqual(metrics_values, expected_metrics_values)
+
     @skip_if_base_class
     def test_calculate_all_metrics(self):
         metrics_values: dict = self.ruleset.calculate_rules_metrics(
@@ -0,0 +1,100 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import itertools
+import math
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from decision_rules import measures
+from decision_rules import vectorized_measures
+from decision_rules.core.coverage import Coverage
+from decision_rules.helpers import calculate_measure
+from decision_rules.helpers import get_measure_function_by_name
+
+
+class TestVectorizedMeasures(unittest.TestCase):
+
+    def setUp(self) -> None:
+        P, N = 10, 8  # pylint: disable=invalid-name
+        coverages: list[tuple[int, int, int, int]] = [
+            (p, n, P, N)
+            for p, n in itertools.product(range(P + 1), range(N + 1))
+        ]
+        self.coverages = coverages
+        self.p, self.n, self.P, self.N = np.array(coverages).T
+
+    def _get_all_measures(self) -> list[types.FunctionType]:
+        return [
+            member for member in (getattr(measures, name) for name in dir(measures))
+            if isinstance(member, types.FunctionType)
+        ]
+
+    def test_same_values_as_scalar_measures(self):
+        for measure in self._get_all_measures():
+            vectorized_measure = getattr(vectorized_measures, measure.__name__)
+            values: np.ndarray = vectorized_measure(
+                self.p, self.n, self.P, self.N)
+            self.assertEqual(values.shape, (len(self.coverages),))
+            for i, (p, n, P, N) in enumerate(self.coverages):  # pylint: disable=invalid-name
+                try:
+                    expected = measure(Coverage(p=p, n=n, P=P, N=N))
+                except (ZeroDivisionError, ValueError):
+                    self.assertFalse(
+                        math.isfinite(values[i]),
+                        f'Measure "{measure.__name__}" should be either inf or nan '
+                        f'when scalar version fails for coverage: {(p, n, P, N)}'
+                    )
+                    continue
+                self.assertAlmostEqual(
+                    values[i], expected, places=12,
+                    msg=f'Measure "{measure.__name__}" differs for coverage: {(p, n, P, N)}'
+                )
+
+    def test_broadcasting(self):
+        values: np.ndarray = vectorized_measures.precision(
+            p=[10, 0], n=[5, 0], P=20, N=30)
+        self.assertTrue(np.array_equal(values, [10 / 15, 0.0]))
+
+    def test_calculate_measure(self):
+        values: np.ndarray = calculate_measure(
+            measures.c2, self.p, self.n, self.P, self.N)
+        self.assertTrue(np.array_equal(
+            values, vectorized_measures.c2(self.p, self.n, self.P, self.N)))
+
+        def custom_measure(coverage: Coverage) -> float:
+            return coverage.p - coverage.n
+
+        self.assertTrue(np.array_equal(
+            calculate_measure(custom_measure, self.p, self.n, self.P, self.N),
+            self.p - self.n
+        ))
+
+    def test_calculate_measure_recalculates_only_not_finite_values(self):
+        measure = mock.Mock(return_value=0.75)
+        with mock.patch(
+            'decision_rules.helpers.measures.get_vectorized_measure',
+            return_value=lambda p, n, P, N: np.array([0.5, np.nan, 0.25])
+        ):
+            values: np.ndarray = calculate_measure(
+                measure, np.array([1, 0, 2]), np.array([1, 0, 0]), 2, 1)
+        self.assertTrue(np.array_equal(values, [0.5, 0.75, 0.25]))
+        measure.assert_called_once_with(Coverage(0, 0, 2, 1))
+
+    def test_get_measure_function_by_name(self):
+        self.assertIs(
+            get_measure_function_by_name('C2', vectorized=True),
+            vectorized_measures.c2
+        )
+        self.assertIs(
+            get_measure_function_by_name('WeightedLaplace', vectorized=True),
+            vectorized_measures.weighted_laplace
+        )
+        self.assertIs(get_measure_function_by_name('C2'), measures.c2)
+        with self.assertRaises(ValueError):
+            get_measure_function_by_name('_as_arrays', vectorized=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
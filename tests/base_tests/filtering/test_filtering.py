@@ -0,0 +1,216 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import time
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+
+from decision_rules.filtering import filter_ruleset
+from decision_rules.filtering import FilterAlgorithm
+from decision_rules.filtering._coverage import QUALITY_COUNTERS
+from decision_rules.filtering._helpers import calculate_ruleset_prediction_score
+from decision_rules.filtering._main import PARALLEL_FILTER_ALGORITHMS
+from decision_rules.filtering._scorers import RulesetScorer
+from decision_rules.measures import c2
+from tests.loaders import load_classification_dataset
+from tests.loaders import load_classification_ruleset
+from tests.loaders import load_regression_dataset
+from tests.loaders import load_regression_ruleset
+from tests.loaders import load_survival_dataset
+from tests.loaders import load_survival_ruleset
+
+
+class TestFilteringAlgorithms(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=UserWarning)
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        dataset = load_classification_dataset()
+        self.classification_dataset = (
+            dataset.drop("Salary", axis=1), dataset["Salary"])
+        dataset = load_regression_dataset()
+        self.regression_dataset = (
+            dataset.drop("label", axis=1), dataset["label"])
+        dataset = load_survival_dataset()
+        self.survival_dataset = (
+            dataset.drop("survival_status", axis=1), dataset["survival_status"])
+
+    def _get_score(self, ruleset, dataset):
+        coverage_matrix = ruleset.update(*dataset, c2)
+        return calculate_ruleset_prediction_score(ruleset, *dataset, coverage_matrix)
+
+    def test_greedy_forward(self):
+        for load_ruleset, dataset in [
+            (load_classification_ruleset, self.classification_dataset),
+            (load_regression_ruleset, self.regression_dataset),
+        ]:
+            ruleset = load_ruleset()
+            original_score = self._get_score(ruleset, dataset)
+            filtered_ruleset = filter_ruleset(
+                ruleset, *dataset, FilterAlgorithm.GreedyForward, 0.1, c2)
+            parallel_filtered_ruleset = filter_ruleset(
+                ruleset, *dataset, FilterAlgorithm.GreedyForward, 0.1, c2, n_jobs=4)
+
+            self.assertLessEqual(
+                len(filtered_ruleset.rules), len(ruleset.rules))
+            self.assertGreaterEqual(
+                self._get_score(filtered_ruleset, dataset),
+                original_score - 0.1 * abs(original_score)
+            )
+            self.assertEqual(
+                [rule.uuid for rule in filtered_ruleset.rules],
+                [rule.uuid for rule in parallel_filtered_ruleset.rules],
+            )
+            self.assertEqual(original_score, self._get_score(ruleset, dataset))
+
+    def test_coverage_weights_on_remaining_examples(self):
+        for load_ruleset, dataset, measure in [
+            (load_classification_ruleset, self.classification_dataset, c2),
+            (load_regression_ruleset, self.regression_dataset, c2),
+            (load_survival_ruleset, self.survival_dataset, None),
+        ]:
+            X, y = dataset
+            ruleset = load_ruleset()
+            coverage_matrix = ruleset.update(X, y, measure)
+            counter = QUALITY_COUNTERS[type(ruleset)](
+                ruleset, X, y, coverage_matrix, measure)
+            for rule_index in range(3):
+                counter.remove_examples(np.flatnonzero(
+                    coverage_matrix[:, rule_index] & counter.remaining))
+                rules_indices = np.flatnonzero(counter.covered_counts > 0)
+
+                remaining_ruleset = ruleset.clone()
+                remaining_ruleset.rules = [
+                    remaining_ruleset.rules[i] for i in rules_indices]
+                remaining_ruleset.update(
+                    X[counter.remaining], y[counter.remaining], measure)
+                np.testing.assert_allclose(
+                    counter.calculate_weights(rules_indices),
+                    [rule.voting_weight for rule in remaining_ruleset.rules]
+                )
+
+    def test_coverage(self):
+        for load_ruleset, dataset, measure in [
+            (load_classification_ruleset, self.classification_dataset, c2),
+            (load_regression_ruleset, self.regression_dataset, c2),
+            (load_survival_ruleset, self.survival_dataset, None),
+        ]:
+            ruleset = load_ruleset()
+            filtered_ruleset = filter_ruleset(
+                ruleset, *dataset, FilterAlgorithm.Coverage, None, measure)
+
+            rules_uuids = [rule.uuid for rule in ruleset.rules]
+            self.assertGreater(len(filtered_ruleset.rules), 0)
+            self.assertTrue(all(
+                rule.uuid in rules_uuids for rule in filtered_ruleset.rules))
+            # filtering does not modify the original ruleset
+            self.assertIsNot(filtered_ruleset.rules[0], ruleset.rules[0])
+
+    def test_beam(self):
+        for load_ruleset, dataset in [
+            (load_classification_ruleset, self.classification_dataset),
+            (load_regression_ruleset, self.regression_dataset),
+        ]:
+            ruleset = load_ruleset()
+            original_score = self._get_score(ruleset, dataset)
+            greedy_filtered_ruleset = filter_ruleset(
+                ruleset, *dataset, FilterAlgorithm.GreedyForward, 0.1, c2)
+            narrow_filtered_ruleset = filter_ruleset(
+                ruleset, *dataset, FilterAlgorithm.Beam, 0.1, c2, beam_width=1)
+            filtered_ruleset = filter_ruleset(
+                ruleset, *dataset, FilterAlgorithm.Beam, 0.1, c2, beam_width=3)
+            parallel_filtered_ruleset = filter_ruleset(
+                ruleset, *dataset, FilterAlgorithm.Beam, 0.1, c2,
+                beam_width=3, n_jobs=4
+            )
+
+            # beam search with a single partial ruleset is the greedy forward
+            self.assertEqual(
+                [rule.uuid for rule in greedy_filtered_ruleset.rules],
+                [rule.uuid for rule in narrow_filtered_ruleset.rules],
+            )
+            self.assertLessEqual(
+                len(filtered_ruleset.rules), len(ruleset.rules))
+            self.assertGreaterEqual(
+                self._get_score(filtered_ruleset, dataset),
+                original_score - 0.1 * abs(original_score)
+            )
+            self.assertEqual(
+                [rule.uuid for rule in filtered_ruleset.rules],
+                [rule.uuid for rule in parallel_filtered_ruleset.rules],
+            )
+
+        with self.assertRaises(ValueError):
+            filter_ruleset(
+                load_classification_ruleset(), *self.classification_dataset,
+                FilterAlgorithm.Beam, 0.1, c2, beam_width=0
+            )
+
+    def test_max_evaluations(self):
+        for algorithm in FilterAlgorithm:
+            ruleset = load_classification_ruleset()
+            progress = []
+            filtered_ruleset = filter_ruleset(
+                ruleset, *self.classification_dataset, algorithm, 0.1, c2,
+                max_evaluations=3, progress_callback=progress.append
+            )
+
+            self.assertGreater(len(progress), 0)
+            self.assertLessEqual(progress[-1]["evaluations_count"], 3)
+            self.assertLessEqual(
+                progress[-1]["rules_kept"] + progress[-1]["rules_removed"],
+                len(ruleset.rules)
+            )
+            rules_uuids = [rule.uuid for rule in ruleset.rules]
+            self.assertGreater(len(filtered_ruleset.rules), 0)
+            self.assertTrue(all(
+                rule.uuid in rules_uuids for rule in filtered_ruleset.rules))
+
+    def test_exhausted_time_budget(self):
+        for algorithm in FilterAlgorithm:
+            ruleset = load_classification_ruleset()
+            progress = []
+            filtered_ruleset = filter_ruleset(
+                ruleset, *self.classification_dataset, algorithm, 0.1, c2,
+                time_budget=1e-9, progress_callback=progress.append
+            )
+            # nothing was evaluated, so the ruleset is returned unfiltered
+            self.assertEqual(progress, [])
+            self.assertEqual(
+                sorted(rule.uuid for rule in filtered_ruleset.rules),
+                sorted(rule.uuid for rule in ruleset.rules)
+            )
+
+    def test_time_budget_exhausted_while_evaluating_candidates(self):
+        score_with = RulesetScorer.score_with
+
+        def slow_score_with(scorer, rule_index):
+            time.sleep(0.2)
+            return score_with(scorer, rule_index)
+
+        for algorithm in PARALLEL_FILTER_ALGORITHMS:
+            ruleset = load_classification_ruleset()
+            progress = []
+            with mock.patch.object(RulesetScorer, 'score_with', slow_score_with):
+                filtered_ruleset = filter_ruleset(
+                    ruleset, *self.classification_dataset, algorithm, 0.1, c2,
+                    time_budget=3.0, progress_callback=progress.append
+                )
+            # the first step is interrupted before evaluating all the rules
+            self.assertEqual(len(progress), 1)
+            self.assertLess(
+                progress[0]["evaluations_count"], len(ruleset.rules))
+            self.assertEqual(len(filtered_ruleset.rules), 1)
+
+    def test_invalid_budget(self):
+        for options in [{"time_budget": 0}, {"max_evaluations": 0}]:
+            with self.assertRaises(ValueError):
+                filter_ruleset(
+                    load_classification_ruleset(), *self.classification_dataset,
+                    FilterAlgorithm.Backward, 0.1, c2, **options
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
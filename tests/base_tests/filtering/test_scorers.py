@@ -0,0 +1,194 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from decision_rules.conditions import ElementaryCondition
+from decision_rules.filtering._helpers import calculate_ruleset_prediction_score
+from decision_rules.filtering._scorers import calculate_ruleset_score
+from decision_rules.filtering._scorers import ClassificationVotingRulesetScorer
+from decision_rules.filtering._scorers import create_ruleset_scorer
+from decision_rules.filtering._scorers import PredictionRulesetScorer
+from decision_rules.filtering._scorers import RegressionVotingRulesetScorer
+from decision_rules.filtering._scorers import SurvivalVotingRulesetScorer
+from decision_rules.measures import c2
+from decision_rules.measures import precision
+from decision_rules.survival.rule import SurvivalConclusion
+from decision_rules.survival.rule import SurvivalRule
+from decision_rules.survival.ruleset import SurvivalRuleSet
+from tests.loaders import load_classification_dataset
+from tests.loaders import load_classification_ruleset
+from tests.loaders import load_iris_dataset
+from tests.loaders import load_iris_ruleset
+from tests.loaders import load_regression_dataset
+from tests.loaders import load_regression_ruleset
+from tests.loaders import load_survival_dataset
+from tests.loaders import load_survival_ruleset
+
+
+class TestIncrementalRulesetScorers(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings("ignore", category=UserWarning)
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+
+    def _check_scorer(self, ruleset, dataset, measure, expected_scorer_class):
+        X, y = dataset
+        coverage_matrix = ruleset.update(X, y, measure)
+        scorer = create_ruleset_scorer(ruleset, X, y, coverage_matrix)
+        self.assertIsInstance(scorer, expected_scorer_class)
+        full_scorer = PredictionRulesetScorer(ruleset, X, y, coverage_matrix)
+
+        rng = np.random.default_rng(0)
+        for _ in range(60):
+            i = int(rng.integers(len(ruleset.rules)))
+            if scorer.active[i]:
+                self.assertAlmostEqual(
+                    scorer.score_without(i), full_scorer.score_without(i))
+                scorer.remove(i)
+                full_scorer.remove(i)
+            else:
+                self.assertAlmostEqual(
+                    scorer.score_with(i), full_scorer.score_with(i))
+                scorer.add(i)
+                full_scorer.add(i)
+            self.assertAlmostEqual(scorer.score(), full_scorer.score())
+        with self.assertRaises(ValueError):
+            scorer.add(int(np.flatnonzero(scorer.active)[0]))
+
+    def test_copy(self):
+        dataset = load_classification_dataset()
+        X, y = dataset.drop("Salary", axis=1), dataset["Salary"]
+        ruleset = load_classification_ruleset()
+        coverage_matrix = ruleset.update(X, y, c2)
+        scorer = create_ruleset_scorer(
+            ruleset, X, y, coverage_matrix, active=np.arange(len(ruleset.rules)) < 2)
+        score = scorer.score()
+
+        scorer_copy = scorer.copy()
+        scorer_copy.add(2)
+        scorer_copy.remove(0)
+
+        self.assertEqual(scorer.score(), score)
+        self.assertEqual(scorer.active_count, 2)
+        self.assertAlmostEqual(
+            scorer_copy.score(),
+            PredictionRulesetScorer(
+                ruleset, X, y, coverage_matrix, active=scorer_copy.active).score()
+        )
+
+    def test_classification(self):
+        dataset = load_classification_dataset()
+        self._check_scorer(
+            load_classification_ruleset(),
+            (dataset.drop("Salary", axis=1), dataset["Salary"]),
+            c2, ClassificationVotingRulesetScorer
+        )
+
+    def test_iris(self):
+        dataset = load_iris_dataset()
+        self._check_scorer(
+            load_iris_ruleset(),
+            (dataset.drop("class", axis=1), dataset["class"]),
+            precision, ClassificationVotingRulesetScorer
+        )
+
+    def test_regression(self):
+        dataset = load_regression_dataset()
+        self._check_scorer(
+            load_regression_ruleset(),
+            (dataset.drop("label", axis=1), dataset["label"]),
+            c2, RegressionVotingRulesetScorer
+        )
+
+    def test_survival(self):
+        dataset = load_survival_dataset()
+        self._check_scorer(
+            load_survival_ruleset(),
+            (dataset.drop("survival_status", axis=1),
+             dataset["survival_status"]),
+            None, SurvivalVotingRulesetScorer
+        )
+
+    def test_ruleset_score(self):
+        dataset = load_survival_dataset()
+        X, y = dataset.drop("survival_status", axis=1), dataset["survival_status"]
+        ruleset = load_survival_ruleset()
+        ruleset.rules = ruleset.rules[:2]
+        coverage_matrix = ruleset.update(X, y)
+        self.assertAlmostEqual(
+            calculate_ruleset_score(ruleset, X, y, coverage_matrix),
+            calculate_ruleset_prediction_score(ruleset, X, y, coverage_matrix)
+        )
+        # sums of survival curves are stored only for covered examples
+        scorer = create_ruleset_scorer(ruleset, X, y, coverage_matrix)
+        self.assertEqual(
+            scorer._probabilities_sums.shape[0],
+            np.count_nonzero(np.any(coverage_matrix, axis=1))
+        )
+
+    def test_survival_on_large_dataset(self):
+        rng = np.random.default_rng(0)
+        examples_count = 2000
+        y = pd.Series(
+            rng.choice(['0', '1'], size=examples_count), name='survival_status')
+        # censored examples have times different from all events times
+        X = pd.DataFrame({
+            'a': rng.uniform(size=examples_count),
+            'b': rng.uniform(size=examples_count),
+            'survival_time': (
+                rng.integers(1, 30, size=examples_count) + 0.5 * (y == '0')),
+        })
+        ruleset = SurvivalRuleSet([
+            SurvivalRule(
+                premise=ElementaryCondition(
+                    column_index=column_index, left=left, right=left + 0.5),
+                conclusion=SurvivalConclusion(
+                    value=np.nan, column_name='survival_status'),
+                column_names=X.columns.tolist(),
+                survival_time_attr='survival_time'
+            )
+            for column_index in (0, 1) for left in (0.0, 0.25, 0.5)
+        ], survival_time_attr='survival_time')
+        coverage_matrix = ruleset.update(X, y)
+        active = np.zeros(len(ruleset.rules), dtype=bool)
+        # contributions are calculated in chunks smaller than the dataset
+        with mock.patch(
+            'decision_rules.filtering._scorers._CONTRIBUTIONS_ELEMENTS_COUNT', 2 ** 12
+        ):
+            scorer = create_ruleset_scorer(
+                ruleset, X, y, coverage_matrix, active=active)
+            full_scorer = PredictionRulesetScorer(
+                ruleset, X, y, coverage_matrix, active=active)
+            self.assertIsInstance(scorer, SurvivalVotingRulesetScorer)
+            # survival curves are evaluated only at times at which they change
+            self.assertLessEqual(
+                scorer._probabilities_sums.shape[1],
+                np.unique(X['survival_time'][y == '1']).shape[0]
+            )
+            for i in (0, 3):
+                scorer_copy = scorer.copy()
+                scorer_copy.add(i)
+                full_scorer.add(i)
+                self.assertAlmostEqual(
+                    scorer_copy.score(), full_scorer.score())
+                scorer = scorer_copy
+            self.assertAlmostEqual(
+                scorer.score_without(3), full_scorer.score_without(3))
+
+    def test_best_rule_strategy_uses_full_prediction(self):
+        ruleset = load_iris_ruleset()
+        ruleset.set_prediction_strategy('best_rule')
+        dataset = load_iris_dataset()
+        self._check_scorer(
+            ruleset,
+            (dataset.drop("class", axis=1), dataset["class"]),
+            precision, PredictionRulesetScorer
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
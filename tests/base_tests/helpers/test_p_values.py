@@ -0,0 +1,55 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import unittest
+
+import numpy as np
+from scipy.stats import fisher_exact
+
+from decision_rules.helpers.p_values import correct_p_values_fdr
+from decision_rules.helpers.p_values import fisher_exact_p_values
+from decision_rules.helpers.p_values import get_significant_fraction
+
+
+class TestPValues(unittest.TestCase):
+
+    def test_fisher_exact_p_values(self):
+        rng = np.random.default_rng(0)
+        coverages: list[tuple[int, int, int, int]] = [
+            (p, n, P, N)
+            for P, N in [(10, 8), (0, 5), (5, 0), (1, 1)]
+            for p in range(P + 1)
+            for n in range(N + 1)
+        ]
+        for _ in range(200):
+            P, N = rng.integers(1, 300, size=2)  # pylint: disable=invalid-name
+            coverages.append(
+                (rng.integers(0, P + 1), rng.integers(0, N + 1), P, N))
+
+        p_values: np.ndarray = fisher_exact_p_values(*np.array(coverages).T)
+        for p_value, (p, n, P, N) in zip(p_values, coverages):  # pylint: disable=invalid-name
+            _, expected_p_value = fisher_exact([[p, n], [P - p, N - n]])
+            self.assertEqual(
+                p_value, expected_p_value,
+                f'P-value differs from scipy for coverage: {(p, n, P, N)}'
+            )
+
+    def test_correct_p_values_fdr(self):
+        p_values: list[float] = [0.04, 0.01, 0.03, 0.01, 0.5]
+        self.assertEqual(
+            correct_p_values_fdr(p_values),
+            [
+                0.04 * 5 / 4,
+                0.01 * 5 / 1,
+                0.03 * 5 / 3,
+                0.01 * 5 / 2,
+                0.5 * 5 / 5,
+            ]
+        )
+        self.assertEqual(correct_p_values_fdr([]), [])
+
+    def test_get_significant_fraction(self):
+        self.assertEqual(
+            get_significant_fraction([0.01, 0.2, 0.04, 0.06], 0.05), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
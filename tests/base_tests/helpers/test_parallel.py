@@ -0,0 +1,54 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import pickle
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from decision_rules.helpers.parallel import SharedData
+
+
+class TestSharedData(unittest.TestCase):
+
+    def _check_round_trip(self, data):
+        shared_data = SharedData(data)
+        try:
+            # unpickled object is attached to the same memory blocks
+            attached_data = pickle.loads(pickle.dumps(shared_data))
+            result = attached_data.get()
+            if isinstance(data, pd.DataFrame):
+                pd.testing.assert_frame_equal(result, data)
+            elif isinstance(data, pd.Series):
+                pd.testing.assert_series_equal(result, data)
+            else:
+                np.testing.assert_array_equal(result, data)
+            del result
+            attached_data.close()
+        finally:
+            shared_data.close()
+
+    def test_round_trip(self):
+        df = pd.DataFrame({
+            'a': [1.0, 2.0, 3.0],
+            'b': ['x', 'y', 'z'],
+            'c': pd.Categorical(['p', 'q', 'p']),
+            'd': [1, 2, 3],
+        }, index=[5, 6, 7])
+        self._check_round_trip(df)
+        self._check_round_trip(df.rename(columns={'d': 'a'}))
+        self._check_round_trip(df['a'])
+        self._check_round_trip(df['b'])
+        self._check_round_trip(np.arange(4.0))
+        self._check_round_trip(np.array(['a', None], dtype=object))
+
+    def test_numeric_values_are_not_pickled(self):
+        df = pd.DataFrame(np.zeros((10000, 5)))
+        shared_data = SharedData(df)
+        try:
+            self.assertLess(len(pickle.dumps(shared_data)), 10000)
+        finally:
+            shared_data.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
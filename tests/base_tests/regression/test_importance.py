@@ -65,6 +65,24 @@ class TestRegressionRuleSetImportanceCalculation(unittest.TestCase):
             condition_importances
         )
 
+    def test_parallel_condition_importances(self):
+        self.ruleset: RegressionRuleSet = load_ruleset(
+            "regression/boston_deeprules.json", ProblemTypes.REGRESSION
+        )
+        df = load_dataset("regression/boston.csv")
+        self.X, self.y = self.ruleset.split_dataset(df)
+        condition_importances = self.ruleset.calculate_condition_importances(
+            self.X, self.y, measure=measures.c2
+        )
+        parallel_condition_importances = self.ruleset.calculate_condition_importances(
+            self.X, self.y, measure=measures.c2, n_jobs=4
+        )
+        self.assertEqual(condition_importances, parallel_condition_importances)
+        with self.assertRaises(ValueError):
+            self.ruleset.calculate_condition_importances(
+                self.X, self.y, measure=measures.c2, n_jobs=0
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
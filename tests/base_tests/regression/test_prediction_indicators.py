@@ -9,6 +9,8 @@ from decision_rules.regression import RegressionConclusion
 from decision_rules.regression import RegressionRuleSet
 from decision_rules.regression.prediction_indicators import \
     calculate_for_regression
+from decision_rules.regression.prediction_indicators import \
+    RegressionPredictionIndicatorsAccumulator
 from tests.loaders import load_regression_dataset
 from tests.loaders import load_regression_ruleset
 
@@ -47,3 +49,61 @@ class TestRegressionPredictionIndicators(unittest.TestCase):
             43.0,
             indicators_on_covered_example['general']['MAE'],
         )
+
+    def test_accumulator(self):
+        y_pred: np.ndarray = self.ruleset.predict(self.X)
+        y_true: np.ndarray = self.y.to_numpy()
+        expected_indicators: dict = calculate_for_regression(y_true, y_pred)
+        accumulators: list[RegressionPredictionIndicatorsAccumulator] = [
+            RegressionPredictionIndicatorsAccumulator(
+                keep_errors=True
+            ).update(y_true[i:i + 50], y_pred[i:i + 50])
+            for i in range(0, len(y_true), 50)
+        ]
+        indicators: dict = sum(accumulators[1:], accumulators[0]).finalize()
+        self.assertEqual(
+            indicators['histogram'], expected_indicators['histogram'])
+        for key, value in expected_indicators['general'].items():
+            self.assertAlmostEqual(indicators['general'][key], value, places=8)
+
+        bin_edges: list[float] = expected_indicators['histogram']['bin_edges']
+        accumulator = RegressionPredictionIndicatorsAccumulator(
+            bin_edges=bin_edges)
+        for i in range(0, len(y_true), 50):
+            accumulator.update(y_true[i:i + 50], y_pred[i:i + 50])
+        self.assertEqual(
+            accumulator.finalize()['histogram'], expected_indicators['histogram'])
+
+    def test_accumulator_streaming_histogram(self):
+        y_pred: np.ndarray = self.ruleset.predict(self.X)
+        y_true: np.ndarray = self.y.to_numpy()
+        errors: np.ndarray = y_pred - y_true
+        expected_indicators: dict = calculate_for_regression(y_true, y_pred)
+        accumulators: list[RegressionPredictionIndicatorsAccumulator] = [
+            RegressionPredictionIndicatorsAccumulator(bins_count=16).update(
+                y_true[i:i + 50], y_pred[i:i + 50]
+            )
+            for i in range(0, len(y_true), 50)
+        ]
+        indicators: dict = sum(accumulators[1:], accumulators[0]).finalize()
+        for key, value in expected_indicators['general'].items():
+            self.assertAlmostEqual(indicators['general'][key], value, places=8)
+
+        bin_edges: np.ndarray = np.array(indicators['histogram']['bin_edges'])
+        histogram: list[int] = indicators['histogram']['histogram']
+        self.assertLessEqual(len(histogram), 16)
+        self.assertEqual(sum(histogram), len(errors))
+        self.assertLessEqual(bin_edges[0], np.min(errors))
+        self.assertGreater(bin_edges[-1], np.max(errors))
+        self.assertEqual(
+            histogram,
+            np.histogram(errors, bins=bin_edges)[0].tolist()
+        )
+        self.assertIsNone(accumulators[0].errors)
+
+        with self.assertRaises(ValueError):
+            RegressionPredictionIndicatorsAccumulator(
+                bin_edges=bin_edges, keep_errors=True)
+        with self.assertRaises(ValueError):
+            accumulators[0] + RegressionPredictionIndicatorsAccumulator(
+                keep_errors=True)
@@ -142,6 +142,29 @@ class TestClassificationRuleSetSerializer(unittest.TestCase):
             "Serializing and deserializing should lead to the the same object",
         )
 
+    def test_coverage_table_after_deserializing(self):
+        ruleset: ClassificationRuleSet = self._prepare_ruleset()
+        X, y = self._prepare_dataset()
+        ruleset.update(X, y, measure=measures.accuracy)
+
+        deserialized_ruleset: ClassificationRuleSet = JSONSerializer.deserialize(
+            JSONSerializer.serialize(ruleset), ClassificationRuleSet
+        )
+        self.assertEqual(
+            deserialized_ruleset._get_bound_coverage_table(),
+            ruleset._get_bound_coverage_table()
+        )
+
+        serialized_ruleset: dict = JSONSerializer.serialize(ruleset)
+        serialized_ruleset['rules'][1]['coverage'] = None
+        deserialized_ruleset = JSONSerializer.deserialize(
+            serialized_ruleset, ClassificationRuleSet
+        )
+        self.assertIsNone(deserialized_ruleset._get_bound_coverage_table())
+        self.assertEqual(
+            deserialized_ruleset.rules[0].coverage, ruleset.rules[0].coverage)
+        self.assertIsNone(deserialized_ruleset.rules[1].coverage)
+
     def test_prediction_after_deserializing_without_update(self):
         ruleset: ClassificationRuleSet = self._prepare_ruleset()
         X, y = self._prepare_dataset()
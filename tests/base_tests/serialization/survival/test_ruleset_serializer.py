@@ -117,6 +117,21 @@ class TestSurvivalRuleSetSerializer(unittest.TestCase):
             "Serializing and deserializing should lead to the the same object",
         )
 
+    def test_serializing_time_grid(self):
+        ruleset: SurvivalRuleSet = self._prepare_ruleset()
+        serialized_ruleset = JSONSerializer.serialize(ruleset)
+        self.assertIsNone(JSONSerializer.deserialize(
+            serialized_ruleset, SurvivalRuleSet
+        ).time_grid)
+
+        ruleset.update(*self._prepare_dataset(), time_grid=[1.0, 3.0])
+        serialized_ruleset = JSONSerializer.serialize(ruleset)
+        deserializer_ruleset: SurvivalRuleSet = JSONSerializer.deserialize(
+            serialized_ruleset, SurvivalRuleSet
+        )
+        self.assertEqual(
+            deserializer_ruleset.time_grid.tolist(), [1.0, 3.0, 4.0])
+
     def test_prediction_after_deserializing_without_update(self):
         ruleset: SurvivalRuleSet = self._prepare_ruleset()
         ruleset.update(*self._prepare_dataset())
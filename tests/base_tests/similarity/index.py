@@ -0,0 +1,67 @@
+from unittest import mock
+
+import numpy as np
+
+from decision_rules.similarity import RuleSimilarityIndex
+from decision_rules.similarity.semantic import calculate_semantic_similarity_matrix
+from decision_rules.similarity.semantic import SimilarityMeasure
+from tests.base_tests.similarity.base import BaseSimilarityTest
+
+
+class RuleSimilarityIndexTest(BaseSimilarityTest):
+    def setUp(self):
+        super().setUp()
+        self.index = RuleSimilarityIndex(
+            self.ruleset1, self.dataset, random_state=0)
+        self.similarity_matrix = calculate_semantic_similarity_matrix(
+            SimilarityMeasure.JACCARD, self.ruleset1, self.ruleset1, self.dataset)
+
+    def test_query(self):
+        for rule_index, rule in enumerate(self.ruleset1.rules[:10]):
+            result = self.index.query(rule, k=5)
+            self.assertEqual(len(result), 5)
+            self.assertEqual(result[0], (rule_index, 1.0))
+            for other_index, similarity in result:
+                self.assertAlmostEqual(
+                    similarity, self.similarity_matrix[rule_index, other_index])
+            similarities = [similarity for _, similarity in result]
+            self.assertEqual(similarities, sorted(similarities, reverse=True))
+
+    def test_query_index(self):
+        result = self.index.query_index(0, k=5)
+        expected_similarities = np.sort(
+            self.similarity_matrix[0, 1:])[::-1][:5]
+        self.assertNotIn(0, [rule_index for rule_index, _ in result])
+        np.testing.assert_allclose(
+            [similarity for _, similarity in result], expected_similarities)
+
+    def test_find_near_duplicates(self):
+        result = self.index.find_near_duplicates(0.8)
+        first, second = np.nonzero(np.triu(self.similarity_matrix >= 0.8, k=1))
+        self.assertEqual(
+            sorted((i, j) for i, j, _ in result),
+            sorted(zip(first.tolist(), second.tolist()))
+        )
+        for i, j, similarity in result:
+            self.assertAlmostEqual(similarity, self.similarity_matrix[i, j])
+
+    def test_chunked_signatures(self):
+        # signatures calculated for single rules and few hash functions at once
+        with mock.patch(
+            'decision_rules.similarity.index._SIGNATURES_ELEMENTS_COUNT', 1
+        ):
+            index = RuleSimilarityIndex(
+                self.ruleset1, self.dataset, random_state=0)
+        for (keys, rules), (expected_keys, expected_rules) in zip(
+                index._bands, self.index._bands):
+            np.testing.assert_array_equal(keys, expected_keys)
+            np.testing.assert_array_equal(rules, expected_rules)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            RuleSimilarityIndex(
+                self.ruleset1, self.dataset, signature_size=100, bands_count=32)
+        with self.assertRaises(ValueError):
+            self.index.find_near_duplicates(0)
+        with self.assertRaises(ValueError):
+            self.index.query_index(0, k=0)
@@ -1,3 +1,7 @@
+from unittest import mock
+
+import numpy as np
+
 from decision_rules.similarity import calculate_ruleset_similarity
 from tests.base_tests.similarity.base import BaseSimilarityTest
 
@@ -7,3 +11,32 @@ class WholeRulesetSimilarityTest(BaseSimilarityTest):
         similarity = calculate_ruleset_similarity(
             self.ruleset1, self.ruleset2, self.dataset)
         self.assertEqual(similarity, 1.0)
+
+    def test_different_rulesets_similarity(self):
+        self.ruleset2.rules = self.ruleset2.rules[::3]
+        dataset = self.dataset.iloc[:500]
+        # pairs of examples covered by at least one common rule
+        matrix1 = self.ruleset1.calculate_coverage_matrix(dataset).astype(int)
+        matrix2 = self.ruleset2.calculate_coverage_matrix(dataset).astype(int)
+        common1 = (matrix1 @ matrix1.T) > 0
+        common2 = (matrix2 @ matrix2.T) > 0
+        lower_triangle_mask = np.tril(np.ones(common1.shape, dtype=bool), k=-1)
+        expected_similarity = (
+            np.sum((common1 == common2) & lower_triangle_mask) /
+            np.sum(lower_triangle_mask)
+        )
+
+        # small chunks make sure pairs of signatures are counted correctly
+        with mock.patch(
+            "decision_rules.similarity.ruleset._SIGNATURES_CHUNK_SIZE", 3
+        ):
+            similarity = calculate_ruleset_similarity(
+                self.ruleset1, self.ruleset2, dataset)
+        self.assertAlmostEqual(similarity, expected_similarity)
+
+        estimated_similarity = calculate_ruleset_similarity(
+            self.ruleset1, self.ruleset2, dataset,
+            sample_size=100000, random_state=0
+        )
+        self.assertAlmostEqual(estimated_similarity,
+                               expected_similarity, delta=0.01)
@@ -1,8 +1,11 @@
+from unittest import mock
+
 import numpy as np
 
 from decision_rules.similarity import calculate_rule_similarity
 from decision_rules.similarity import SimilarityMeasure
 from decision_rules.similarity import SimilarityType
+from decision_rules.similarity.semantic import _calculate_contingency_matrices
 from tests.base_tests.similarity.base import BaseSimilarityTest
 
 
@@ -15,3 +18,22 @@ class SemanticRulesetSimilarityTest(BaseSimilarityTest):
         expected_diagonal = np.ones(number_of_rules)
         self.assertTrue(np.allclose(
             similarity_matrix.diagonal(), expected_diagonal, atol=1e-8))
+
+    def test_contingency_matrices(self):
+        matrix1 = self.ruleset1.calculate_coverage_matrix(self.dataset).T
+        matrix2 = self.ruleset2.calculate_coverage_matrix(self.dataset).T[::-1]
+        expected = (
+            matrix1[:, None, :] & matrix2[None, :, :],
+            matrix1[:, None, :] & ~matrix2[None, :, :],
+            ~matrix1[:, None, :] & matrix2[None, :, :],
+            ~matrix1[:, None, :] & ~matrix2[None, :, :],
+        )
+        # small chunks make sure partial counts are summed correctly
+        with mock.patch(
+            "decision_rules.similarity.semantic._EXAMPLES_CHUNK_SIZE", 7
+        ):
+            contingency_matrices = _calculate_contingency_matrices(
+                matrix1, matrix2)
+        for matrix, expected_matrix in zip(contingency_matrices, expected):
+            self.assertTrue(np.array_equal(
+                matrix, expected_matrix.sum(axis=2)))
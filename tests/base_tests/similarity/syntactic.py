@@ -1,7 +1,10 @@
+from unittest import mock
+
 import numpy as np
 
 from decision_rules.similarity import calculate_rule_similarity
 from decision_rules.similarity import SimilarityType
+from decision_rules.similarity.syntactic import SyntacticRuleSimilarityCalculator
 from tests.base_tests.similarity.base import BaseSimilarityTest
 
 
@@ -14,3 +17,33 @@ class SyntacticRulesetSimilarityTest(BaseSimilarityTest):
         expected_diagonal = np.ones(number_of_rules)
         self.assertTrue(np.allclose(
             similarity_matrix.diagonal(), expected_diagonal, atol=1e-8))
+
+    def test_syntactic_similarity_in_blocks(self):
+        self.ruleset2.rules = self.ruleset2.rules[::-2]
+        calculator = SyntacticRuleSimilarityCalculator(
+            self.ruleset1, self.ruleset2, self.dataset)
+        expected = np.empty(
+            (len(calculator.ruleset1), len(calculator.ruleset2)))
+        for i, rule1 in enumerate(calculator.ruleset1):
+            for j, rule2 in enumerate(calculator.ruleset2):
+                sim_sum = 0.0
+                for key in set(rule1["elementary"]) & set(rule2["elementary"]):
+                    (left1, right1), (left2, right2) = (
+                        rule1["elementary"][key], rule2["elementary"][key])
+                    overlap = max(0.0, min(right1, right2) - max(left1, left2))
+                    sim_sum += overlap / (right1 - left1) + \
+                        overlap / (right2 - left2)
+                for key in set(rule1["nominal"]) & set(rule2["nominal"]):
+                    values1, values2 = set(rule1["nominal"][key]), set(
+                        rule2["nominal"][key])
+                    overlap = len(values1 & values2)
+                    sim_sum += overlap / len(values1) + overlap / len(values2)
+                expected[i, j] = sim_sum / (
+                    len(rule1["elementary"]) + len(rule2["elementary"]) +
+                    len(rule1["nominal"]) + len(rule2["nominal"]))
+
+        with mock.patch(
+            "decision_rules.similarity.syntactic._BLOCK_ELEMENTS_COUNT", 7
+        ):
+            similarity_matrix = calculator.calculate()
+        np.testing.assert_allclose(similarity_matrix, expected)
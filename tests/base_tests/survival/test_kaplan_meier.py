@@ -1,6 +1,8 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import copy
 import json
 import os
+import pickle
 import unittest
 
 import numpy as np
@@ -83,6 +85,98 @@ class TestKaplanMeierRuleSet(unittest.TestCase):
             'Kaplan Meier should be the same as in rulekit'
         )
 
+    def test_median_survival_time_ci(self):
+        df = pd.read_csv(os.path.join(
+            load_resources_path(), 'survival', 'waltons.csv'
+        ))
+        survival_time = df['T'].to_numpy()
+        survival_status = df['E'].astype(str).to_numpy()
+
+        estimator = KaplanMeierEstimator().fit(survival_time, survival_status)
+        interval = estimator.interval
+
+        self.assertEqual(
+            list(interval.columns), ["prob_lower_0.95", "prob_upper_0.95"])
+        self.assertTrue(np.array_equal(interval.index, estimator.times))
+        # median confidence interval is a median of the survival function bounds
+        for column, bound in [
+            ("prob_lower_0.95", estimator.median_survival_time_ci_lower),
+            ("prob_upper_0.95", estimator.median_survival_time_ci_upper),
+        ]:
+            below_median = interval[column].to_numpy() <= 0.5
+            if below_median.any():
+                self.assertEqual(bound, interval.index[below_median.argmax()])
+            else:
+                self.assertEqual(bound, np.inf)
+            self.assertEqual(
+                estimator.median_survival_time_cli.iloc[0][column], bound)
+
+    def test_compact_representation(self):
+        df = pd.read_csv(os.path.join(
+            load_resources_path(), 'survival', 'waltons.csv'
+        ))
+        estimator = KaplanMeierEstimator().fit(
+            df['T'].to_numpy(), df['E'].astype(str).to_numpy())
+
+        self.assertFalse(hasattr(estimator, '__dict__'))
+        self.assertEqual(estimator._data.dtype, KaplanMeierEstimator.DTYPE)
+        for values in (
+            estimator.times, estimator.events_counts, estimator.censored_counts,
+            estimator.at_risk_counts, estimator.probabilities,
+        ):
+            self.assertTrue(np.shares_memory(values, estimator._data))
+
+        for estimator_copy in (
+            copy.copy(estimator),
+            pickle.loads(pickle.dumps(estimator)),
+            KaplanMeierEstimator().update(
+                estimator.get_dict(), update_additional_indicators=True),
+            KaplanMeierEstimator(estimator.surv_info),
+        ):
+            self.assertEqual(estimator_copy.get_dict(), estimator.get_dict())
+            self.assertEqual(
+                estimator_copy.median_survival_time_ci_lower,
+                estimator.median_survival_time_ci_lower
+            )
+
+    def test_deprecated_methods(self):
+        df = pd.read_csv(os.path.join(
+            load_resources_path(), 'survival', 'waltons.csv'
+        ))
+        estimator = KaplanMeierEstimator().fit(
+            df['T'].to_numpy(), df['E'].astype(str).to_numpy())
+        survival_function = pd.DataFrame(
+            {'KM_estimate': estimator.probabilities}, index=estimator.times)
+
+        with self.assertWarns(DeprecationWarning):
+            median, median_cli = estimator.calcualte_indicators()
+        self.assertEqual(median, estimator.median_survival_time)
+        self.assertTrue(median_cli.equals(estimator.median_survival_time_cli))
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(
+                estimator.calculate_median_survival_time(survival_function),
+                estimator.median_survival_time
+            )
+        with self.assertWarns(DeprecationWarning):
+            self.assertTrue(estimator.qth_survival_times(
+                0.5, estimator.interval).equals(estimator.median_survival_time_cli))
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(
+                estimator.qth_survival_time(0.5, survival_function),
+                estimator.median_survival_time
+            )
+        with self.assertWarns(DeprecationWarning):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                tmp = estimator.events_counts / (
+                    estimator.at_risk_counts *
+                    (estimator.at_risk_counts - estimator.events_counts)
+                )
+            bounds = estimator.calculate_bounds(
+                estimator.times, estimator.probabilities,
+                np.cumsum(np.nan_to_num(tmp, posinf=0, neginf=0))
+            )
+        self.assertTrue(bounds.equals(estimator.interval))
+
 
 if __name__ == '__main__':
     unittest.main()
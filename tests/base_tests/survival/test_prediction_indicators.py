@@ -7,6 +7,8 @@ import pandas as pd
 from decision_rules.survival import SurvivalRuleSet
 from decision_rules.survival.prediction_indicators import \
     calculate_for_survival
+from decision_rules.survival.prediction_indicators import \
+    SurvivalPredictionIndicatorsAccumulator
 from tests.loaders import load_survival_dataset
 from tests.loaders import load_survival_ruleset
 
@@ -47,3 +49,30 @@ class TestSurvivalPredictionIndicators(unittest.TestCase):
             indicators_on_covered_example['general']['ibs'],
             indicators_on_full_dataset['general']['ibs'],
         )
+
+    def test_accumulator(self):
+        y_pred: np.ndarray = self.ruleset.predict(self.X)
+        expected_ibs: float = calculate_for_survival(
+            self.ruleset, self.X, self.y, y_pred
+        )['general']['ibs']
+        times: np.ndarray = np.unique(
+            self.X[self.ruleset.survival_time_attr_name])
+        accumulators: list[SurvivalPredictionIndicatorsAccumulator] = [
+            SurvivalPredictionIndicatorsAccumulator(self.ruleset, times=times).update(
+                self.X.iloc[i:i + 20], self.y.iloc[i:i + 20], y_pred[i:i + 20]
+            )
+            for i in range(0, self.X.shape[0], 20)
+        ]
+        indicators: dict = sum(accumulators[1:], accumulators[0]).finalize()
+        self.assertAlmostEqual(
+            indicators['general']['ibs'], expected_ibs, places=10)
+        self.assertEqual(
+            indicators['general']['Covered_by_prediction'], self.X.shape[0])
+
+        matrix_prediction: dict = self.ruleset.predict_survival_matrix(
+            self.X, times=times)
+        indicators = SurvivalPredictionIndicatorsAccumulator(
+            self.ruleset, times=times
+        ).update(self.X, self.y, matrix_prediction).finalize()
+        self.assertAlmostEqual(
+            indicators['general']['ibs'], expected_ibs, places=10)
@@ -6,7 +6,9 @@ import unittest
 import numpy as np
 import pandas as pd
 
+from decision_rules.core.prediction import PredictionStrategy
 from decision_rules.serialization.utils import JSONSerializer
+from decision_rules.survival.prediction import SurvivalPrediction
 from decision_rules.survival.ruleset import SurvivalRuleSet
 from tests.helpers import compare_survival_prediction
 from tests.loaders import load_resources_path
@@ -79,6 +81,83 @@ class TestSurvivalRuleSet(unittest.TestCase):
             "Prediction should be the same as rulekit prediction",
         )
 
+    def test_matrix_prediction(self):
+        coverage_matrix: np.ndarray = self.ruleset.update(self.X, self.y)
+        prediction = self.ruleset.predict(self.X)
+        matrix_prediction = self.ruleset.predict_survival_matrix(self.X)
+
+        times: np.ndarray = matrix_prediction["times"]
+        self.assertTrue(
+            np.array_equal(
+                times, np.unique(self.X["survival_time"].to_numpy())),
+            "Training survival times should be used as a default time grid",
+        )
+        self.assertEqual(
+            matrix_prediction["probabilities"].shape,
+            (self.X.shape[0], times.shape[0]),
+        )
+        for i, example_prediction in enumerate(prediction):
+            km = SurvivalPrediction.to_kaplan_meier(example_prediction)
+            self.assertTrue(np.allclose(
+                matrix_prediction["probabilities"][i],
+                km.get_probabilities_at(times),
+                atol=1.0e-10,
+            ))
+            self.assertEqual(
+                matrix_prediction["median_survival_times"][i],
+                example_prediction["median_survival_time"],
+            )
+
+        user_times = np.array([5.0, 10.0, 20.0])
+        matrix_prediction = self.ruleset.predict_survival_matrix_using_coverage_matrix(
+            coverage_matrix, times=user_times, dtype=np.float32
+        )
+        self.assertEqual(matrix_prediction["probabilities"].dtype, np.float32)
+        self.assertEqual(
+            matrix_prediction["probabilities"].shape, (self.X.shape[0], 3)
+        )
+
+        self.ruleset.rules = self.ruleset.rules[1:2]
+        self.ruleset.update(self.X, self.y)
+        self.ruleset.set_default_conclusion_enabled(False)
+        matrix_prediction = self.ruleset.predict_survival_matrix(self.X)
+        uncovered_mask = np.isnan(matrix_prediction["median_survival_times"])
+        self.assertTrue(uncovered_mask.any())
+        self.assertTrue(
+            np.isnan(matrix_prediction["probabilities"][uncovered_mask]).all()
+        )
+
+    def test_point_query_prediction(self):
+        self.ruleset.update(self.X, self.y)
+        prediction = self.ruleset.predict(self.X)
+
+        times = np.array([20.0, 1.0, 7.5])
+        probabilities = self.ruleset.predict_survival_at(self.X, times)
+        self.assertEqual(probabilities.shape, (self.X.shape[0], 3))
+        for i, example_prediction in enumerate(prediction):
+            km = SurvivalPrediction.to_kaplan_meier(example_prediction)
+            self.assertTrue(np.allclose(
+                probabilities[i], km.get_probabilities_at(times), atol=1.0e-10
+            ))
+
+        median_survival_times = self.ruleset.predict_median(self.X)
+        self.assertTrue(np.array_equal(
+            median_survival_times,
+            np.array([e["median_survival_time"] for e in prediction],
+                     dtype=float),
+        ))
+
+        self.ruleset.set_default_conclusion_enabled(False)
+        self.ruleset.rules = self.ruleset.rules[1:2]
+        median_survival_times = self.ruleset.predict_median(self.X)
+        prediction = self.ruleset.predict(self.X)
+        for example_prediction, median in zip(prediction, median_survival_times):
+            if example_prediction is None:
+                self.assertTrue(np.isnan(median))
+            else:
+                self.assertEqual(
+                    median, example_prediction["median_survival_time"])
+
     def test_different_prediction_strategies(self):
         coverage_matrix: np.ndarray = self.ruleset.update(self.X, self.y)
 
@@ -92,6 +171,44 @@ class TestSurvivalRuleSet(unittest.TestCase):
                 compare_survival_prediction(prediction, prediction_cov_matrix)
             )
 
+    def test_matrix_prediction_strategies(self):
+        self.ruleset.update(self.X, self.y)
+        times = np.array([20.0, 1.0, 7.5])
+
+        for strategy in self.ruleset.prediction_strategies_choice.keys():
+            self.ruleset.set_prediction_strategy(strategy)
+            prediction = self.ruleset.predict(self.X)
+            matrix_prediction = self.ruleset.predict_survival_matrix(self.X)
+            probabilities = self.ruleset.predict_survival_at(self.X, times)
+            median_survival_times = self.ruleset.predict_median(self.X)
+            for i, example_prediction in enumerate(prediction):
+                km = SurvivalPrediction.to_kaplan_meier(example_prediction)
+                self.assertTrue(np.allclose(
+                    matrix_prediction["probabilities"][i],
+                    km.get_probabilities_at(matrix_prediction["times"]),
+                    atol=1.0e-10,
+                ))
+                self.assertTrue(np.allclose(
+                    probabilities[i], km.get_probabilities_at(times), atol=1.0e-10
+                ))
+                self.assertEqual(
+                    median_survival_times[i],
+                    example_prediction["median_survival_time"],
+                )
+
+        class CustomPredictionStrategy(PredictionStrategy):
+
+            def _perform_prediction(self, voting_matrix: np.ndarray) -> np.ndarray:
+                return np.empty(shape=(voting_matrix.shape[0],), dtype=object)
+
+        self.ruleset.set_prediction_strategy(CustomPredictionStrategy)
+        with self.assertRaises(ValueError):
+            self.ruleset.predict_survival_matrix(self.X)
+        with self.assertRaises(ValueError):
+            self.ruleset.predict_survival_at(self.X, times)
+        with self.assertRaises(ValueError):
+            self.ruleset.predict_median(self.X)
+
     def test_condition_importances(self):
         self.ruleset.update(self.X, self.y)
 
@@ -133,6 +250,16 @@ class TestSurvivalRuleSet(unittest.TestCase):
                 "Attribute importances should be the same as saved before",
             )
 
+    def test_parallel_condition_importances(self):
+        self.ruleset.update(self.X, self.y)
+        condition_importances = self.ruleset.calculate_condition_importances(
+            self.X, self.y
+        )
+        parallel_condition_importances = self.ruleset.calculate_condition_importances(
+            self.X, self.y, n_jobs=2
+        )
+        self.assertEqual(condition_importances, parallel_condition_importances)
+
     def test_local_explainability(self):
         self.ruleset.update(self.X, self.y)
 
@@ -166,6 +293,71 @@ class TestSurvivalRuleSet(unittest.TestCase):
         ):
             self.ruleset.update(self.X, self.y)
 
+    def test_encoded_survival_status(self):
+        self.ruleset.update(self.X, self.y)
+        expected_coverage_dict = self.ruleset.coverage_dict
+        expected_ibs = self.ruleset.integrated_bier_score(self.X, self.y)
+
+        y_encoded = self.y == "1"
+        self.ruleset.update(self.X, y_encoded)
+        self.assertEqual(self.ruleset.coverage_dict, expected_coverage_dict)
+        self.assertEqual(
+            self.ruleset.integrated_bier_score(self.X, y_encoded), expected_ibs
+        )
+
+    def test_update_with_time_grid(self):
+        self.ruleset.update(self.X, self.y)
+        exact_coverage_dict = self.ruleset.coverage_dict
+        exact_estimators = [
+            rule.conclusion.estimator for rule in self.ruleset.rules]
+
+        # grid containing all training times gives exact estimators
+        self.ruleset.update(
+            self.X, self.y, time_grid=self.X["survival_time"].unique()
+        )
+        self.assertEqual(self.ruleset.coverage_dict, exact_coverage_dict)
+
+        self.ruleset.update(self.X, self.y, time_grid=10)
+        self.assertLessEqual(len(self.ruleset.time_grid), 10)
+        self.assertEqual(
+            self.ruleset.time_grid[-1], self.X["survival_time"].max()
+        )
+        for rule, exact_estimator in zip(self.ruleset.rules, exact_estimators):
+            estimator = rule.conclusion.estimator
+            self.assertLessEqual(len(estimator.times), 10)
+            self.assertTrue(
+                np.isin(estimator.times, self.ruleset.time_grid).all())
+            self.assertTrue(np.allclose(
+                estimator.get_probabilities_at(self.ruleset.time_grid),
+                exact_estimator.get_probabilities_at(self.ruleset.time_grid),
+                atol=0.05,
+            ))
+        self.assertTrue(np.isfinite(
+            self.ruleset.integrated_bier_score(self.X, self.y)))
+
+        with self.assertRaises(ValueError):
+            self.ruleset.update(self.X, self.y, time_grid=0)
+
+    def test_update_keeps_time_grid(self):
+        self.ruleset.update(self.X, self.y)
+        exact_coverage_dict = self.ruleset.coverage_dict
+        self.ruleset.update(self.X, self.y, time_grid=10)
+        time_grid = self.ruleset.time_grid.copy()
+        grid_coverage_dict = self.ruleset.coverage_dict
+
+        # later updates without the time grid reuse the stored one
+        self.ruleset.update(self.X, self.y)
+        self.assertTrue(np.array_equal(self.ruleset.time_grid, time_grid))
+        self.assertEqual(self.ruleset.coverage_dict, grid_coverage_dict)
+        for rule in self.ruleset.rules:
+            self.assertTrue(np.isin(
+                rule.conclusion.estimator.times, time_grid).all())
+
+        self.ruleset.time_grid = None
+        self.ruleset.update(self.X, self.y)
+        self.assertIsNone(self.ruleset.time_grid)
+        self.assertEqual(self.ruleset.coverage_dict, exact_coverage_dict)
+
     def test_prediction_with_empty_default_conclusion(self):
         # remove one rule to leave some example uncovered
         self.ruleset.rules = self.ruleset.rules[1:2]